@@ -33,6 +33,7 @@ from app.crud.channel_integration import (
 from app.crud.tenant import (
     create_tenant,
     delete_tenant,
+    get_cached_tenant_by_api_key,
     get_tenant_by_api_key,
     get_tenant_by_id,
     list_tenants,
@@ -80,7 +81,7 @@ async def add_rule(
     payload: ScriptedResponseCreateRequest,
     session: AsyncSession = Depends(get_db_session),
 ) -> ScriptedResponseCreateResponse:
-    tenant = await get_tenant_by_api_key(
+    tenant = await get_cached_tenant_by_api_key(
         session=session, api_key=payload.tenant_api_key
     )
     if tenant is None:
@@ -111,7 +112,7 @@ async def update_rule(
     payload: ScriptedResponseUpdateRequest,
     session: AsyncSession = Depends(get_db_session),
 ) -> ScriptedResponseCreateResponse:
-    tenant = await get_tenant_by_api_key(
+    tenant = await get_cached_tenant_by_api_key(
         session=session, api_key=payload.tenant_api_key
     )
     if tenant is None:
@@ -154,7 +155,7 @@ async def delete_rule(
     tenant_api_key: str,
     session: AsyncSession = Depends(get_db_session),
 ) -> Response:
-    tenant = await get_tenant_by_api_key(session=session, api_key=tenant_api_key)
+    tenant = await get_cached_tenant_by_api_key(session=session, api_key=tenant_api_key)
     if tenant is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid tenant_api_key"
@@ -177,7 +178,7 @@ async def list_quick_replies(
     tenant_api_key: str,
     session: AsyncSession = Depends(get_db_session),
 ) -> list[QuickReplyOut]:
-    tenant = await get_tenant_by_api_key(session=session, api_key=tenant_api_key)
+    tenant = await get_cached_tenant_by_api_key(session=session, api_key=tenant_api_key)
     if tenant is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid tenant_api_key"
@@ -202,7 +203,7 @@ async def add_quick_reply(
     payload: QuickReplyCreateRequest,
     session: AsyncSession = Depends(get_db_session),
 ) -> QuickReplyOut:
-    tenant = await get_tenant_by_api_key(
+    tenant = await get_cached_tenant_by_api_key(
         session=session, api_key=payload.tenant_api_key
     )
     if tenant is None:
@@ -234,7 +235,7 @@ async def update_quick_reply_item(
     payload: QuickReplyUpdateRequest,
     session: AsyncSession = Depends(get_db_session),
 ) -> QuickReplyOut:
-    tenant = await get_tenant_by_api_key(
+    tenant = await get_cached_tenant_by_api_key(
         session=session, api_key=payload.tenant_api_key
     )
     if tenant is None:
@@ -275,7 +276,7 @@ async def delete_quick_reply_item(
     tenant_api_key: str,
     session: AsyncSession = Depends(get_db_session),
 ) -> Response:
-    tenant = await get_tenant_by_api_key(session=session, api_key=tenant_api_key)
+    tenant = await get_cached_tenant_by_api_key(session=session, api_key=tenant_api_key)
     if tenant is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid tenant_api_key"
@@ -293,15 +294,16 @@ async def delete_quick_reply_item(
 @router.get("/leads", response_model=list[LeadOut])
 async def get_leads(
     tenant_api_key: str,
+    search: str | None = None,
     session: AsyncSession = Depends(get_db_session),
 ) -> list[LeadOut]:
-    tenant = await get_tenant_by_api_key(session=session, api_key=tenant_api_key)
+    tenant = await get_cached_tenant_by_api_key(session=session, api_key=tenant_api_key)
     if tenant is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid tenant_api_key"
         )
 
-    leads = await list_leads(session=session, tenant_id=tenant.id)
+    leads = await list_leads(session=session, tenant_id=tenant.id, search=search)
     return [
         LeadOut(
             id=l.id,
@@ -481,7 +483,7 @@ async def get_chatlogs(
     limit: int = 200,
     session: AsyncSession = Depends(get_db_session),
 ) -> list[ChatLogOut]:
-    tenant = await get_tenant_by_api_key(session=session, api_key=tenant_api_key)
+    tenant = await get_cached_tenant_by_api_key(session=session, api_key=tenant_api_key)
     if tenant is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid tenant_api_key"
@@ -507,7 +509,7 @@ async def list_channel_integrations(
     tenant_api_key: str,
     session: AsyncSession = Depends(get_db_session),
 ) -> list[ChannelIntegrationOut]:
-    tenant = await get_tenant_by_api_key(session=session, api_key=tenant_api_key)
+    tenant = await get_cached_tenant_by_api_key(session=session, api_key=tenant_api_key)
     if tenant is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid tenant_api_key"
@@ -533,7 +535,7 @@ async def create_channel_integration(
     payload: ChannelIntegrationCreateRequest,
     session: AsyncSession = Depends(get_db_session),
 ) -> ChannelIntegrationOut:
-    tenant = await get_tenant_by_api_key(
+    tenant = await get_cached_tenant_by_api_key(
         session=session, api_key=payload.tenant_api_key
     )
     if tenant is None:
@@ -568,7 +570,7 @@ async def update_channel_integration(
     payload: ChannelIntegrationUpdateRequest,
     session: AsyncSession = Depends(get_db_session),
 ) -> ChannelIntegrationOut:
-    tenant = await get_tenant_by_api_key(
+    tenant = await get_cached_tenant_by_api_key(
         session=session, api_key=payload.tenant_api_key
     )
     if tenant is None:
@@ -617,7 +619,7 @@ async def rotate_channel_integration_verify_token(
     payload: ChannelIntegrationRotateVerifyTokenRequest,
     session: AsyncSession = Depends(get_db_session),
 ) -> ChannelIntegrationOut:
-    tenant = await get_tenant_by_api_key(
+    tenant = await get_cached_tenant_by_api_key(
         session=session, api_key=payload.tenant_api_key
     )
     if tenant is None:
@@ -653,7 +655,7 @@ async def delete_channel_integration(
     tenant_api_key: str,
     session: AsyncSession = Depends(get_db_session),
 ) -> Response:
-    tenant = await get_tenant_by_api_key(session=session, api_key=tenant_api_key)
+    tenant = await get_cached_tenant_by_api_key(session=session, api_key=tenant_api_key)
     if tenant is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid tenant_api_key"
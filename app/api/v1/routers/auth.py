@@ -5,7 +5,7 @@ Handles registration, login, password reset, and user management.
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db_session
@@ -47,7 +47,7 @@ from app.crud.user import (
     update_user,
     update_user_password,
 )
-from app.core.security import verify_password
+from app.core.security import verify_password_async
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
@@ -86,6 +86,7 @@ async def get_current_user_dependency(
 )
 async def register(
     data: UserRegisterRequest,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_db_session),
 ):
     """
@@ -97,7 +98,9 @@ async def register(
     - **phone**: Optional phone number
     """
     try:
-        return await register_user(session, data)
+        return await register_user(
+            session, data, background_tasks=background_tasks
+        )
     except AuthError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -149,12 +152,15 @@ async def refresh(
 @router.post("/password/forgot")
 async def forgot_password(
     data: PasswordResetRequest,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_db_session),
 ):
     """
     Request password reset email.
     """
-    message = await request_password_reset(session, data.email)
+    message = await request_password_reset(
+        session, data.email, background_tasks=background_tasks
+    )
     return {"message": message}
 
 
@@ -200,12 +206,15 @@ async def verify_email_route(
 @router.post("/resend-verification")
 async def resend_verification_route(
     data: ResendVerificationRequest,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_db_session),
 ):
     """
     Resend verification email.
     """
-    message = await resend_verification(session, data.email)
+    message = await resend_verification(
+        session, data.email, background_tasks=background_tasks
+    )
     return {"message": message}
 
 
@@ -295,7 +304,9 @@ async def change_password(
         user = await get_current_user(session, token)
 
         # Verify current password
-        if not verify_password(data.current_password, user.hashed_password):
+        if not await verify_password_async(
+            data.current_password, user.hashed_password
+        ):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="كلمة المرور الحالية غير صحيحة",
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db_session
 from app.schemas.chat import ChatSendRequest, ChatSendResponse
 from app.services.chat_service import ChatManager
 from app.services.lead_service import detect_and_save_lead
-from app.crud.tenant import get_tenant_by_api_key
+from app.crud.tenant import get_cached_tenant_by_api_key
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
+# Carries the reply source on /stream; exposed to browsers via CORS in main.py.
+CHAT_SOURCE_HEADER = "X-Chat-Source"
+
 
 @router.post("/send", response_model=ChatSendResponse)
 async def send_message(
@@ -18,7 +22,7 @@ async def send_message(
     background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_db_session),
 ) -> ChatSendResponse:
-    tenant = await get_tenant_by_api_key(
+    tenant = await get_cached_tenant_by_api_key(
         session=session, api_key=payload.tenant_api_key
     )
     tenant_id = tenant.id if tenant else None
@@ -38,3 +42,37 @@ async def send_message(
     )
 
     return ChatSendResponse(response=result.response, source=result.source)
+
+
+@router.post("/stream")
+async def stream_message(
+    payload: ChatSendRequest,
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_db_session),
+):
+    """Same as /send, but the reply body is streamed as plain text chunks.
+
+    The reply source ("bot" | "ai" | "flow") is sent in the X-Chat-Source header.
+    """
+    tenant = await get_cached_tenant_by_api_key(
+        session=session, api_key=payload.tenant_api_key
+    )
+    if tenant is None:
+        return PlainTextResponse(
+            "Invalid tenant_api_key", headers={CHAT_SOURCE_HEADER: "bot"}
+        )
+
+    manager = ChatManager(session=session)
+    source, chunks = await manager.stream_message(
+        tenant_id=tenant.id, user_message=payload.message
+    )
+
+    background_tasks.add_task(
+        detect_and_save_lead, tenant_id=tenant.id, user_message=payload.message
+    )
+
+    return StreamingResponse(
+        chunks,
+        media_type="text/plain; charset=utf-8",
+        headers={CHAT_SOURCE_HEADER: source},
+    )
@@ -45,6 +45,7 @@ async def telegram_webhook(
         session=session,
         verify_token=verify_token,
         channel_types=["telegram"],
+        active_only=True,
     )
     if integ is None or not integ.is_active:
         raise HTTPException(
@@ -120,6 +121,7 @@ async def meta_verify(
         verify_token=token,
         # Back-compat: older UI saved Messenger as 'meta'
         channel_types=["whatsapp", "messenger", "meta", "instagram"],
+        active_only=True,
     )
 
     if integ is None or not integ.is_active:
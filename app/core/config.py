@@ -23,9 +23,26 @@ class Settings(BaseSettings):
             return v.replace("postgresql://", "postgresql+asyncpg://", 1)
         return v
 
+    # Connection pool sizing (per worker process)
+    db_pool_size: int = Field(default=20, validation_alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=40, validation_alias="DB_MAX_OVERFLOW")
+    db_pool_recycle_seconds: int = Field(
+        default=1800, validation_alias="DB_POOL_RECYCLE"
+    )
+    # Set when connecting through pgbouncer in transaction mode: prepared
+    # statements can't be reused across server connections there.
+    db_pgbouncer: bool = Field(default=False, validation_alias="DB_PGBOUNCER")
+
     # Security / Admin (for future hardening)
     secret_key: str = Field(default="change-me", validation_alias="SECRET_KEY")
     admin_password: str = Field(default="", validation_alias="ADMIN_PASSWORD")
+    # Threads reserved for bcrypt hashing/verification (per worker process)
+    password_hash_workers: int = Field(
+        default=4, validation_alias="PASSWORD_HASH_WORKERS"
+    )
+
+    # Root log level (DEBUG, INFO, WARNING, ...)
+    log_level: str = Field(default="INFO", validation_alias="LOG_LEVEL")
 
     # CORS for widget embeds (comma-separated list, or '*' for all)
     cors_allow_origins: str = Field(default="*", validation_alias="CORS_ALLOW_ORIGINS")
@@ -53,6 +70,9 @@ class Settings(BaseSettings):
     # Optional convenience alias for NVIDIA model selection
     nvidia_model: str = Field(default="", validation_alias="NVIDIA_MODEL")
 
+    # Identical AI prompts reuse the earlier reply for this long (0 disables)
+    llm_cache_ttl_seconds: int = Field(default=3600, validation_alias="LLM_CACHE_TTL")
+
     # Webhook behavior
     webhook_timeout_seconds: float = Field(
         default=5.0, validation_alias="WEBHOOK_TIMEOUT"
@@ -0,0 +1,63 @@
+"""
+Per-request correlation id for log records.
+The id lives in a ContextVar, so it follows the request through awaits and
+background tasks without being passed around; every LogRecord gets it as
+``record.request_id`` for formatters (``%(request_id)s``).
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from contextvars import ContextVar
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REQUEST_ID_HEADER = "X-Request-ID"
+_HEADER_KEY = REQUEST_ID_HEADER.lower().encode("latin-1")
+
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+
+def install_log_record_factory() -> None:
+    """Stamp ``request_id`` on every LogRecord; call sites stay unchanged."""
+    previous = logging.getLogRecordFactory()
+
+    def factory(*args, **kwargs) -> logging.LogRecord:
+        record = previous(*args, **kwargs)
+        record.request_id = request_id_var.get()
+        return record
+
+    logging.setLogRecordFactory(factory)
+
+
+class RequestIdMiddleware:
+    """Bind the incoming X-Request-ID (or a fresh one) and echo it back.
+
+    Plain ASGI rather than BaseHTTPMiddleware so streamed responses pass
+    through untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        raw = dict(scope["headers"]).get(_HEADER_KEY, b"")
+        request_id = raw.decode("latin-1")[:64] or uuid.uuid4().hex
+        token = request_id_var.set(request_id)
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((_HEADER_KEY, request_id.encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            request_id_var.reset(token)
@@ -1,8 +1,10 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Union
 
-from jose import jwt
 import bcrypt
+import jwt
 
 from app.core.config import settings
 
@@ -44,3 +46,26 @@ def get_password_hash(password: str) -> str:
     salt = bcrypt.gensalt()
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode("utf-8")
+
+
+# bcrypt is deliberately slow (~100-300ms) and releases the GIL, so async
+# callers hash in worker threads instead of stalling the event loop. The pool
+# is separate from the default executor so a burst of logins can't starve
+# other to_thread work (SMTP sends) and vice versa.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers, thread_name_prefix="pwhash"
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """``verify_password`` run in a worker thread."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _hash_executor, verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """``get_password_hash`` run in a worker thread."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, get_password_hash, password)
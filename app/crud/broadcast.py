@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.broadcast import Broadcast, BroadcastStatus
@@ -41,21 +41,39 @@ async def get_broadcast(session: AsyncSession, broadcast_id: int) -> Broadcast |
     return await session.get(Broadcast, broadcast_id)
 
 
-async def update_broadcast_stats(
+async def bump_broadcast_counters(
     session: AsyncSession,
     broadcast_id: int,
+    *,
     sent: int = 0,
     failed: int = 0,
-    status: BroadcastStatus | None = None,
 ) -> None:
-    obj = await session.get(Broadcast, broadcast_id)
-    if not obj:
+    """Add to the delivery counters in one UPDATE (no read-modify-write).
+
+    The caller commits.
+    """
+    if not sent and not failed:
         return
+    await session.execute(
+        update(Broadcast)
+        .where(Broadcast.id == broadcast_id)
+        .values(
+            sent_count=Broadcast.sent_count + sent,
+            failed_count=Broadcast.failed_count + failed,
+        )
+    )
 
-    obj.sent_count += sent
-    obj.failed_count += failed
-    if status:
-        obj.status = status
 
-    session.add(obj)
+async def update_broadcast_stats(
+    session: AsyncSession,
+    broadcast_id: int,
+    sent: int = 0,
+    failed: int = 0,
+    status: BroadcastStatus | None = None,
+) -> None:
+    await bump_broadcast_counters(session, broadcast_id, sent=sent, failed=failed)
+    if status:
+        await session.execute(
+            update(Broadcast).where(Broadcast.id == broadcast_id).values(status=status)
+        )
     await session.commit()
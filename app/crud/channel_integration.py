@@ -33,11 +33,18 @@ async def get_integration_by_id(
 
 
 async def get_integration_by_verify_token(
-    *, session: AsyncSession, verify_token: str, channel_types: list[str] | None = None
+    *,
+    session: AsyncSession,
+    verify_token: str,
+    channel_types: list[str] | None = None,
+    active_only: bool = False,
 ) -> ChannelIntegration | None:
     q = select(ChannelIntegration).where(
         ChannelIntegration.verify_token == verify_token
     )
+    if active_only:
+        # Bare column (not IS TRUE) so the partial index predicate matches.
+        q = q.where(ChannelIntegration.is_active)
     if channel_types:
         q = q.where(ChannelIntegration.channel_type.in_(channel_types))
     res = await session.execute(q)
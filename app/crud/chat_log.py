@@ -9,11 +9,13 @@ from app.models.lead import Lead
 
 async def create_chat_log(
     session: AsyncSession,
+    tenant_id: int,
     lead_id: int,
     message: str,
     sender_type: SenderType,
 ) -> ChatLog:
     obj = ChatLog(
+        tenant_id=tenant_id,
         lead_id=lead_id,
         message=message,
         sender_type=sender_type,
@@ -30,11 +32,9 @@ async def list_chat_logs_for_tenant(
     tenant_id: int,
     limit: int = 200,
 ) -> list[ChatLog]:
-    # Join leads to enforce tenant scoping
     stmt = (
         select(ChatLog)
-        .join(Lead, Lead.id == ChatLog.lead_id)
-        .where(Lead.tenant_id == tenant_id)
+        .where(ChatLog.tenant_id == tenant_id)
         .order_by(ChatLog.timestamp.desc())
         .limit(limit)
     )
@@ -44,15 +44,22 @@ async def list_chat_logs_for_tenant(
 
 async def get_chat_history_for_lead(
     session: AsyncSession,
+    tenant_id: int,
     lead_id: int,
+    limit: int = 200,
 ) -> list[ChatLog]:
+    """Latest ``limit`` messages of a conversation, oldest first."""
     stmt = (
         select(ChatLog)
+        .where(ChatLog.tenant_id == tenant_id)
         .where(ChatLog.lead_id == lead_id)
-        .order_by(ChatLog.timestamp.asc())
+        .order_by(ChatLog.timestamp.desc())
+        .limit(limit)
     )
     result = await session.execute(stmt)
-    return list(result.scalars().all())
+    messages = list(result.scalars().all())
+    messages.reverse()
+    return messages
 
 
 async def get_inbox_conversations(
@@ -61,9 +68,10 @@ async def get_inbox_conversations(
     """
     Returns a list of (Lead, latest_ChatLog) tuples, ordered by latest message.
     """
-    # Subquery to find the latest timestamp for each lead
+    # Subquery to find the latest timestamp for each of the tenant's leads
     subq = (
         select(ChatLog.lead_id, func.max(ChatLog.timestamp).label("max_ts"))
+        .where(ChatLog.tenant_id == tenant_id)
         .group_by(ChatLog.lead_id)
         .subquery()
     )
@@ -73,9 +81,11 @@ async def get_inbox_conversations(
         select(Lead, ChatLog)
         .join(subq, Lead.id == subq.c.lead_id)
         .join(
-            ChatLog, (ChatLog.lead_id == Lead.id) & (ChatLog.timestamp == subq.c.max_ts)
+            ChatLog,
+            (ChatLog.tenant_id == tenant_id)
+            & (ChatLog.lead_id == Lead.id)
+            & (ChatLog.timestamp == subq.c.max_ts),
         )
-        .where(Lead.tenant_id == tenant_id)
         .order_by(desc(subq.c.max_ts))
         .limit(limit)
     )
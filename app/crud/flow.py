@@ -1,9 +1,30 @@
 from typing import Sequence
 
+from cachetools import TTLCache
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.flow import Flow
+from app.services.compiled_flow import CompiledFlow
+
+# Compiled flow graphs by flow id, dropped on update/delete (the TTL bounds
+# staleness across worker processes).
+_COMPILED_FLOW_TTL_SECONDS = 60
+_compiled_flows: TTLCache[int, CompiledFlow] = TTLCache(
+    maxsize=4096, ttl=_COMPILED_FLOW_TTL_SECONDS
+)
+
+
+def invalidate_compiled_flow(flow_id: int) -> None:
+    _compiled_flows.pop(flow_id, None)
+
+
+def compile_flow(flow: Flow) -> CompiledFlow:
+    """Compiled form of an already loaded flow (cached by id)."""
+    compiled = _compiled_flows.get(flow.id)
+    if compiled is None:
+        compiled = _compiled_flows[flow.id] = CompiledFlow.from_flow(flow)
+    return compiled
 
 
 async def create_flow(
@@ -29,6 +50,14 @@ async def get_flow(session: AsyncSession, flow_id: int) -> Flow | None:
     return await session.get(Flow, flow_id)
 
 
+async def get_compiled_flow(session: AsyncSession, flow_id: int) -> CompiledFlow | None:
+    compiled = _compiled_flows.get(flow_id)
+    if compiled is not None:
+        return compiled
+    flow = await get_flow(session, flow_id)
+    return compile_flow(flow) if flow else None
+
+
 async def list_flows(session: AsyncSession, tenant_id: int) -> Sequence[Flow]:
     stmt = select(Flow).where(Flow.tenant_id == tenant_id).order_by(Flow.id.desc())
     result = await session.execute(stmt)
@@ -57,6 +86,7 @@ async def update_flow(
         flow.is_active = is_active
 
     await session.commit()
+    invalidate_compiled_flow(flow_id)
     await session.refresh(flow)
     return flow
 
@@ -67,6 +97,7 @@ async def delete_flow(session: AsyncSession, flow_id: int) -> bool:
         return False
     await session.delete(flow)
     await session.commit()
+    invalidate_compiled_flow(flow_id)
     return True
 
 
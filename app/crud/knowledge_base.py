@@ -1,10 +1,29 @@
 from __future__ import annotations
 
-from sqlalchemy import select, or_
+import re
+
+from cachetools import TTLCache
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.knowledge_base import KnowledgeBase
 
+_KB_TERM_RE = re.compile(r"\w+")
+_KB_MAX_TERMS = 32
+
+# Rendered KB context per (tenant, limit, normalized terms). Dropped on write;
+# the TTL bounds staleness across worker processes.
+_KB_CONTEXT_CACHE_TTL_SECONDS = 600
+_kb_context_cache: TTLCache[tuple[int, int, str], str] = TTLCache(
+    maxsize=5000, ttl=_KB_CONTEXT_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_kb_context(tenant_id: int) -> None:
+    """Drop the cached KB contexts of a tenant."""
+    for key in [k for k in _kb_context_cache if k[0] == tenant_id]:
+        _kb_context_cache.pop(key, None)
+
 
 async def create_kb_item(
     *,
@@ -21,6 +40,7 @@ async def create_kb_item(
     session.add(obj)
     await session.commit()
     await session.refresh(obj)
+    invalidate_kb_context(tenant_id)
     return obj
 
 
@@ -61,6 +81,7 @@ async def update_kb_item(
     session.add(obj)
     await session.commit()
     await session.refresh(obj)
+    invalidate_kb_context(obj.tenant_id)
     return obj
 
 
@@ -69,30 +90,55 @@ async def delete_kb_item(session: AsyncSession, kb_id: int) -> None:
     if obj:
         await session.delete(obj)
         await session.commit()
+        invalidate_kb_context(obj.tenant_id)
 
 
 async def search_kb_context(
     session: AsyncSession, tenant_id: int, query: str, limit: int = 5
 ) -> str:
     """
-    Simple retrieval: fetches all active KB items for the tenant.
-    In a real production RAG, this would use vector search.
-    For now, we concatenate all active items (assuming small scale).
+    Full-text retrieval over the tenant's active KB items.
+
+    Items matching any word of the query are ranked with ts_rank; when
+    nothing matches we fall back to the newest items so small knowledge
+    bases still give the model some context.
     """
-    stmt = (
-        select(KnowledgeBase)
+    terms = _KB_TERM_RE.findall(query)[:_KB_MAX_TERMS]
+    # The "simple" text search config lowercases, so case does not matter.
+    cache_key = (tenant_id, limit, " ".join(terms).lower())
+    cached = _kb_context_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    base = (
+        select(KnowledgeBase.title, KnowledgeBase.content)
         .where(KnowledgeBase.tenant_id == tenant_id)
         .where(KnowledgeBase.is_active == True)
     )
-    result = await session.execute(stmt)
-    items = result.scalars().all()
-
-    if not items:
-        return ""
-
-    # Format as context
-    context_parts = ["معلومات مرجعية (Knowledge Base):"]
-    for item in items:
-        context_parts.append(f"- {item.title}: {item.content}")
 
-    return "\n\n".join(context_parts)
+    rows = []
+    if terms:
+        # websearch_to_tsquery never raises on user input; "or" joins terms.
+        tsquery = func.websearch_to_tsquery("simple", " or ".join(terms))
+        stmt = (
+            base.where(KnowledgeBase.search_tsv.op("@@")(tsquery))
+            .order_by(func.ts_rank(KnowledgeBase.search_tsv, tsquery).desc())
+            .limit(limit)
+        )
+        rows = (await session.execute(stmt)).all()
+
+    if not rows:
+        stmt = base.order_by(KnowledgeBase.updated_at.desc()).limit(limit)
+        rows = (await session.execute(stmt)).all()
+
+    if not rows:
+        context = ""
+    else:
+        # Format as context
+        context_parts = ["معلومات مرجعية (Knowledge Base):"]
+        for title, content in rows:
+            context_parts.append(f"- {title}: {content}")
+        context = "\n\n".join(context_parts)
+
+    _kb_context_cache[cache_key] = context
+    return context
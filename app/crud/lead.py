@@ -1,10 +1,24 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from collections.abc import AsyncIterator
+from typing import Any
+
+from cachetools import TTLCache
+from sqlalchemy import Text, func, literal, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.lead import Lead
 
+# Lead id by (tenant_id, phone_number). Chatty senders then cost a primary
+# key lookup per message instead of a search; leads are never re-keyed, and
+# a stale id (deleted lead) just falls back to the query.
+_LEAD_ID_TTL_SECONDS = 30
+_lead_ids: TTLCache[tuple[int, str], int] = TTLCache(
+    maxsize=50_000, ttl=_LEAD_ID_TTL_SECONDS
+)
+
 
 async def create_lead(
     *,
@@ -13,7 +27,10 @@ async def create_lead(
     customer_name: str | None,
     phone_number: str | None,
     summary: str | None,
+    commit: bool = True,
 ) -> Lead:
+    """Insert a lead; with ``commit=False`` it is only flushed (id and server
+    defaults are populated) and the caller commits."""
     obj = Lead(
         tenant_id=tenant_id,
         customer_name=customer_name,
@@ -21,32 +38,144 @@ async def create_lead(
         summary=summary,
     )
     session.add(obj)
+    if not commit:
+        await session.flush()
+        return obj
     await session.commit()
     await session.refresh(obj)
+    if phone_number:
+        _lead_ids[(tenant_id, phone_number)] = obj.id
     return obj
 
 
 async def list_leads(
-    *, session: AsyncSession, tenant_id: int, limit: int = 200
+    *,
+    session: AsyncSession,
+    tenant_id: int,
+    limit: int = 200,
+    search: str | None = None,
+) -> list[Lead]:
+    stmt = select(Lead).where(Lead.tenant_id == tenant_id)
+    if search:
+        # Substring match on name/phone, served by the trigram GIN indexes.
+        stmt = stmt.where(
+            or_(
+                Lead.customer_name.icontains(search, autoescape=True),
+                Lead.phone_number.icontains(search, autoescape=True),
+            )
+        )
+    result = await session.execute(stmt.order_by(Lead.created_at.desc()).limit(limit))
+    return list(result.scalars().all())
+
+
+async def iter_lead_phone_batches(
+    *,
+    session: AsyncSession,
+    tenant_id: int,
+    batch_size: int = 500,
+) -> AsyncIterator[list[tuple[int, str]]]:
+    """Yield ``(id, phone_number)`` rows of leads that have a phone, in batches.
+
+    Pages by keyset on (created_at, id) over ix_leads_tenant_created_at, so
+    each batch is a short independent query: the caller may commit between
+    batches, and no ORM objects pile up in the session.
+    """
+    stmt = (
+        select(Lead.id, Lead.phone_number, Lead.created_at)
+        .where(Lead.tenant_id == tenant_id)
+        .where(Lead.phone_number.is_not(None))
+        .where(Lead.phone_number != "")
+        .order_by(Lead.created_at, Lead.id)
+        .limit(batch_size)
+    )
+    last_key = None
+    while True:
+        page = stmt
+        if last_key is not None:
+            page = page.where(tuple_(Lead.created_at, Lead.id) > last_key)
+        rows = (await session.execute(page)).all()
+        if not rows:
+            return
+        yield [(row.id, row.phone_number) for row in rows]
+        if len(rows) < batch_size:
+            return
+        last_key = (rows[-1].created_at, rows[-1].id)
+
+
+async def find_leads_by_flow_context(
+    *,
+    session: AsyncSession,
+    tenant_id: int,
+    match: dict[str, Any],
+    limit: int = 200,
 ) -> list[Lead]:
+    """Leads whose flow_context contains ``match`` (served by the GIN index)."""
     result = await session.execute(
         select(Lead)
         .where(Lead.tenant_id == tenant_id)
+        .where(Lead.flow_context.contains(match))
         .order_by(Lead.created_at.desc())
         .limit(limit)
     )
     return list(result.scalars().all())
 
 
+async def patch_flow_context(
+    *, session: AsyncSession, lead: Lead, path: list[str], value: Any
+) -> None:
+    """Set one key of ``lead.flow_context`` in place with jsonb_set.
+
+    Only the patched value travels to the database; the in-memory dict is
+    updated without marking the attribute dirty, so a later commit of the
+    lead does not write the whole document back. The caller commits.
+    """
+    await session.execute(
+        update(Lead)
+        .where(Lead.id == lead.id)
+        .values(
+            flow_context=func.jsonb_set(
+                Lead.flow_context,
+                literal(path, ARRAY(Text)),
+                literal(value, JSONB),
+                True,
+            )
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+    # Mirror jsonb_set: missing intermediate objects are not created.
+    context = dict(lead.flow_context or {})
+    target = context
+    for key in path[:-1]:
+        child = target.get(key)
+        if not isinstance(child, dict):
+            break
+        target[key] = target = dict(child)
+    else:
+        target[path[-1]] = value
+    set_committed_value(lead, "flow_context", context)
+
+
 async def get_lead_by_phone(
     session: AsyncSession, tenant_id: int, phone_number: str
 ) -> Lead | None:
+    key = (tenant_id, phone_number)
+    lead_id = _lead_ids.get(key)
+    if lead_id is not None:
+        lead = await session.get(Lead, lead_id)
+        if lead is not None:
+            return lead
+        _lead_ids.pop(key, None)
+
     result = await session.execute(
         select(Lead)
         .where(Lead.tenant_id == tenant_id)
         .where(Lead.phone_number == phone_number)
     )
-    return result.scalars().first()
+    lead = result.scalars().first()
+    if lead is not None:
+        _lead_ids[key] = lead.id
+    return lead
 
 
 async def get_lead_by_id(session: AsyncSession, lead_id: int) -> Lead | None:
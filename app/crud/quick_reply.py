@@ -11,7 +11,8 @@ async def list_quick_replies_for_tenant(
 ) -> list[QuickReply]:
     q = select(QuickReply).where(QuickReply.tenant_id == tenant_id)
     if active_only:
-        q = q.where(QuickReply.is_active.is_(True))
+        # Bare column (not IS TRUE) so the partial index predicate matches.
+        q = q.where(QuickReply.is_active)
     q = q.order_by(QuickReply.sort_order.asc(), QuickReply.id.asc())
     res = await session.execute(q)
     return list(res.scalars().all())
@@ -41,7 +42,6 @@ async def create_quick_reply(
     )
     session.add(obj)
     await session.commit()
-    await session.refresh(obj)
     return obj
 
 
@@ -64,7 +64,6 @@ async def update_quick_reply(
         quick_reply.is_active = is_active
     session.add(quick_reply)
     await session.commit()
-    await session.refresh(quick_reply)
     return quick_reply
 
 
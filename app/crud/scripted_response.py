@@ -1,9 +1,23 @@
 from __future__ import annotations
 
+from cachetools import TTLCache
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.scripted_response import ScriptedResponse
+from app.services.trigger_matcher import TriggerMatcher
+
+# Compiled trigger automata per tenant, rebuilt on write or after the TTL
+# (the TTL bounds staleness across worker processes).
+_MATCHER_CACHE_TTL_SECONDS = 60
+_matcher_cache: TTLCache[int, TriggerMatcher] = TTLCache(
+    maxsize=1024, ttl=_MATCHER_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_trigger_matcher(tenant_id: int) -> None:
+    """Drop the cached trigger automaton of a tenant."""
+    _matcher_cache.pop(tenant_id, None)
 
 
 async def list_active_scripted_responses(
@@ -12,12 +26,28 @@ async def list_active_scripted_responses(
     result = await session.execute(
         select(ScriptedResponse)
         .where(ScriptedResponse.tenant_id == tenant_id)
-        .where(ScriptedResponse.is_active.is_(True))
+        .where(ScriptedResponse.is_active)
         .order_by(ScriptedResponse.id.asc())
     )
     return list(result.scalars().all())
 
 
+async def get_trigger_matcher(
+    *, session: AsyncSession, tenant_id: int
+) -> TriggerMatcher:
+    matcher = _matcher_cache.get(tenant_id)
+    if matcher is None:
+        result = await session.execute(
+            select(ScriptedResponse.trigger_keyword, ScriptedResponse.response_text)
+            .where(ScriptedResponse.tenant_id == tenant_id)
+            .where(ScriptedResponse.is_active)
+            .order_by(ScriptedResponse.id.asc())
+        )
+        matcher = TriggerMatcher(result.tuples().all())
+        _matcher_cache[tenant_id] = matcher
+    return matcher
+
+
 async def create_scripted_response(
     *,
     session: AsyncSession,
@@ -34,7 +64,7 @@ async def create_scripted_response(
     )
     session.add(obj)
     await session.commit()
-    await session.refresh(obj)
+    invalidate_trigger_matcher(tenant_id)
     return obj
 
 
@@ -60,12 +90,14 @@ async def update_scripted_response(
         scripted_response.is_active = is_active
     session.add(scripted_response)
     await session.commit()
-    await session.refresh(scripted_response)
+    invalidate_trigger_matcher(scripted_response.tenant_id)
     return scripted_response
 
 
 async def delete_scripted_response(
     *, session: AsyncSession, scripted_response: ScriptedResponse
 ) -> None:
+    tenant_id = scripted_response.tenant_id
     await session.delete(scripted_response)
     await session.commit()
+    invalidate_trigger_matcher(tenant_id)
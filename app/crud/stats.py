@@ -3,12 +3,13 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from typing import Any
 
-from sqlalchemy import func, select, and_
+from sqlalchemy import BigInteger, Date, and_, cast, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.chat_log import ChatLog, SenderType
+from app.models.chat_log import ChatLog
 from app.models.lead import Lead
 from app.models.tenant import Tenant
+from app.models.tenant_stats import TenantStats
 from app.models.channel_integration import ChannelIntegration
 
 
@@ -17,66 +18,49 @@ async def get_dashboard_stats(
     session: AsyncSession,
     tenant_id: int | None = None,
 ) -> dict[str, Any]:
-    """Get comprehensive dashboard statistics"""
+    """Get comprehensive dashboard statistics.
+
+    Lead and message counters come from the tenant_stats materialized view
+    (refreshed every minute) instead of aggregating leads/chat_logs here.
+    """
+
+    counters = {
+        "total_leads": TenantStats.leads_total,
+        "total_messages": TenantStats.messages_total,
+        "user_messages": TenantStats.user_messages,
+        "bot_messages": TenantStats.bot_messages,
+        "today_leads": TenantStats.leads_today,
+        "today_messages": TenantStats.messages_today,
+        "week_leads": TenantStats.leads_7d,
+        "week_messages": TenantStats.messages_7d,
+    }
+    names = list(counters)
 
-    now = datetime.utcnow()
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    week_ago = now - timedelta(days=7)
-    month_ago = now - timedelta(days=30)
-
-    stats = {}
-
-    # Base filters
-    if tenant_id:
-        lead_filter = Lead.tenant_id == tenant_id
-    else:
-        lead_filter = True
-
-    # === Total Counts ===
-
-    # Total leads (customers)
-    total_leads = await session.execute(select(func.count(Lead.id)).where(lead_filter))
-    stats["total_leads"] = total_leads.scalar() or 0
-
-    # Total messages
     if tenant_id:
-        total_msgs = await session.execute(
-            select(func.count(ChatLog.id))
-            .join(Lead, Lead.id == ChatLog.lead_id)
-            .where(Lead.tenant_id == tenant_id)
-        )
+        stmt = select(*counters.values()).where(TenantStats.tenant_id == tenant_id)
+        row = (await session.execute(stmt)).first()
     else:
-        total_msgs = await session.execute(select(func.count(ChatLog.id)))
-    stats["total_messages"] = total_msgs.scalar() or 0
-
-    # Messages by type
-    if tenant_id:
-        user_msgs = await session.execute(
-            select(func.count(ChatLog.id))
-            .join(Lead, Lead.id == ChatLog.lead_id)
-            .where(
-                and_(
-                    Lead.tenant_id == tenant_id, ChatLog.sender_type == SenderType.user
-                )
-            )
-        )
-        bot_msgs = await session.execute(
-            select(func.count(ChatLog.id))
-            .join(Lead, Lead.id == ChatLog.lead_id)
-            .where(
-                and_(Lead.tenant_id == tenant_id, ChatLog.sender_type == SenderType.bot)
-            )
-        )
-    else:
-        user_msgs = await session.execute(
-            select(func.count(ChatLog.id)).where(ChatLog.sender_type == SenderType.user)
-        )
-        bot_msgs = await session.execute(
-            select(func.count(ChatLog.id)).where(ChatLog.sender_type == SenderType.bot)
-        )
-
-    stats["user_messages"] = user_msgs.scalar() or 0
-    stats["bot_messages"] = bot_msgs.scalar() or 0
+        # One statement on the caller's session: view totals plus the tenant
+        # and channel counts as scalar subqueries.
+        stmt = select(
+            *(
+                cast(func.coalesce(func.sum(column), 0), BigInteger)
+                for column in counters.values()
+            ),
+            select(func.count())
+            .select_from(Tenant)
+            .scalar_subquery()
+            .label("total_tenants"),
+            select(func.count())
+            .select_from(ChannelIntegration)
+            .scalar_subquery()
+            .label("total_channels"),
+        )
+        row = (await session.execute(stmt)).first()
+        names += ["total_tenants", "total_channels"]
+
+    # A tenant created since the last refresh has no row yet.
+    stats: dict[str, Any] = dict(zip(names, row or (0,) * len(names)))
 
     # Response rate
     if stats["user_messages"] > 0:
@@ -86,63 +70,6 @@ async def get_dashboard_stats(
     else:
         stats["response_rate"] = 0
 
-    # === Today's Stats ===
-    if tenant_id:
-        today_leads = await session.execute(
-            select(func.count(Lead.id)).where(
-                and_(lead_filter, Lead.created_at >= today_start)
-            )
-        )
-        today_msgs = await session.execute(
-            select(func.count(ChatLog.id))
-            .join(Lead, Lead.id == ChatLog.lead_id)
-            .where(and_(Lead.tenant_id == tenant_id, ChatLog.timestamp >= today_start))
-        )
-    else:
-        today_leads = await session.execute(
-            select(func.count(Lead.id)).where(Lead.created_at >= today_start)
-        )
-        today_msgs = await session.execute(
-            select(func.count(ChatLog.id)).where(ChatLog.timestamp >= today_start)
-        )
-
-    stats["today_leads"] = today_leads.scalar() or 0
-    stats["today_messages"] = today_msgs.scalar() or 0
-
-    # === This Week Stats ===
-    if tenant_id:
-        week_leads = await session.execute(
-            select(func.count(Lead.id)).where(
-                and_(lead_filter, Lead.created_at >= week_ago)
-            )
-        )
-        week_msgs = await session.execute(
-            select(func.count(ChatLog.id))
-            .join(Lead, Lead.id == ChatLog.lead_id)
-            .where(and_(Lead.tenant_id == tenant_id, ChatLog.timestamp >= week_ago))
-        )
-    else:
-        week_leads = await session.execute(
-            select(func.count(Lead.id)).where(Lead.created_at >= week_ago)
-        )
-        week_msgs = await session.execute(
-            select(func.count(ChatLog.id)).where(ChatLog.timestamp >= week_ago)
-        )
-
-    stats["week_leads"] = week_leads.scalar() or 0
-    stats["week_messages"] = week_msgs.scalar() or 0
-
-    # === Tenants count (global only) ===
-    if not tenant_id:
-        total_tenants = await session.execute(select(func.count(Tenant.id)))
-        stats["total_tenants"] = total_tenants.scalar() or 0
-
-        # Active channels
-        total_channels = await session.execute(
-            select(func.count(ChannelIntegration.id))
-        )
-        stats["total_channels"] = total_channels.scalar() or 0
-
     return stats
 
 
@@ -154,50 +81,41 @@ async def get_messages_per_day(
 ) -> list[dict[str, Any]]:
     """Get message count per day for the last N days"""
 
-    from sqlalchemy import cast, Date
+    today = datetime.utcnow().date()
+    first_day = today - timedelta(days=days - 1)
 
-    now = datetime.utcnow()
-    start_date = now - timedelta(days=days)
+    # Let Postgres produce one row per day (gap-filled with zeros) instead of
+    # patching missing days in Python.
+    series = select(
+        func.generate_series(first_day, today, timedelta(days=1)).label("day")
+    ).subquery("days")
+    day = cast(series.c.day, Date)
 
+    join_on = and_(
+        cast(ChatLog.timestamp, Date) == day,
+        ChatLog.timestamp >= first_day,
+    )
     if tenant_id:
-        stmt = (
-            select(
-                cast(ChatLog.timestamp, Date).label("date"),
-                func.count(ChatLog.id).label("count"),
-            )
-            .join(Lead, Lead.id == ChatLog.lead_id)
-            .where(and_(Lead.tenant_id == tenant_id, ChatLog.timestamp >= start_date))
-            .group_by(cast(ChatLog.timestamp, Date))
-            .order_by(cast(ChatLog.timestamp, Date))
-        )
-    else:
-        stmt = (
-            select(
-                cast(ChatLog.timestamp, Date).label("date"),
-                func.count(ChatLog.id).label("count"),
-            )
-            .where(ChatLog.timestamp >= start_date)
-            .group_by(cast(ChatLog.timestamp, Date))
-            .order_by(cast(ChatLog.timestamp, Date))
-        )
+        join_on = and_(join_on, ChatLog.tenant_id == tenant_id)
 
-    result = await session.execute(stmt)
-    rows = result.all()
-
-    # Fill in missing days with 0
-    date_counts = {str(row.date): row.count for row in rows}
-    chart_data = []
-    for i in range(days):
-        date = (now - timedelta(days=days - 1 - i)).date()
-        chart_data.append(
-            {
-                "date": str(date),
-                "label": date.strftime("%m/%d"),
-                "count": date_counts.get(str(date), 0),
-            }
-        )
+    # count(ChatLog.id), not count(*): empty days join to a single NULL row.
+    stmt = (
+        select(day.label("date"), func.count(ChatLog.id).label("count"))
+        .select_from(series)
+        .outerjoin(ChatLog, join_on)
+        .group_by(day)
+        .order_by(day)
+    )
 
-    return chart_data
+    result = await session.execute(stmt)
+    return [
+        {
+            "date": str(row.date),
+            "label": row.date.strftime("%m/%d"),
+            "count": row.count,
+        }
+        for row in result
+    ]
 
 
 async def get_recent_activity(
@@ -208,40 +126,35 @@ async def get_recent_activity(
 ) -> list[dict[str, Any]]:
     """Get recent chat activity"""
 
+    stmt = (
+        select(
+            ChatLog.id,
+            # One extra character tells us whether the message was cut.
+            func.left(ChatLog.message, 101).label("message"),
+            ChatLog.sender_type,
+            ChatLog.timestamp,
+            Lead.id.label("lead_id"),
+            Lead.customer_name,
+        )
+        .join(Lead, Lead.id == ChatLog.lead_id)
+        .order_by(ChatLog.timestamp.desc())
+        .limit(limit)
+    )
     if tenant_id:
-        stmt = (
-            select(ChatLog, Lead)
-            .join(Lead, Lead.id == ChatLog.lead_id)
-            .where(Lead.tenant_id == tenant_id)
-            .order_by(ChatLog.timestamp.desc())
-            .limit(limit)
-        )
-    else:
-        stmt = (
-            select(ChatLog, Lead)
-            .join(Lead, Lead.id == ChatLog.lead_id)
-            .order_by(ChatLog.timestamp.desc())
-            .limit(limit)
-        )
+        stmt = stmt.where(ChatLog.tenant_id == tenant_id)
 
     result = await session.execute(stmt)
-    rows = result.all()
-
-    activity = []
-    for chat_log, lead in rows:
-        activity.append(
-            {
-                "id": chat_log.id,
-                "message": (
-                    chat_log.message[:100] + "..."
-                    if len(chat_log.message) > 100
-                    else chat_log.message
-                ),
-                "sender_type": chat_log.sender_type.value,
-                "timestamp": chat_log.timestamp,
-                "customer_name": lead.customer_name or "مجهول",
-                "lead_id": lead.id,
-            }
-        )
 
-    return activity
+    return [
+        {
+            "id": row.id,
+            "message": (
+                row.message[:100] + "..." if len(row.message) > 100 else row.message
+            ),
+            "sender_type": row.sender_type.value,
+            "timestamp": row.timestamp,
+            "customer_name": row.customer_name or "مجهول",
+            "lead_id": row.lead_id,
+        }
+        for row in result
+    ]
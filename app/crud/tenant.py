@@ -1,11 +1,84 @@
 from __future__ import annotations
 
+import hashlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from cachetools import TTLCache
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.tenant import Tenant
 
 
+@dataclass(frozen=True, slots=True)
+class TenantSnapshot:
+    """Read-only copy of the tenant fields needed on the request hot path.
+
+    It has no ``api_key``: pages that render the key (settings form, channel,
+    rule and quick-reply rows) must load the ORM tenant instead.
+    """
+
+    id: int
+    name: str
+    system_prompt: str | None
+    webhook_url: str | None
+    branding_config: Mapping[str, object]
+
+
+# API key lookups run on every widget/chat request; keep resolved tenants for a
+# short while so repeated calls skip the database. Keys are hashed so raw API
+# keys never sit in process memory longer than the request itself.
+_API_KEY_CACHE_TTL_SECONDS = 60
+_api_key_cache: TTLCache[bytes, TenantSnapshot] = TTLCache(
+    maxsize=10_000, ttl=_API_KEY_CACHE_TTL_SECONDS
+)
+
+
+# Same snapshots by tenant id, for the chat and lead-capture hot paths.
+_tenant_id_cache: TTLCache[int, TenantSnapshot] = TTLCache(
+    maxsize=10_000, ttl=_API_KEY_CACHE_TTL_SECONDS
+)
+
+
+def _api_key_digest(api_key: str) -> bytes:
+    return hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).digest()
+
+
+def _snapshot(tenant: Tenant) -> TenantSnapshot:
+    return TenantSnapshot(
+        id=tenant.id,
+        name=tenant.name,
+        system_prompt=tenant.system_prompt,
+        webhook_url=tenant.webhook_url,
+        # Read-only view of a private copy, so the snapshot can't be mutated.
+        branding_config=MappingProxyType(dict(tenant.branding_config or {})),
+    )
+
+
+def invalidate_tenant_api_key(api_key: str | None) -> None:
+    """Drop a cached API key lookup (after rotation, deletion or edits)."""
+    if api_key:
+        _api_key_cache.pop(_api_key_digest(api_key), None)
+
+
+def invalidate_tenant(tenant: Tenant) -> None:
+    """Drop every cached snapshot of ``tenant`` (by API key and by id).
+
+    Call after the commit, so a concurrent lookup cannot re-cache the old row.
+    """
+    invalidate_tenant_api_key(tenant.api_key)
+    _tenant_id_cache.pop(tenant.id, None)
+
+
+def _remember(tenant: Tenant) -> TenantSnapshot:
+    snapshot = _snapshot(tenant)
+    _api_key_cache[_api_key_digest(tenant.api_key)] = snapshot
+    _tenant_id_cache[tenant.id] = snapshot
+    return snapshot
+
+
 async def list_tenants(*, session: AsyncSession, limit: int = 200) -> list[Tenant]:
     result = await session.execute(
         select(Tenant).order_by(Tenant.id.desc()).limit(limit)
@@ -31,17 +104,20 @@ async def create_tenant(
     )
     session.add(tenant)
     await session.commit()
-    await session.refresh(tenant)
     return tenant
 
 
 async def rotate_tenant_api_key(
     *, session: AsyncSession, tenant: Tenant, new_api_key: str
 ) -> Tenant:
+    old_api_key = tenant.api_key
     tenant.api_key = new_api_key
     session.add(tenant)
     await session.commit()
-    await session.refresh(tenant)
+    # The old key must stop resolving immediately. Evict only once the commit
+    # is in: a lookup racing an earlier eviction would re-cache the old row.
+    invalidate_tenant_api_key(old_api_key)
+    invalidate_tenant(tenant)
     return tenant
 
 
@@ -52,24 +128,54 @@ async def update_tenant_name(
         tenant.name = name
     session.add(tenant)
     await session.commit()
-    await session.refresh(tenant)
+    invalidate_tenant(tenant)
     return tenant
 
 
 async def delete_tenant(*, session: AsyncSession, tenant: Tenant) -> None:
     await session.delete(tenant)
     await session.commit()
+    invalidate_tenant(tenant)
 
 
 async def get_tenant_by_id(*, session: AsyncSession, tenant_id: int) -> Tenant | None:
     return await session.get(Tenant, tenant_id)
 
 
+async def get_cached_tenant_by_id(
+    *, session: AsyncSession, tenant_id: int
+) -> TenantSnapshot | None:
+    """Tenant snapshot by id, hitting the DB only on a miss (read-only paths)."""
+    cached = _tenant_id_cache.get(tenant_id)
+    if cached is not None:
+        return cached
+    tenant = await get_tenant_by_id(session=session, tenant_id=tenant_id)
+    return _remember(tenant) if tenant is not None else None
+
+
 async def get_tenant_by_api_key(
     *, session: AsyncSession, api_key: str
 ) -> Tenant | None:
     result = await session.execute(select(Tenant).where(Tenant.api_key == api_key))
-    return result.scalar_one_or_none()
+    tenant = result.scalar_one_or_none()
+    if tenant is not None:
+        _remember(tenant)
+    return tenant
+
+
+async def get_cached_tenant_by_api_key(
+    *, session: AsyncSession, api_key: str
+) -> TenantSnapshot | None:
+    """Resolve an API key to a tenant snapshot, hitting the DB only on a miss.
+
+    Use this on read-only paths; callers that modify the tenant need the ORM
+    object from ``get_tenant_by_api_key``.
+    """
+    cached = _api_key_cache.get(_api_key_digest(api_key))
+    if cached is not None:
+        return cached
+    tenant = await get_tenant_by_api_key(session=session, api_key=api_key)
+    return _snapshot(tenant) if tenant is not None else None
 
 
 async def update_tenant_settings(
@@ -86,5 +192,5 @@ async def update_tenant_settings(
 
     session.add(tenant)
     await session.commit()
-    await session.refresh(tenant)
+    invalidate_tenant(tenant)
     return tenant
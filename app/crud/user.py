@@ -6,13 +6,13 @@ from __future__ import annotations
 
 import secrets
 from datetime import datetime, timedelta
-from typing import Optional, Sequence
+from typing import Mapping, Optional, Sequence
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import BigInteger, Boolean, column, func, or_, select, update, values
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash_async, verify_password_async
 from app.models.user import User, UserRole
 
 
@@ -34,7 +34,7 @@ async def create_user(
     """Create a new user with hashed password."""
     user = User(
         email=email.lower().strip(),
-        hashed_password=get_password_hash(password),
+        hashed_password=await get_password_hash_async(password),
         full_name=full_name.strip(),
         role=role,
         tenant_id=tenant_id,
@@ -44,7 +44,6 @@ async def create_user(
     )
     session.add(user)
     await session.commit()
-    await session.refresh(user)
     return user
 
 
@@ -75,9 +74,9 @@ async def get_user_by_id(
     session: AsyncSession,
     user_id: int,
 ) -> Optional[User]:
-    """Get user by ID with tenant loaded."""
+    """Get user by ID with tenant loaded (joined, one round trip)."""
     result = await session.execute(
-        select(User).where(User.id == user_id).options(selectinload(User.tenant))
+        select(User).where(User.id == user_id).options(joinedload(User.tenant))
     )
     return result.scalar_one_or_none()
 
@@ -90,7 +89,7 @@ async def get_user_by_email(
     result = await session.execute(
         select(User)
         .where(User.email == email.lower().strip())
-        .options(selectinload(User.tenant))
+        .options(joinedload(User.tenant))
     )
     return result.scalar_one_or_none()
 
@@ -204,21 +203,62 @@ async def update_user(
             setattr(user, key, value)
 
     await session.commit()
+    # updated_at is set server-side and tenant_id may have changed.
     await session.refresh(user)
     return user
 
 
+async def bulk_update_users(
+    session: AsyncSession,
+    user_ids: Sequence[int],
+    **patch,
+) -> int:
+    """Apply the same field values to many users in a single UPDATE."""
+    if not user_ids or not patch:
+        return 0
+    result = await session.execute(
+        update(User)
+        .where(User.id.in_(user_ids))
+        .values(**patch)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    return result.rowcount
+
+
+async def bulk_set_users_active(
+    session: AsyncSession,
+    states: Mapping[int, bool],
+) -> int:
+    """Set a per-user is_active flag with one UPDATE ... FROM (VALUES ...)."""
+    if not states:
+        return 0
+    rows = values(
+        column("id", BigInteger), column("is_active", Boolean), name="v"
+    ).data(list(states.items()))
+    result = await session.execute(
+        update(User)
+        .where(User.id == rows.c.id)
+        .values(is_active=rows.c.is_active)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    return result.rowcount
+
+
 async def update_user_password(
     session: AsyncSession,
     user: User,
     new_password: str,
 ) -> User:
     """Update user password (hashes automatically)."""
-    user.hashed_password = get_password_hash(new_password)
+    user.hashed_password = await get_password_hash_async(new_password)
     user.reset_token = None
     user.reset_token_expires = None
     await session.commit()
-    await session.refresh(user)
+    # updated_at is set by the UPDATE (onupdate) and left expired; reload just
+    # that column so later access doesn't lazy-load on the async session.
+    await session.refresh(user, ["updated_at"])
     return user
 
 
@@ -241,7 +281,7 @@ async def verify_user_email(
     user.verification_token = None
     user.verification_token_expires = None
     await session.commit()
-    await session.refresh(user)
+    await session.refresh(user, ["updated_at"])
     return user
 
 
@@ -293,7 +333,7 @@ async def deactivate_user(
     """Soft delete - deactivate user instead of deleting."""
     user.is_active = False
     await session.commit()
-    await session.refresh(user)
+    await session.refresh(user, ["updated_at"])
     return user
 
 
@@ -309,7 +349,7 @@ async def authenticate_user(
     user = await get_user_by_email(session, email)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password_async(password, user.hashed_password):
         return None
     if not user.is_active:
         return None
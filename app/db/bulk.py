@@ -0,0 +1,53 @@
+"""Bulk write helpers that skip per-row ORM overhead."""
+
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.chat_log import ChatLog, SenderType
+
+# Below this many rows a multi-row INSERT is as fast as COPY and cheaper to set up.
+COPY_THRESHOLD = 100
+
+_CHAT_LOG_COPY_COLUMNS = ["tenant_id", "lead_id", "message", "sender_type", "timestamp"]
+
+
+async def bulk_copy_chat_logs(
+    session: AsyncSession, rows: Sequence[dict[str, Any]]
+) -> int:
+    """
+    Insert many chat log rows in the session's transaction (caller commits).
+
+    Each row needs tenant_id, lead_id, message and sender_type; timestamp is
+    optional and defaults to now. Large batches go through asyncpg's COPY.
+    """
+    if not rows:
+        return 0
+
+    if len(rows) < COPY_THRESHOLD:
+        await session.execute(insert(ChatLog), list(rows))
+        return len(rows)
+
+    now = dt.datetime.now(dt.timezone.utc)
+    records = [
+        (
+            row["tenant_id"],
+            row["lead_id"],
+            row["message"],
+            SenderType(row["sender_type"]).value,
+            row.get("timestamp") or now,
+        )
+        for row in rows
+    ]
+
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        ChatLog.__tablename__, records=records, columns=_CHAT_LOG_COPY_COLUMNS
+    )
+    return len(records)
@@ -0,0 +1,89 @@
+"""Monthly partition maintenance for range-partitioned tables (chat_logs)."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+CHAT_LOGS_TABLE = "chat_logs"
+MONTHS_AHEAD = 2
+MAINTENANCE_INTERVAL_SECONDS = 24 * 60 * 60
+
+
+def _add_months(day: dt.date, months: int) -> dt.date:
+    year, month = divmod(day.month - 1 + months, 12)
+    return dt.date(day.year + year, month + 1, 1)
+
+
+def monthly_partition_ddl(table: str, month_start: dt.date) -> str:
+    """DDL for the partition covering the calendar month (UTC) of month_start."""
+    start = month_start.replace(day=1)
+    end = _add_months(start, 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {table}_{start:%Y_%m} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{start.isoformat()} 00:00:00+00') "
+        f"TO ('{end.isoformat()} 00:00:00+00')"
+    )
+
+
+async def _is_partitioned(conn: AsyncConnection, table: str) -> bool:
+    result = await conn.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass(:table)"
+        ),
+        {"table": table},
+    )
+    return result.first() is not None
+
+
+async def ensure_chat_log_partitions(
+    conn: AsyncConnection, months_ahead: int = MONTHS_AHEAD
+) -> None:
+    """Create the default partition plus this month's and the next ones."""
+    if not await _is_partitioned(conn, CHAT_LOGS_TABLE):
+        logger.warning(
+            "%s is not partitioned yet; run the database migrations",
+            CHAT_LOGS_TABLE,
+        )
+        return
+
+    statements = [
+        f"CREATE TABLE IF NOT EXISTS {CHAT_LOGS_TABLE}_default "
+        f"PARTITION OF {CHAT_LOGS_TABLE} DEFAULT"
+    ]
+    this_month = dt.datetime.now(dt.timezone.utc).date().replace(day=1)
+    statements.extend(
+        monthly_partition_ddl(CHAT_LOGS_TABLE, _add_months(this_month, offset))
+        for offset in range(months_ahead + 1)
+    )
+
+    for ddl in statements:
+        # A concurrent worker may create the same partition, and rows already
+        # sitting in the default partition block creating an overlapping one.
+        # Neither should take the app down.
+        try:
+            async with conn.begin_nested():
+                await conn.execute(text(ddl))
+        except DBAPIError as exc:
+            logger.warning("Could not create partition (%s): %s", ddl, exc.orig)
+
+
+async def run_partition_maintenance() -> None:
+    """Keep future chat_logs partitions created; runs for the app's lifetime."""
+    while True:
+        await asyncio.sleep(MAINTENANCE_INTERVAL_SECONDS)
+        try:
+            async with engine.begin() as conn:
+                await ensure_chat_log_partitions(conn)
+        except DBAPIError:
+            logger.exception("chat_logs partition maintenance failed")
@@ -0,0 +1,96 @@
+"""Per-tenant dashboard counters kept in the tenant_stats materialized view."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+TENANT_STATS_VIEW = "tenant_stats"
+REFRESH_INTERVAL_SECONDS = 60
+# Arbitrary advisory lock key so only one worker refreshes at a time.
+_REFRESH_LOCK_KEY = 0x7E57_57A7
+
+# Keep in sync with migrations/versions/0016_tenant_stats_view.py.
+TENANT_STATS_VIEW_SQL = f"""
+CREATE MATERIALIZED VIEW IF NOT EXISTS {TENANT_STATS_VIEW} AS
+WITH bounds AS (
+    SELECT
+        date_trunc('day', now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC' AS today,
+        now() - interval '7 days' AS week_ago
+)
+SELECT
+    t.id AS tenant_id,
+    coalesce(l.leads_total, 0) AS leads_total,
+    coalesce(l.leads_today, 0) AS leads_today,
+    coalesce(l.leads_7d, 0) AS leads_7d,
+    coalesce(m.messages_total, 0) AS messages_total,
+    coalesce(m.user_messages, 0) AS user_messages,
+    coalesce(m.bot_messages, 0) AS bot_messages,
+    coalesce(m.messages_today, 0) AS messages_today,
+    coalesce(m.messages_7d, 0) AS messages_7d,
+    now() AS refreshed_at
+FROM tenants t
+LEFT JOIN (
+    SELECT
+        tenant_id,
+        count(*) AS leads_total,
+        count(*) FILTER (WHERE created_at >= bounds.today) AS leads_today,
+        count(*) FILTER (WHERE created_at >= bounds.week_ago) AS leads_7d
+    FROM leads, bounds
+    GROUP BY tenant_id
+) l ON l.tenant_id = t.id
+LEFT JOIN (
+    SELECT
+        tenant_id,
+        count(*) AS messages_total,
+        count(*) FILTER (WHERE sender_type = 'user') AS user_messages,
+        count(*) FILTER (WHERE sender_type = 'bot') AS bot_messages,
+        count(*) FILTER (WHERE timestamp >= bounds.today) AS messages_today,
+        count(*) FILTER (WHERE timestamp >= bounds.week_ago) AS messages_7d
+    FROM chat_logs, bounds
+    GROUP BY tenant_id
+) m ON m.tenant_id = t.id
+"""
+
+
+async def ensure_tenant_stats_view(conn: AsyncConnection) -> None:
+    """Create the view and the unique index REFRESH ... CONCURRENTLY needs."""
+    await conn.execute(text(TENANT_STATS_VIEW_SQL))
+    await conn.execute(
+        text(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS ux_{TENANT_STATS_VIEW}_tenant "
+            f"ON {TENANT_STATS_VIEW} (tenant_id)"
+        )
+    )
+
+
+async def refresh_tenant_stats(conn: AsyncConnection) -> bool:
+    """Refresh the view without blocking readers; False if another worker is."""
+    locked = await conn.scalar(
+        text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": _REFRESH_LOCK_KEY}
+    )
+    if not locked:
+        return False
+    await conn.execute(
+        text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {TENANT_STATS_VIEW}")
+    )
+    return True
+
+
+async def run_tenant_stats_refresh() -> None:
+    """Refresh tenant_stats periodically; runs for the app's lifetime."""
+    while True:
+        await asyncio.sleep(REFRESH_INTERVAL_SECONDS)
+        try:
+            async with engine.begin() as conn:
+                await refresh_tenant_stats(conn)
+        except DBAPIError:
+            logger.exception("%s refresh failed", TENANT_STATS_VIEW)
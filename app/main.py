@@ -1,48 +1,94 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
+from sqlalchemy import text
 
 from app.api.v1.api import api_router
+from app.api.v1.routers.chat import CHAT_SOURCE_HEADER
 from app.api.health import router as health_router
 from app.api.webhooks import router as webhooks_router
 from app.ui.web import router as ui_router
 from app.ui.auth_routes import auth_ui_router
 from app.core.config import settings
+from app.core.request_id import (
+    REQUEST_ID_HEADER,
+    RequestIdMiddleware,
+    install_log_record_factory,
+)
+from app.db.partitions import ensure_chat_log_partitions, run_partition_maintenance
 from app.db.session import engine
+from app.db.tenant_stats import ensure_tenant_stats_view, run_tenant_stats_refresh
+from app.services.email_service import email_service
+from app.services.http_client import close_http_client
+from app.services.llm_client import close_llm_client
+
+logger = logging.getLogger(__name__)
+install_log_record_factory()
+# Without a root handler the app's INFO records (startup, shutdown, sends)
+# are dropped; uvicorn only configures its own loggers.
+logging.basicConfig(
+    level=settings.log_level.upper(),
+    format="%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s",
+)
 
 
-def _parse_cors_origins(value: str) -> list[str]:
+@lru_cache(maxsize=8)
+def _parse_cors_origins(value: str) -> tuple[str, ...]:
     raw = (value or "").strip()
     if not raw:
-        return []
+        return ()
     if raw == "*":
-        return ["*"]
-    return [o.strip() for o in raw.split(",") if o.strip()]
+        return ("*",)
+    return tuple(o for o in (s.strip() for s in raw.split(",")) if o)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Ensure models are imported before creating tables.
     import app.models  # noqa: F401
-    from app.models.base import Base
+    from app.models.base import REQUIRED_EXTENSIONS, Base
 
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        for extension in REQUIRED_EXTENSIONS:
+            await conn.execute(text(f"CREATE EXTENSION IF NOT EXISTS {extension}"))
+        # Views (e.g. tenant_stats) are mapped for reads but created below.
+        tables = [t for t in Base.metadata.sorted_tables if not t.info.get("is_view")]
+        await conn.run_sync(Base.metadata.create_all, tables=tables)
+        await ensure_chat_log_partitions(conn)
+        await ensure_tenant_stats_view(conn)
 
     # Auto-create super admin if none exists
     await _create_default_super_admin()
 
-    yield
+    background_tasks = [
+        asyncio.create_task(run_partition_maintenance()),
+        asyncio.create_task(run_tenant_stats_refresh()),
+    ]
+    try:
+        yield
+    finally:
+        for task in background_tasks:
+            task.cancel()
+        # Let them unwind before their engine and clients go away.
+        await asyncio.gather(*background_tasks, return_exceptions=True)
+        await close_llm_client()
+        await email_service.close()
+        await close_http_client()
+        await engine.dispose()
 
 
 async def _create_default_super_admin():
     """Create a default super admin if none exists (for fresh deployments)."""
     import os
+    from sqlalchemy.exc import IntegrityError
     from app.db.session import async_session_maker
     from app.crud.user import count_super_admins, create_super_admin, get_user_by_email
 
@@ -56,33 +102,38 @@ async def _create_default_super_admin():
         admin_password = os.getenv("ADMIN_PASSWORD", "")
 
     if not admin_password:
-        print("⚠️  No SUPER_ADMIN_PASSWORD set, skipping auto-creation of super admin")
+        logger.warning(
+            "No SUPER_ADMIN_PASSWORD set, skipping auto-creation of super admin"
+        )
         return
 
-    try:
-        async with async_session_maker() as session:
-            # Check if super admin already exists
-            existing_count = await count_super_admins(session)
-            if existing_count > 0:
-                print(f"✓ Super admin already exists ({existing_count} found)")
-                return
-
-            # Check if email is already used
-            existing_user = await get_user_by_email(session, admin_email)
-            if existing_user:
-                print(f"✓ User with email {admin_email} already exists")
-                return
-
-            # Create super admin
+    async with async_session_maker() as session:
+        # Check if super admin already exists
+        existing_count = await count_super_admins(session)
+        if existing_count > 0:
+            logger.info("Super admin already exists (%d found)", existing_count)
+            return
+
+        # Check if email is already used
+        existing_user = await get_user_by_email(session, admin_email)
+        if existing_user:
+            logger.info("User with email %s already exists", admin_email)
+            return
+
+        # Create super admin. Another worker starting at the same time may
+        # win the race on the unique email; that is not an error.
+        try:
             user = await create_super_admin(
                 session,
                 email=admin_email,
                 password=admin_password,
                 full_name=admin_name,
             )
-            print(f"✅ Super Admin created: {user.email}")
-    except Exception as e:
-        print(f"⚠️  Could not create super admin: {e}")
+        except IntegrityError:
+            await session.rollback()
+            logger.info("Super admin %s was created by another worker", admin_email)
+            return
+        logger.info("Super Admin created: %s", user.email)
 
 
 app = FastAPI(title="RoboVAI Multi-Tenant Chatbot", lifespan=lifespan)
@@ -107,11 +158,13 @@ allow_credentials = False if "*" in origins else True
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=origins or [],
+    allow_origins=origins,
     allow_credentials=allow_credentials,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[REQUEST_ID_HEADER, CHAT_SOURCE_HEADER],
 )
+app.add_middleware(RequestIdMiddleware)
 
 # Mount API router with /api prefix so paths are /api/v1/...
 app.include_router(api_router, prefix="/api")
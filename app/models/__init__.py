@@ -9,6 +9,7 @@ from app.models.message_template import MessageTemplate, TemplateCategory
 from app.models.knowledge_base import KnowledgeBase
 from app.models.broadcast import Broadcast, BroadcastStatus
 from app.models.flow import Flow
+from app.models.tenant_stats import TenantStats
 from app.models.user import User, UserRole
 
 __all__ = [
@@ -27,6 +28,7 @@ __all__ = [
     "Broadcast",
     "BroadcastStatus",
     "Flow",
+    "TenantStats",
     "User",
     "UserRole",
 ]
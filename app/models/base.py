@@ -2,8 +2,18 @@ from __future__ import annotations
 
 from sqlalchemy.orm import DeclarativeBase
 
+# Postgres extensions the schema relies on (created before create_all).
+# btree_gin: lets GIN indexes combine scalar columns with tsvector/jsonb.
+# pg_trgm: trigram GIN indexes for substring (ILIKE '%...%') search.
+REQUIRED_EXTENSIONS: tuple[str, ...] = ("btree_gin", "pg_trgm")
+
 
 class Base(DeclarativeBase):
-    """Base class for all SQLAlchemy models."""
+    """Base class for all SQLAlchemy models.
+
+    Mapped classes cannot use ``__slots__``: SQLAlchemy keeps per-instance
+    state and loaded attribute values in ``__dict__``. Hot read paths that
+    touch many rows should select column tuples instead of full entities.
+    """
 
     pass
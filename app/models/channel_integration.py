@@ -13,6 +13,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -50,8 +51,8 @@ class ChannelIntegration(Base):
     # Access token / secret used to send messages back to the platform.
     access_token: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    # Verification token used during webhook setup.
-    verify_token: Mapped[str] = mapped_column(String(128), nullable=False, index=True)
+    # Verification token used during webhook setup (indexed for active rows only).
+    verify_token: Mapped[str] = mapped_column(String(128), nullable=False)
 
     is_active: Mapped[bool] = mapped_column(
         Boolean, nullable=False, server_default="true"
@@ -70,4 +71,9 @@ class ChannelIntegration(Base):
             "channel_type", "external_id", name="uq_channel_type_external_id"
         ),
         Index("ix_channel_integrations_tenant_type", "tenant_id", "channel_type"),
+        Index(
+            "ix_channel_integrations_verify_token_active",
+            "verify_token",
+            postgresql_where=text("is_active"),
+        ),
     )
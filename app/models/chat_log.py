@@ -3,7 +3,16 @@ from __future__ import annotations
 import datetime as dt
 import enum
 
-from sqlalchemy import BigInteger, DateTime, Enum, ForeignKey, Index, Text, func
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -15,10 +24,25 @@ class SenderType(str, enum.Enum):
 
 
 class ChatLog(Base):
+    """Chat message, stored in a table range-partitioned by month on timestamp.
+
+    Partitions are created by ``app.db.partitions``; the partition key has to
+    be part of the primary key, hence (id, timestamp).
+    """
+
     __tablename__ = "chat_logs"
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
 
+    # Denormalized from the lead so tenant-scoped queries skip the join;
+    # messages never move between tenants, so it is only set on insert.
+    tenant_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # Plain lead_id index kept for the ON DELETE CASCADE from leads.
     lead_id: Mapped[int] = mapped_column(
         BigInteger,
         ForeignKey("leads.id", ondelete="CASCADE"),
@@ -29,16 +53,37 @@ class ChatLog(Base):
     message: Mapped[str] = mapped_column(Text, nullable=False)
 
     sender_type: Mapped[SenderType] = mapped_column(
-        Enum(SenderType, name="sender_type"),
+        Enum(
+            SenderType,
+            name="sender_type",
+            native_enum=False,
+            create_constraint=True,
+            length=16,
+        ),
         nullable=False,
     )
 
     timestamp: Mapped[dt.datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
         server_default=func.now(),
     )
 
     lead = relationship("Lead", back_populates="chat_logs")
 
-    __table_args__ = (Index("ix_chat_logs_lead_ts", "lead_id", "timestamp"),)
+    __table_args__ = (
+        # Every index leads with tenant_id so tenant-scoped reads are single
+        # range scans (and colocate if the table is ever sharded by tenant).
+        # Conversation reads scan newest-first; message bodies stay out of the
+        # index because long texts would exceed the btree row size limit.
+        Index(
+            "ix_chat_logs_tenant_lead_ts",
+            "tenant_id",
+            "lead_id",
+            text("timestamp DESC"),
+            postgresql_include=["sender_type"],
+        ),
+        Index("ix_chat_logs_tenant_ts", "tenant_id", "timestamp", "sender_type"),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
@@ -35,4 +35,12 @@ class Flow(Base):
 
     tenant = relationship("Tenant", back_populates="flows")
 
-    __table_args__ = (Index("ix_flows_tenant_trigger", "tenant_id", "trigger_keyword"),)
+    __table_args__ = (
+        Index("ix_flows_tenant_trigger", "tenant_id", "trigger_keyword"),
+        Index(
+            "ix_flows_flow_data_gin",
+            "flow_data",
+            postgresql_using="gin",
+            postgresql_ops={"flow_data": "jsonb_path_ops"},
+        ),
+    )
@@ -2,7 +2,17 @@ from __future__ import annotations
 
 import datetime as dt
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, String, Text, func
+from sqlalchemy import (
+    BigInteger,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -25,6 +35,17 @@ class KnowledgeBase(Base):
 
     is_active: Mapped[bool] = mapped_column(default=True, nullable=False)
 
+    # Maintained by Postgres; deferred so normal loads don't fetch it.
+    search_tsv: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(content, ''))",
+            persisted=True,
+        ),
+        nullable=True,
+        deferred=True,
+    )
+
     created_at: Mapped[dt.datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -39,3 +60,8 @@ class KnowledgeBase(Base):
     )
 
     tenant = relationship("Tenant", backref="knowledge_base_items")
+
+    __table_args__ = (
+        Index("ix_kb_tsv", "search_tsv", postgresql_using="gin"),
+        Index("ix_kb_tenant_tsv", "tenant_id", "search_tsv", postgresql_using="gin"),
+    )
@@ -3,7 +3,17 @@ from __future__ import annotations
 import datetime as dt
 from typing import Any
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, String, Text, func
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    event,
+    func,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,6 +22,9 @@ from app.models.base import Base
 
 class Lead(Base):
     __tablename__ = "leads"
+    # Fetch server defaults (flow_context, created_at) via RETURNING on flush,
+    # so a lead that is flushed but not yet committed is fully usable.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
 
@@ -43,16 +56,58 @@ class Lead(Base):
         server_default=func.now(),
     )
 
-    tenant = relationship("Tenant", back_populates="leads")
+    # lazy="raise": load these explicitly (joinedload/selectinload) so a
+    # listing can never fall into 1 + N lazy loads.
+    tenant = relationship("Tenant", back_populates="leads", lazy="raise")
 
     chat_logs = relationship(
         "ChatLog",
         back_populates="lead",
         cascade="all, delete-orphan",
         passive_deletes=True,
+        lazy="raise",
     )
 
     __table_args__ = (
         Index("ix_leads_tenant_created_at", "tenant_id", "created_at"),
         Index("ix_leads_tenant_phone", "tenant_id", "phone_number"),
+        Index(
+            "ix_leads_flow_context_gin",
+            "flow_context",
+            postgresql_using="gin",
+            postgresql_ops={"flow_context": "jsonb_path_ops"},
+        ),
+        # Tenant-scoped substring search (see crud.lead.list_leads).
+        Index(
+            "ix_leads_tenant_name_trgm",
+            "tenant_id",
+            "customer_name",
+            postgresql_using="gin",
+            postgresql_ops={"customer_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_leads_tenant_phone_trgm",
+            "tenant_id",
+            "phone_number",
+            postgresql_using="gin",
+            postgresql_ops={"phone_number": "gin_trgm_ops"},
+        ),
     )
+
+
+# summary / flow_context are the wide, rarely-read columns: compress them with
+# lz4 (cheaper to decompress than pglz). Needs Postgres 14+ built with lz4;
+# otherwise the default codec stays.
+event.listen(
+    Lead.__table__,
+    "after_create",
+    DDL(
+        "DO $$ BEGIN "
+        "EXECUTE 'ALTER TABLE %(table)s "
+        "ALTER COLUMN summary SET COMPRESSION lz4, "
+        "ALTER COLUMN flow_context SET COMPRESSION lz4'; "
+        "EXCEPTION WHEN feature_not_supported OR syntax_error THEN "
+        "RAISE NOTICE 'lz4 compression unavailable, keeping default'; "
+        "END $$"
+    ).execute_if(dialect="postgresql"),
+)
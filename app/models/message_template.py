@@ -36,7 +36,13 @@ class MessageTemplate(Base):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
 
     category: Mapped[TemplateCategory] = mapped_column(
-        Enum(TemplateCategory, name="template_category"),
+        Enum(
+            TemplateCategory,
+            name="template_category",
+            native_enum=False,
+            create_constraint=True,
+            length=16,
+        ),
         nullable=False,
         default=TemplateCategory.general,
     )
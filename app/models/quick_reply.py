@@ -11,6 +11,7 @@ from sqlalchemy import (
     Integer,
     String,
     func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -47,6 +48,12 @@ class QuickReply(Base):
     tenant = relationship("Tenant", back_populates="quick_replies")
 
     __table_args__ = (
-        Index("ix_quick_replies_tenant_active", "tenant_id", "is_active"),
         Index("ix_quick_replies_tenant_order", "tenant_id", "sort_order", "id"),
+        Index(
+            "ix_quick_replies_tenant_order_active",
+            "tenant_id",
+            "sort_order",
+            "id",
+            postgresql_where=text("is_active"),
+        ),
     )
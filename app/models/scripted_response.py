@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import BigInteger, Boolean, ForeignKey, Index, String, Text
+from sqlalchemy import BigInteger, Boolean, ForeignKey, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -35,8 +35,9 @@ class ScriptedResponse(Base):
             "trigger_keyword",
         ),
         Index(
-            "ix_scripted_responses_tenant_active",
+            "ix_scripted_responses_tenant_id_active",
             "tenant_id",
-            "is_active",
+            "id",
+            postgresql_where=text("is_active"),
         ),
     )
@@ -43,6 +43,7 @@ class Tenant(Base):
         back_populates="tenant",
         cascade="all, delete-orphan",
         passive_deletes=True,
+        lazy="raise",
     )
 
     leads = relationship(
@@ -50,12 +51,14 @@ class Tenant(Base):
         back_populates="tenant",
         cascade="all, delete-orphan",
         passive_deletes=True,
+        lazy="raise",
     )
     flows = relationship(
         "Flow",
         back_populates="tenant",
         cascade="all, delete-orphan",
         passive_deletes=True,
+        lazy="raise",
     )
     message_templates = relationship(
         "MessageTemplate",
@@ -70,4 +73,12 @@ class Tenant(Base):
         passive_deletes=True,
     )
 
-    __table_args__ = (Index("ix_tenants_name", "name"),)
+    __table_args__ = (
+        Index("ix_tenants_name", "name"),
+        Index(
+            "ix_tenants_branding_config_gin",
+            "branding_config",
+            postgresql_using="gin",
+            postgresql_ops={"branding_config": "jsonb_path_ops"},
+        ),
+    )
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import datetime as dt
+
+from sqlalchemy import BigInteger, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class TenantStats(Base):
+    """Read-only mapping of the tenant_stats materialized view.
+
+    The view is created by migrations / ``app.db.tenant_stats``, never by
+    ``create_all`` (see the ``is_view`` flag), and refreshed every minute.
+    """
+
+    __tablename__ = "tenant_stats"
+    __table_args__ = {"info": {"is_view": True}}
+
+    tenant_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+
+    leads_total: Mapped[int] = mapped_column(BigInteger)
+    leads_today: Mapped[int] = mapped_column(BigInteger)
+    leads_7d: Mapped[int] = mapped_column(BigInteger)
+
+    messages_total: Mapped[int] = mapped_column(BigInteger)
+    user_messages: Mapped[int] = mapped_column(BigInteger)
+    bot_messages: Mapped[int] = mapped_column(BigInteger)
+    messages_today: Mapped[int] = mapped_column(BigInteger)
+    messages_7d: Mapped[int] = mapped_column(BigInteger)
+
+    refreshed_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True))
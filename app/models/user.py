@@ -28,13 +28,45 @@ if TYPE_CHECKING:
 
 
 class UserRole(str, enum.Enum):
-    """User roles for RBAC"""
+    """User roles for RBAC.
+
+    Each member carries its hierarchy ``level`` (higher = more rights) next
+    to the stored string value, so role checks are a single int compare.
+    """
+
+    level: int
+
+    def __new__(cls, value: str, level: int) -> UserRole:
+        member = str.__new__(cls, value)
+        member._value_ = value
+        member.level = level
+        return member
+
+    SUPER_ADMIN = "super_admin", 5  # Platform owner - full access
+    ADMIN = "admin", 4  # Tenant admin - full tenant access
+    MANAGER = "manager", 3  # Can manage team & settings
+    AGENT = "agent", 2  # Can handle chats & leads
+    VIEWER = "viewer", 1  # Read-only access
 
-    SUPER_ADMIN = "super_admin"  # Platform owner - full access
-    ADMIN = "admin"  # Tenant admin - full tenant access
-    MANAGER = "manager"  # Can manage team & settings
-    AGENT = "agent"  # Can handle chats & leads
-    VIEWER = "viewer"  # Read-only access
+
+# Stored values of the userrole pg enum (lowercase values, not member names).
+_USER_ROLE_VALUES: tuple[str, ...] = tuple(r.value for r in UserRole)
+
+
+# Capability bits; each role maps to the OR of what it may do.
+MANAGE_USERS = 1 << 0
+MANAGE_SETTINGS = 1 << 1
+HANDLE_CHATS = 1 << 2
+MANAGE_TENANTS = 1 << 3
+ALL_CAPS = MANAGE_USERS | MANAGE_SETTINGS | HANDLE_CHATS | MANAGE_TENANTS
+
+ROLE_CAPS: dict[UserRole, int] = {
+    UserRole.SUPER_ADMIN: ALL_CAPS,
+    UserRole.ADMIN: MANAGE_USERS | MANAGE_SETTINGS | HANDLE_CHATS,
+    UserRole.MANAGER: MANAGE_USERS | MANAGE_SETTINGS | HANDLE_CHATS,
+    UserRole.AGENT: HANDLE_CHATS,
+    UserRole.VIEWER: 0,
+}
 
 
 class User(Base):
@@ -65,7 +97,7 @@ class User(Base):
         Enum(
             UserRole,
             native_enum=True,
-            values_callable=lambda obj: [e.value for e in obj],
+            values_callable=lambda _enum: _USER_ROLE_VALUES,
         ),
         nullable=False,
         default=UserRole.AGENT,
@@ -123,27 +155,26 @@ class User(Base):
         """Check if user is super admin (platform owner)"""
         return self.role == UserRole.SUPER_ADMIN
 
+    def has_caps(self, caps: int) -> bool:
+        """Check that the user's role grants all of ``caps``."""
+        return ROLE_CAPS[self.role] & caps == caps
+
     @property
     def can_manage_tenants(self) -> bool:
         """Check if user can create/manage tenants"""
-        return self.role in (UserRole.SUPER_ADMIN,)
+        return self.has_caps(MANAGE_TENANTS)
 
     @property
     def can_manage_users(self) -> bool:
         """Check if user can manage other users"""
-        return self.role in (UserRole.SUPER_ADMIN, UserRole.ADMIN, UserRole.MANAGER)
+        return self.has_caps(MANAGE_USERS)
 
     @property
     def can_manage_settings(self) -> bool:
         """Check if user can manage tenant settings"""
-        return self.role in (UserRole.SUPER_ADMIN, UserRole.ADMIN, UserRole.MANAGER)
+        return self.has_caps(MANAGE_SETTINGS)
 
     @property
     def can_handle_chats(self) -> bool:
         """Check if user can handle customer chats"""
-        return self.role in (
-            UserRole.SUPER_ADMIN,
-            UserRole.ADMIN,
-            UserRole.MANAGER,
-            UserRole.AGENT,
-        )
+        return self.has_caps(HANDLE_CHATS)
@@ -4,42 +4,86 @@ Authentication schemas for request/response validation.
 
 from __future__ import annotations
 
+import re
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
 
 from app.models.user import UserRole
 
 
+def _password_classes(v: str) -> tuple[bool, bool, bool]:
+    """(has_upper, has_lower, has_digit) in a single pass over the password."""
+    has_upper = has_lower = has_digit = False
+    for c in v:
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+        else:
+            continue
+        if has_upper and has_lower and has_digit:
+            break
+    return has_upper, has_lower, has_digit
+
+
+def _validate_strong_password(v: str) -> str:
+    has_upper, has_lower, has_digit = _password_classes(v)
+    if not has_upper:
+        raise ValueError("كلمة المرور يجب أن تحتوي على حرف كبير واحد على الأقل")
+    if not has_lower:
+        raise ValueError("كلمة المرور يجب أن تحتوي على حرف صغير واحد على الأقل")
+    if not has_digit:
+        raise ValueError("كلمة المرور يجب أن تحتوي على رقم واحد على الأقل")
+    return v
+
+
+# Syntax-only check (one @, no whitespace, dotted domain); deliverability is
+# proven by the verification email, not at parse time.
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+def _validate_email(v: str) -> str:
+    if not _EMAIL_RE.fullmatch(v):
+        raise ValueError("البريد الإلكتروني غير صالح")
+    return v
+
+
+Email = Annotated[str, Field(max_length=254), AfterValidator(_validate_email)]
+
+
+# Shared by every model that sets a password, so pydantic builds one validator.
+StrongPassword = Annotated[
+    str,
+    Field(min_length=8, max_length=128),
+    AfterValidator(_validate_strong_password),
+]
+
+# Response models build their core schema on first use rather than at class
+# creation, so importing this module (e.g. from workers/scripts) stays cheap.
+_RESPONSE_CONFIG = ConfigDict(defer_build=True)
+
+
 # ==================== Registration ====================
 
 
 class UserRegisterRequest(BaseModel):
     """Schema for user registration"""
 
-    email: EmailStr
-    password: str = Field(..., min_length=8, max_length=128)
+    email: Email
+    password: StrongPassword
     full_name: str = Field(..., min_length=2, max_length=255)
     phone: Optional[str] = Field(None, max_length=50)
 
-    @field_validator("password")
-    @classmethod
-    def validate_password(cls, v: str) -> str:
-        if len(v) < 8:
-            raise ValueError("كلمة المرور يجب أن تكون 8 أحرف على الأقل")
-        if not any(c.isupper() for c in v):
-            raise ValueError("كلمة المرور يجب أن تحتوي على حرف كبير واحد على الأقل")
-        if not any(c.islower() for c in v):
-            raise ValueError("كلمة المرور يجب أن تحتوي على حرف صغير واحد على الأقل")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("كلمة المرور يجب أن تحتوي على رقم واحد على الأقل")
-        return v
-
 
 class UserRegisterResponse(BaseModel):
     """Response after successful registration"""
 
+    model_config = _RESPONSE_CONFIG
+
     id: int
     email: str
     full_name: str
@@ -52,7 +96,7 @@ class UserRegisterResponse(BaseModel):
 class UserLoginRequest(BaseModel):
     """Schema for user login"""
 
-    email: EmailStr
+    email: Email
     password: str
     remember_me: bool = False
 
@@ -60,6 +104,8 @@ class UserLoginRequest(BaseModel):
 class TokenResponse(BaseModel):
     """JWT token response"""
 
+    model_config = _RESPONSE_CONFIG
+
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
@@ -69,6 +115,8 @@ class TokenResponse(BaseModel):
 class UserLoginResponse(BaseModel):
     """Response after successful login"""
 
+    model_config = _RESPONSE_CONFIG
+
     user: "UserProfile"
     tokens: TokenResponse
     message: str = "تم تسجيل الدخول بنجاح"
@@ -80,6 +128,8 @@ class UserLoginResponse(BaseModel):
 class UserProfile(BaseModel):
     """User profile data"""
 
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
     id: int
     email: str
     full_name: str
@@ -93,9 +143,6 @@ class UserProfile(BaseModel):
     created_at: datetime
     last_login: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
-
 
 class UserProfileUpdate(BaseModel):
     """Schema for updating user profile"""
@@ -112,40 +159,20 @@ class PasswordChangeRequest(BaseModel):
     """Schema for changing password"""
 
     current_password: str
-    new_password: str = Field(..., min_length=8, max_length=128)
-
-    @field_validator("new_password")
-    @classmethod
-    def validate_new_password(cls, v: str) -> str:
-        if len(v) < 8:
-            raise ValueError("كلمة المرور يجب أن تكون 8 أحرف على الأقل")
-        if not any(c.isupper() for c in v):
-            raise ValueError("كلمة المرور يجب أن تحتوي على حرف كبير واحد على الأقل")
-        if not any(c.islower() for c in v):
-            raise ValueError("كلمة المرور يجب أن تحتوي على حرف صغير واحد على الأقل")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("كلمة المرور يجب أن تحتوي على رقم واحد على الأقل")
-        return v
+    new_password: StrongPassword
 
 
 class PasswordResetRequest(BaseModel):
     """Schema for requesting password reset"""
 
-    email: EmailStr
+    email: Email
 
 
 class PasswordResetConfirm(BaseModel):
     """Schema for confirming password reset with token"""
 
     token: str
-    new_password: str = Field(..., min_length=8, max_length=128)
-
-    @field_validator("new_password")
-    @classmethod
-    def validate_new_password(cls, v: str) -> str:
-        if len(v) < 8:
-            raise ValueError("كلمة المرور يجب أن تكون 8 أحرف على الأقل")
-        return v
+    new_password: StrongPassword
 
 
 # ==================== Email Verification ====================
@@ -160,7 +187,7 @@ class EmailVerificationRequest(BaseModel):
 class ResendVerificationRequest(BaseModel):
     """Schema for resending verification email"""
 
-    email: EmailStr
+    email: Email
 
 
 # ==================== User Management (Admin) ====================
@@ -169,8 +196,8 @@ class ResendVerificationRequest(BaseModel):
 class UserCreateRequest(BaseModel):
     """Schema for admin creating a user"""
 
-    email: EmailStr
-    password: str = Field(..., min_length=8, max_length=128)
+    email: Email
+    password: StrongPassword
     full_name: str = Field(..., min_length=2, max_length=255)
     phone: Optional[str] = Field(None, max_length=50)
     role: UserRole = UserRole.AGENT
@@ -182,7 +209,7 @@ class UserCreateRequest(BaseModel):
 class UserUpdateRequest(BaseModel):
     """Schema for admin updating a user"""
 
-    email: Optional[EmailStr] = None
+    email: Optional[Email] = None
     full_name: Optional[str] = Field(None, min_length=2, max_length=255)
     phone: Optional[str] = Field(None, max_length=50)
     role: Optional[UserRole] = None
@@ -194,6 +221,8 @@ class UserUpdateRequest(BaseModel):
 class UserListResponse(BaseModel):
     """Response for listing users"""
 
+    model_config = _RESPONSE_CONFIG
+
     users: list[UserProfile]
     total: int
     page: int
@@ -207,7 +236,7 @@ class UserListResponse(BaseModel):
 class InviteUserRequest(BaseModel):
     """Schema for inviting a new user"""
 
-    email: EmailStr
+    email: Email
     full_name: str = Field(..., min_length=2, max_length=255)
     role: UserRole = UserRole.AGENT
     tenant_id: Optional[int] = None
@@ -217,7 +246,7 @@ class AcceptInvitationRequest(BaseModel):
     """Schema for accepting an invitation"""
 
     token: str
-    password: str = Field(..., min_length=8, max_length=128)
+    password: StrongPassword
 
 
 # Forward reference update
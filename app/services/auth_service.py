@@ -8,8 +8,11 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from typing import Optional
 import logging
+import time
 
-from jose import JWTError, jwt
+import jwt
+from cachetools import TLRUCache
+from fastapi import BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -46,7 +49,14 @@ logger = logging.getLogger(__name__)
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
+REMEMBER_ME_REFRESH_TOKEN_EXPIRE_DAYS = 30
 
+# Per-call constants, built once at import.
+_SECRET_KEY = settings.secret_key
+_ACCESS_TOKEN_TTL = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+_REFRESH_TOKEN_TTL = timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+_REMEMBER_ME_REFRESH_TOKEN_TTL = timedelta(days=REMEMBER_ME_REFRESH_TOKEN_EXPIRE_DAYS)
+_ACCESS_TOKEN_TTL_SECONDS = int(_ACCESS_TOKEN_TTL.total_seconds())
 
 class AuthError(Exception):
     """Authentication error with user-friendly message."""
@@ -67,20 +77,16 @@ def create_access_token(
     expires_delta: Optional[timedelta] = None,
 ) -> str:
     """Create JWT access token."""
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-
+    now = datetime.utcnow()
     to_encode = {
         "sub": str(user_id),
         "role": role.value,
         "tenant_id": tenant_id,
         "type": "access",
-        "exp": expire,
-        "iat": datetime.utcnow(),
+        "exp": now + (expires_delta or _ACCESS_TOKEN_TTL),
+        "iat": now,
     }
-    return jwt.encode(to_encode, settings.secret_key, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, _SECRET_KEY, algorithm=ALGORITHM)
 
 
 def create_refresh_token(
@@ -88,18 +94,14 @@ def create_refresh_token(
     expires_delta: Optional[timedelta] = None,
 ) -> str:
     """Create JWT refresh token."""
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-
+    now = datetime.utcnow()
     to_encode = {
         "sub": str(user_id),
         "type": "refresh",
-        "exp": expire,
-        "iat": datetime.utcnow(),
+        "exp": now + (expires_delta or _REFRESH_TOKEN_TTL),
+        "iat": now,
     }
-    return jwt.encode(to_encode, settings.secret_key, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, _SECRET_KEY, algorithm=ALGORITHM)
 
 
 def create_token_pair(
@@ -107,38 +109,55 @@ def create_token_pair(
     remember_me: bool = False,
 ) -> TokenResponse:
     """Create access + refresh token pair."""
-    access_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    refresh_expires = timedelta(days=30 if remember_me else REFRESH_TOKEN_EXPIRE_DAYS)
-
     access_token = create_access_token(
         user_id=user.id,
         role=user.role,
         tenant_id=user.tenant_id,
-        expires_delta=access_expires,
+        expires_delta=_ACCESS_TOKEN_TTL,
     )
 
     refresh_token = create_refresh_token(
         user_id=user.id,
-        expires_delta=refresh_expires,
+        expires_delta=(
+            _REMEMBER_ME_REFRESH_TOKEN_TTL if remember_me else _REFRESH_TOKEN_TTL
+        ),
     )
 
     return TokenResponse(
         access_token=access_token,
         refresh_token=refresh_token,
         token_type="bearer",
-        expires_in=int(access_expires.total_seconds()),
+        expires_in=_ACCESS_TOKEN_TTL_SECONDS,
     )
 
 
 # ==================== Token Verification ====================
 
+# Decoded payloads of recently seen tokens. An entry lives for at most a
+# minute and never past the token's own exp, so expiry is still enforced.
+_DECODED_TOKEN_MAX_AGE_SECONDS = 60
+
+
+def _decoded_token_ttu(_token: str, payload: dict, now: float) -> float:
+    remaining = payload["exp"] - time.time()
+    return now + min(_DECODED_TOKEN_MAX_AGE_SECONDS, remaining)
+
+
+_decoded_tokens: TLRUCache[str, dict] = TLRUCache(
+    maxsize=10_000, ttu=_decoded_token_ttu
+)
+
 
 def decode_token(token: str) -> dict:
     """Decode and verify JWT token."""
+    payload = _decoded_tokens.get(token)
+    if payload is not None:
+        return payload
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, _SECRET_KEY, algorithms=[ALGORITHM])
+        _decoded_tokens[token] = payload
         return payload
-    except JWTError as e:
+    except jwt.PyJWTError:
         raise AuthError("رمز غير صالح أو منتهي الصلاحية", "INVALID_TOKEN")
 
 
@@ -158,6 +177,53 @@ def verify_refresh_token(token: str) -> dict:
     return payload
 
 
+# ==================== Email Delivery ====================
+
+
+async def _deliver_verification_email(
+    to_email: str, verification_url: str, user_name: Optional[str]
+) -> bool:
+    """Send the verification email, logging the outcome; never raises."""
+    try:
+        email_sent = await email_service.send_verification_email(
+            to_email=to_email,
+            verification_url=verification_url,
+            user_name=user_name,
+        )
+        if email_sent:
+            logger.info("✅ Verification email sent to %s", to_email)
+        else:
+            logger.warning("⚠️ Could not send verification email to %s", to_email)
+            logger.info("[DEV] Verification URL: %s", verification_url)
+        return email_sent
+    except Exception as e:
+        logger.error("❌ Failed to send verification email: %s", e)
+        logger.info("[DEV] Verification URL: %s", verification_url)
+        return False
+
+
+async def _deliver_password_reset_email(
+    to_email: str, reset_url: str, user_name: Optional[str]
+) -> bool:
+    """Send the password reset email, logging the outcome; never raises."""
+    try:
+        email_sent = await email_service.send_password_reset_email(
+            to_email=to_email,
+            reset_url=reset_url,
+            user_name=user_name,
+        )
+        if email_sent:
+            logger.info("✅ Password reset email sent to %s", to_email)
+        else:
+            logger.warning("⚠️ Could not send password reset email to %s", to_email)
+            logger.info("[DEV] Password reset URL: %s", reset_url)
+        return email_sent
+    except Exception as e:
+        logger.error("❌ Failed to send password reset email: %s", e)
+        logger.info("[DEV] Password reset URL: %s", reset_url)
+        return False
+
+
 # ==================== Authentication Services ====================
 
 
@@ -168,8 +234,13 @@ async def register_user(
     role: UserRole = UserRole.AGENT,
     auto_verify: bool = True,  # Changed default to True to bypass email verification
     base_url: Optional[str] = None,
+    background_tasks: Optional[BackgroundTasks] = None,
 ) -> UserRegisterResponse:
-    """Register a new user and send verification email."""
+    """Register a new user and send verification email.
+
+    With ``background_tasks`` the email goes out after the response is sent
+    and is reported as sent; the outcome is only logged.
+    """
     # Check if email exists
     if await user_exists(session, data.email):
         raise AuthError("البريد الإلكتروني مسجل مسبقاً", "EMAIL_EXISTS")
@@ -196,20 +267,12 @@ async def register_user(
         verification_url = f"{app_base_url.rstrip('/')}/ui/auth/verify-email?token={token}"
         
         # Send verification email
-        try:
-            email_sent = await email_service.send_verification_email(
-                to_email=user.email,
-                verification_url=verification_url,
-                user_name=user.full_name,
-            )
-            if email_sent:
-                logger.info(f"✅ Verification email sent to {user.email}")
-            else:
-                logger.warning(f"⚠️ Could not send verification email to {user.email}")
-                logger.info(f"[DEV] Verification URL: {verification_url}")
-        except Exception as e:
-            logger.error(f"❌ Failed to send verification email: {e}")
-            logger.info(f"[DEV] Verification URL: {verification_url}")
+        email_args = (user.email, verification_url, user.full_name)
+        if background_tasks is not None:
+            background_tasks.add_task(_deliver_verification_email, *email_args)
+            email_sent = True
+        else:
+            email_sent = await _deliver_verification_email(*email_args)
 
     message = "تم التسجيل بنجاح!"
     if auto_verify:
@@ -311,6 +374,7 @@ async def request_password_reset(
     session: AsyncSession,
     email: str,
     base_url: Optional[str] = None,
+    background_tasks: Optional[BackgroundTasks] = None,
 ) -> str:
     """Request password reset - sends email with reset link."""
     user = await get_user_by_email(session, email)
@@ -326,21 +390,12 @@ async def request_password_reset(
     reset_url = f"{app_base_url.rstrip('/')}/ui/auth/reset-password?token={token}"
     
     # Send password reset email
-    try:
-        email_sent = await email_service.send_password_reset_email(
-            to_email=user.email,
-            reset_url=reset_url,
-            user_name=user.full_name,
-        )
-        if email_sent:
-            logger.info(f"✅ Password reset email sent to {user.email}")
-        else:
-            logger.warning(f"⚠️ Could not send password reset email to {user.email}")
-            logger.info(f"[DEV] Password reset URL: {reset_url}")
-    except Exception as e:
-        logger.error(f"❌ Failed to send password reset email: {e}")
-        logger.info(f"[DEV] Password reset URL: {reset_url}")
-    
+    email_args = (user.email, reset_url, user.full_name)
+    if background_tasks is not None:
+        background_tasks.add_task(_deliver_password_reset_email, *email_args)
+    else:
+        await _deliver_password_reset_email(*email_args)
+
     return "إذا كان البريد الإلكتروني مسجلاً، ستصلك رسالة لإعادة تعيين كلمة المرور"
 
 
@@ -382,6 +437,7 @@ async def resend_verification(
     session: AsyncSession,
     email: str,
     base_url: Optional[str] = None,
+    background_tasks: Optional[BackgroundTasks] = None,
 ) -> str:
     """Resend verification email."""
     user = await get_user_by_email(session, email)
@@ -399,23 +455,16 @@ async def resend_verification(
     verification_url = f"{app_base_url.rstrip('/')}/ui/auth/verify-email?token={token}"
     
     # Send verification email
-    try:
-        email_sent = await email_service.send_verification_email(
-            to_email=user.email,
-            verification_url=verification_url,
-            user_name=user.full_name,
-        )
-        if email_sent:
-            logger.info(f"✅ Verification email resent to {user.email}")
-            return "تم إرسال رسالة التأكيد إلى بريدك الإلكتروني"
-        else:
-            logger.warning(f"⚠️ Could not resend verification email to {user.email}")
-            logger.info(f"[DEV] Verification URL: {verification_url}")
-            return "حدث خطأ في إرسال البريد. حاول مرة أخرى."
-    except Exception as e:
-        logger.error(f"❌ Failed to resend verification email: {e}")
-        logger.info(f"[DEV] Verification URL: {verification_url}")
-        return "حدث خطأ في إرسال البريد. حاول مرة أخرى."
+    email_args = (user.email, verification_url, user.full_name)
+    if background_tasks is not None:
+        background_tasks.add_task(_deliver_verification_email, *email_args)
+        email_sent = True
+    else:
+        email_sent = await _deliver_verification_email(*email_args)
+
+    if email_sent:
+        return "تم إرسال رسالة التأكيد إلى بريدك الإلكتروني"
+    return "حدث خطأ في إرسال البريد. حاول مرة أخرى."
 
 
 # ==================== Permission Checks ====================
@@ -431,17 +480,8 @@ def check_permission(
     if user.role == UserRole.SUPER_ADMIN:
         return True
 
-    # Role hierarchy
-    role_hierarchy = {
-        UserRole.SUPER_ADMIN: 5,
-        UserRole.ADMIN: 4,
-        UserRole.MANAGER: 3,
-        UserRole.AGENT: 2,
-        UserRole.VIEWER: 1,
-    }
-
     # Check role level
-    if role_hierarchy.get(user.role, 0) < role_hierarchy.get(required_role, 0):
+    if user.role.level < required_role.level:
         return False
 
     # Check tenant access
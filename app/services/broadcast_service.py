@@ -5,22 +5,68 @@ Handles sending broadcast messages to multiple channels.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.crud.broadcast import get_broadcast, update_broadcast_stats
+from app.crud.broadcast import bump_broadcast_counters, get_broadcast
 from app.crud.channel_integration import list_integrations_for_tenant
-from app.crud.lead import list_leads
+from app.crud.lead import iter_lead_phone_batches
+from app.db.bulk import bulk_copy_chat_logs
 from app.models.broadcast import BroadcastStatus
-from app.models.channel_integration import ChannelType
+from app.models.channel_integration import ChannelIntegration, ChannelType
+from app.models.chat_log import SenderType
 from app.services.telegram_service import send_telegram_message
 from app.services.meta_service import send_whatsapp_text, send_page_message_text
 
 logger = logging.getLogger(__name__)
 
+# Counter deltas are written to the broadcast row every this many recipients.
+COUNTER_FLUSH_EVERY = 100
+# Maximum number of recipients being sent to at the same time.
+SEND_CONCURRENCY = 50
+
+
+def _phone_channels(
+    integrations: list[ChannelIntegration],
+) -> list[ChannelIntegration]:
+    """Integrations that can deliver to a bare phone number, in try order.
+
+    Telegram needs a chat_id and Messenger/Instagram a recipient_id, which
+    leads don't carry yet, so only fully configured WhatsApp numbers remain.
+    """
+    return [
+        integ
+        for integ in integrations
+        if integ.channel_type == ChannelType.whatsapp
+        and integ.access_token
+        and integ.external_id
+    ]
+
+
+async def _send_to_phone(
+    phone_number: str,
+    message: str,
+    channels: list[ChannelIntegration],
+) -> bool:
+    """Try each channel until one delivers the message; True on success."""
+    for integ in channels:
+        try:
+            await send_whatsapp_text(
+                access_token=integ.access_token,
+                phone_number_id=integ.external_id,
+                to=phone_number,
+                text=message,
+            )
+            return True
+        except Exception as e:
+            logger.error("Failed to send via %s: %s", integ.channel_type, e)
+
+    return False
+
 
 async def execute_broadcast(
     session: AsyncSession,
@@ -32,102 +78,102 @@ async def execute_broadcast(
     """
     broadcast = await get_broadcast(session, broadcast_id)
     if not broadcast:
-        logger.error(f"Broadcast {broadcast_id} not found")
+        logger.error("Broadcast %s not found", broadcast_id)
         return {"sent": 0, "failed": 0}
 
-    if broadcast.status != BroadcastStatus.DRAFT:
-        logger.warning(f"Broadcast {broadcast_id} is not in DRAFT status")
+    if broadcast.status != BroadcastStatus.draft:
+        logger.warning("Broadcast %s is not in DRAFT status", broadcast_id)
         return {"sent": 0, "failed": 0}
 
     # Update status to SENDING
-    broadcast.status = BroadcastStatus.SENDING
-    broadcast.sent_at = datetime.utcnow()
+    broadcast.status = BroadcastStatus.sending
     session.add(broadcast)
     await session.commit()
 
-    # Get target audience
-    leads = await list_leads(
-        session=session,
-        tenant_id=broadcast.tenant_id,
-        page=1,
-        page_size=10000,  # TODO: Implement pagination for large broadcasts
-    )
-    target_leads = leads[0]  # list_leads returns (leads, total)
-
     # Get active channels
-    integrations = await list_integrations_for_tenant(
-        session=session,
-        tenant_id=broadcast.tenant_id,
-        active_only=True,
-    )
+    integrations = [
+        integ
+        for integ in await list_integrations_for_tenant(
+            session=session, tenant_id=broadcast.tenant_id
+        )
+        if integ.is_active
+    ]
 
     if not integrations:
-        logger.error(f"No active channels for tenant {broadcast.tenant_id}")
-        broadcast.status = BroadcastStatus.FAILED
+        logger.error("No active channels for tenant %s", broadcast.tenant_id)
+        broadcast.status = BroadcastStatus.failed
         await session.commit()
         return {"sent": 0, "failed": 0}
 
+    # Channel checks are per integration, so do them once, not per lead.
+    channels = _phone_channels(integrations)
+
     sent_count = 0
     failed_count = 0
-
-    # Send to each lead
-    for lead in target_leads:
-        if not lead.phone_number:
-            continue
-
-        # Try each channel until one succeeds
-        message_sent = False
-
-        for integ in integrations:
-            try:
-                if integ.channel_type == ChannelType.TELEGRAM and integ.access_token:
-                    # For Telegram, we need chat_id which we might not have
-                    # Skip for now or implement chat_id mapping
-                    continue
-
-                elif (
-                    integ.channel_type == ChannelType.WHATSAPP
-                    and integ.access_token
-                    and integ.external_id
-                ):
-                    await send_whatsapp_text(
-                        access_token=integ.access_token,
-                        phone_number_id=integ.external_id,
-                        to=lead.phone_number,
-                        text=broadcast.message_content,
-                    )
-                    message_sent = True
-                    break
-
-                elif (
-                    integ.channel_type in [ChannelType.MESSENGER, ChannelType.INSTAGRAM]
-                    and integ.access_token
-                ):
-                    # For Messenger/IG, we need recipient_id
-                    # Skip for now or implement recipient_id mapping
-                    continue
-
-            except Exception as e:
-                logger.error(f"Failed to send via {integ.channel_type}: {e}")
-                continue
-
-        if message_sent:
-            sent_count += 1
-        else:
-            failed_count += 1
-
-    # Update broadcast stats
-    broadcast.sent_count = sent_count
-    broadcast.failed_count = failed_count
+    # Deltas not yet written to the broadcast row.
+    pending_sent = 0
+    pending_failed = 0
+    # Delivered messages are recorded in the conversation history per page.
+    sent_logs: list[dict] = []
+
+    # Sends are independent I/O, so fan them out with bounded concurrency.
+    # Only this coroutine touches the session; senders just call the APIs.
+    semaphore = asyncio.Semaphore(SEND_CONCURRENCY)
+
+    async def send(lead_id: int, phone_number: str) -> tuple[int, bool]:
+        async with semaphore:
+            return lead_id, await _send_to_phone(
+                phone_number, broadcast.message, channels
+            )
+
+    # Target audience is streamed in pages instead of loaded up front.
+    async for batch in iter_lead_phone_batches(
+        session=session, tenant_id=broadcast.tenant_id
+    ):
+        for next_result in asyncio.as_completed([send(*lead) for lead in batch]):
+            lead_id, message_sent = await next_result
+
+            if message_sent:
+                sent_count += 1
+                pending_sent += 1
+                sent_logs.append(
+                    {
+                        "tenant_id": broadcast.tenant_id,
+                        "lead_id": lead_id,
+                        "message": broadcast.message,
+                        "sender_type": SenderType.bot,
+                    }
+                )
+            else:
+                failed_count += 1
+                pending_failed += 1
+
+            if pending_sent + pending_failed >= COUNTER_FLUSH_EVERY:
+                await bump_broadcast_counters(
+                    session, broadcast_id, sent=pending_sent, failed=pending_failed
+                )
+                await session.commit()
+                pending_sent = pending_failed = 0
+
+        # Delivered messages of this page go into the conversation history.
+        await bulk_copy_chat_logs(session, sent_logs)
+        sent_logs.clear()
+
+    # Flush the remaining deltas together with the final status
+    await bump_broadcast_counters(
+        session, broadcast_id, sent=pending_sent, failed=pending_failed
+    )
     broadcast.status = (
-        BroadcastStatus.COMPLETED if failed_count == 0 else BroadcastStatus.FAILED
+        BroadcastStatus.completed if failed_count == 0 else BroadcastStatus.failed
     )
     session.add(broadcast)
     await session.commit()
 
     logger.info(
-        f"Broadcast {broadcast_id} completed: "
-        f"{sent_count} sent, {failed_count} failed"
+        "Broadcast %s completed: %d sent, %d failed",
+        broadcast_id,
+        sent_count,
+        failed_count,
     )
 
     return {"sent": sent_count, "failed": failed_count}
@@ -146,12 +192,14 @@ async def schedule_broadcast(
     if not broadcast:
         return False
 
+    # There is no separate "scheduled" status: the broadcast stays a draft
+    # (so execute_broadcast still accepts it) and scheduled_at marks it.
     broadcast.scheduled_at = scheduled_at
-    broadcast.status = BroadcastStatus.SCHEDULED
+    broadcast.status = BroadcastStatus.draft
     session.add(broadcast)
     await session.commit()
 
-    logger.info(f"Broadcast {broadcast_id} scheduled for {scheduled_at}")
+    logger.info("Broadcast %s scheduled for %s", broadcast_id, scheduled_at)
 
     # TODO: Add to job queue
     # job_queue.enqueue_at(scheduled_at, execute_broadcast, session, broadcast_id)
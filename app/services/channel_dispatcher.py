@@ -20,23 +20,30 @@ async def generate_chat_response(
 
     # Try to find or create a lead to track flow state
     lead = None
+    lead_created = False
     if sender_id:
         # Assuming sender_id is phone number for now
         lead = await get_lead_by_phone(session, tenant_id, sender_id)
         if not lead:
-            # Create a basic lead so we can track flow state immediately
+            # Create a basic lead so we can track flow state immediately.
+            # It is committed together with any flow state written below.
             lead = await create_lead(
                 session=session,
                 tenant_id=tenant_id,
                 phone_number=sender_id,
                 customer_name=None,
                 summary=None,
+                commit=False,
             )
+            lead_created = True
 
     manager = ChatManager(session=session)
     result = await manager.process_message(
         tenant_id=tenant_id, user_message=message, lead=lead
     )
+    if lead_created:
+        # No-op if the flow engine already committed the transaction.
+        await session.commit()
 
     if background_tasks is not None:
         background_tasks.add_task(
@@ -1,23 +1,89 @@
 from __future__ import annotations
 
-import re
+import hashlib
 import logging
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from functools import lru_cache
 
 import httpx
+import orjson
+from cachetools import TTLCache
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.crud.scripted_response import list_active_scripted_responses
-from app.crud.tenant import get_tenant_by_id
+from app.crud.scripted_response import get_trigger_matcher
+from app.crud.tenant import get_cached_tenant_by_id
 from app.crud.knowledge_base import search_kb_context
 from app.crud.flow import get_flow_by_trigger
 from app.services.flow_engine import process_flow, start_flow
+from app.services.llm_cache import llm_cache
+from app.services.llm_client import get_llm_client, llm_headers, post_llm
 from app.models.lead import Lead
 
 logger = logging.getLogger(__name__)
 
 
+_TEMPERATURE = 0.3
+_KB_INSTRUCTION = "استخدم المعلومات أدناه للإجابة على سؤال المستخدم."
+
+_NO_KEY_REPLY = "⚠️ الذكاء الاصطناعي غير مُعد. يرجى إضافة GROQ_API_KEY أو LLM_API_KEY في إعدادات البيئة."
+_TIMEOUT_REPLY = "⚠️ انتهت مهلة الاتصال بالذكاء الاصطناعي. يرجى المحاولة مرة أخرى."
+_UNEXPECTED_ERROR_REPLY = "⚠️ حدث خطأ غير متوقع. يرجى المحاولة لاحقاً."
+
+# Groq models tried (in order) when the configured model is rejected.
+_FALLBACK_MODELS = (
+    "meta-llama/llama-4-scout-17b-16e-instruct",
+    "llama-4-scout-17b-16e-instruct",
+    "llama-3.3-70b-versatile",
+    "llama-3.1-70b-versatile",
+)
+
+
+# /models listings by (base URL, key digest); providers rarely change them.
+_MODEL_LIST_TTL_SECONDS = 600
+_model_lists: TTLCache[tuple[str, bytes], tuple[str, ...]] = TTLCache(
+    maxsize=8, ttl=_MODEL_LIST_TTL_SECONDS
+)
+
+
+async def _list_models(llm_key: str) -> tuple[str, ...]:
+    cache_key = (
+        settings.llm_base_url,
+        hashlib.blake2b(llm_key.encode("utf-8"), digest_size=16).digest(),
+    )
+    cached = _model_lists.get(cache_key)
+    if cached is not None:
+        return cached
+    try:
+        resp = await get_llm_client().get(
+            "/models",
+            headers={"Authorization": f"Bearer {llm_key}"},
+            timeout=10.0,
+        )
+        resp.raise_for_status()
+        data = orjson.loads(resp.content) or {}
+        models = [
+            str(m.get("id")) for m in (data.get("data") or []) if m and m.get("id")
+        ]
+    except Exception:
+        return ()
+    # Keep stable ordering for fallback selection. Failures are not cached.
+    available = _model_lists[cache_key] = tuple(sorted(set(models)))
+    return available
+
+
+@lru_cache(maxsize=8)
+def _pick_fallback_model(available: tuple[str, ...]) -> str | None:
+    if not available:
+        return None
+    available_set = set(available)
+    for name in _FALLBACK_MODELS:
+        if name in available_set:
+            return name
+    return available[0]
+
+
 @dataclass(slots=True)
 class ChatResult:
     response: str
@@ -25,12 +91,49 @@ class ChatResult:
 
 
 class ChatManager:
+    """Per-request view over one session.
+
+    Process-wide state (trigger matchers, compiled flows, fallback models)
+    lives in module-level caches, so constructing a manager is free.
+    """
+
     def __init__(self, session: AsyncSession):
         self._session = session
 
     async def process_message(
         self, tenant_id: int, user_message: str, lead: Lead | None = None
     ) -> ChatResult:
+        result = await self._resolve_without_ai(tenant_id, user_message, lead)
+        if result is not None:
+            return result
+
+        system_prompt = await self._build_system_prompt(tenant_id, user_message)
+        ai_text = await self._call_openai_compatible_chat(
+            system_prompt=system_prompt, user_message=user_message
+        )
+        return ChatResult(response=ai_text, source="ai")
+
+    async def stream_message(
+        self, tenant_id: int, user_message: str, lead: Lead | None = None
+    ) -> tuple[str, AsyncIterator[str]]:
+        """Like ``process_message`` but returns ``(source, chunks)``.
+
+        All database work happens before this returns; the iterator only
+        talks to the LLM, so it may outlive the request's session.
+        """
+        result = await self._resolve_without_ai(tenant_id, user_message, lead)
+        if result is not None:
+            return result.source, _single_chunk(result.response)
+
+        system_prompt = await self._build_system_prompt(tenant_id, user_message)
+        return "ai", self._stream_openai_compatible_chat(
+            system_prompt=system_prompt, user_message=user_message
+        )
+
+    async def _resolve_without_ai(
+        self, tenant_id: int, user_message: str, lead: Lead | None
+    ) -> ChatResult | None:
+        """Flow or scripted reply, or None when the message needs the LLM."""
         # 1. Check Active Flow
         if lead and lead.current_flow_id:
             flow_response = await process_flow(self._session, lead, user_message)
@@ -44,41 +147,27 @@ class ChatManager:
             if flow_response:
                 return ChatResult(response=flow_response, source="flow")
 
-        scripted = await list_active_scripted_responses(
+        matcher = await get_trigger_matcher(session=self._session, tenant_id=tenant_id)
+        scripted_reply = matcher.match(user_message)
+        if scripted_reply is not None:
+            return ChatResult(response=scripted_reply, source="bot")
+        return None
+
+    async def _build_system_prompt(self, tenant_id: int, user_message: str) -> str:
+        tenant = await get_cached_tenant_by_id(
             session=self._session, tenant_id=tenant_id
         )
-
-        normalized = user_message.lower()
-        for rule in scripted:
-            trigger = (rule.trigger_keyword or "").strip()
-            if not trigger:
-                continue
-
-            # Minimal support for regex triggers: prefix with "re:".
-            if trigger.lower().startswith("re:"):
-                pattern = trigger[3:].strip()
-                if pattern and re.search(pattern, user_message, flags=re.IGNORECASE):
-                    return ChatResult(response=rule.response_text, source="bot")
-            else:
-                if trigger.lower() in normalized:
-                    return ChatResult(response=rule.response_text, source="bot")
-
-        tenant = await get_tenant_by_id(session=self._session, tenant_id=tenant_id)
         base_prompt = (
             tenant.system_prompt if tenant else None
         ) or "You are a helpful assistant."
 
-        # Inject Knowledge Base Context
+        # Inject Knowledge Base Context. The per-message KB block goes last so
+        # the tenant prompt and instruction form a stable prefix that
+        # providers with prompt caching can reuse across turns.
         kb_context = await search_kb_context(self._session, tenant_id, user_message)
         if kb_context:
-            system_prompt = f"{base_prompt}\n\n{kb_context}\n\nاستخدم المعلومات أعلاه للإجابة على سؤال المستخدم."
-        else:
-            system_prompt = base_prompt
-
-        ai_text = await self._call_openai_compatible_chat(
-            system_prompt=system_prompt, user_message=user_message
-        )
-        return ChatResult(response=ai_text, source="ai")
+            return f"{base_prompt}\n\n{_KB_INSTRUCTION}\n\n{kb_context}"
+        return base_prompt
 
     async def _call_openai_compatible_chat(
         self, *, system_prompt: str, user_message: str
@@ -86,111 +175,198 @@ class ChatManager:
         llm_key = settings.effective_llm_api_key()
         if not llm_key:
             logger.warning("No LLM API key configured")
-            return "⚠️ الذكاء الاصطناعي غير مُعد. يرجى إضافة GROQ_API_KEY أو LLM_API_KEY في إعدادات البيئة."
-
-        async def _list_models() -> list[str]:
-            try:
-                async with httpx.AsyncClient(
-                    base_url=settings.llm_base_url, timeout=10.0
-                ) as client:
-                    resp = await client.get(
-                        "/models",
-                        headers={"Authorization": f"Bearer {llm_key}"},
-                    )
-                    resp.raise_for_status()
-                    data = resp.json() or {}
-                models = [
-                    str(m.get("id"))
-                    for m in (data.get("data") or [])
-                    if m and m.get("id")
-                ]
-                # Keep stable ordering for fallback selection.
-                return sorted(set(models))
-            except Exception:
-                return []
-
-        def _pick_fallback_model(available: list[str]) -> str | None:
-            if not available:
-                return None
-            preferred = [
-                # Common Groq models (order matters)
-                "meta-llama/llama-4-scout-17b-16e-instruct",
-                "llama-4-scout-17b-16e-instruct",
-                "llama-3.3-70b-versatile",
-                "llama-3.1-70b-versatile",
-            ]
-            available_set = set(available)
-            for name in preferred:
-                if name in available_set:
-                    return name
-            return available[0]
+            return _NO_KEY_REPLY
 
         model = settings.effective_llm_model()
+        cache_key = llm_cache.key(
+            model=model,
+            system_prompt=system_prompt,
+            user_message=user_message,
+            temperature=_TEMPERATURE,
+        )
+        cached = llm_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Identical prompts arriving while this one is in flight share its reply.
+        return await llm_cache.single_flight(
+            cache_key,
+            lambda: self._request_completion(
+                llm_key=llm_key,
+                model=model,
+                system_prompt=system_prompt,
+                user_message=user_message,
+                cache_key=cache_key,
+            ),
+        )
+
+    async def _request_completion(
+        self,
+        *,
+        llm_key: str,
+        model: str,
+        system_prompt: str,
+        user_message: str,
+        cache_key: bytes,
+    ) -> str:
         payload = {
             "model": model,
             "messages": [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_message},
             ],
-            "temperature": 0.3,
+            "temperature": _TEMPERATURE,
             "max_tokens": 1024,
         }
 
-        headers = {
-            "Authorization": f"Bearer {llm_key}",
-            "Content-Type": "application/json",
-        }
+        headers = llm_headers(llm_key)
 
         try:
-            async with httpx.AsyncClient(
-                base_url=settings.llm_base_url, timeout=30.0
-            ) as client:
-                logger.info(
-                    f"Calling LLM at {settings.llm_base_url} with model {payload['model']}"
-                )
-                resp = await client.post(
-                    "/chat/completions", json=payload, headers=headers
-                )
-
-                # If the configured model is invalid, try a one-time fallback from /models.
-                if resp.status_code == 400:
-                    body = (resp.text or "").lower()
-                    if "model" in body or "not found" in body:
-                        available = await _list_models()
-                        fallback = _pick_fallback_model(available)
-                        if fallback and fallback != payload["model"]:
-                            logger.warning(
-                                "Model '%s' rejected; retrying with fallback '%s'",
-                                payload["model"],
-                                fallback,
-                            )
-                            payload2 = dict(payload)
-                            payload2["model"] = fallback
-                            resp = await client.post(
-                                "/chat/completions", json=payload2, headers=headers
-                            )
-
-                resp.raise_for_status()
-                data = resp.json()
-
-            return data["choices"][0]["message"]["content"]
+            logger.info(
+                "Calling LLM at %s with model %s",
+                settings.llm_base_url,
+                payload["model"],
+            )
+            resp = await post_llm(
+                "/chat/completions", content=orjson.dumps(payload), headers=headers
+            )
+
+            # If the configured model is invalid, try a one-time fallback from /models.
+            if resp.status_code == 400:
+                body = (resp.text or "").lower()
+                if "model" in body or "not found" in body:
+                    available = await _list_models(llm_key)
+                    fallback = _pick_fallback_model(available)
+                    if fallback and fallback != payload["model"]:
+                        logger.warning(
+                            "Model '%s' rejected; retrying with fallback '%s'",
+                            payload["model"],
+                            fallback,
+                        )
+                        payload2 = dict(payload)
+                        payload2["model"] = fallback
+                        resp = await post_llm(
+                            "/chat/completions",
+                            content=orjson.dumps(payload2),
+                            headers=headers,
+                        )
+
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+
+            text = data["choices"][0]["message"]["content"]
+            # Only real completions are cached; error replies below are not.
+            llm_cache.set(cache_key, text)
+            return text
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"LLM API error: {e.response.status_code} - {e.response.text}")
-            if e.response.status_code == 401:
-                return "⚠️ مفتاح API غير صالح. يرجى التحقق من إعدادات الذكاء الاصطناعي."
-            elif e.response.status_code == 429:
-                return "⚠️ تم تجاوز حد الطلبات. يرجى المحاولة لاحقاً."
-            elif e.response.status_code == 503:
-                return "⚠️ خدمة الذكاء الاصطناعي غير متاحة حالياً."
-            if e.response.status_code == 400:
-                return "⚠️ فشل طلب الذكاء الاصطناعي (قد يكون اسم النموذج غير صحيح). جرّب تغيير LLM_MODEL في Render."
-            return f"⚠️ خطأ من خدمة AI: {e.response.status_code}"
+            logger.error(
+                "LLM API error: %s - %s", e.response.status_code, e.response.text
+            )
+            return _http_error_reply(e.response.status_code)
 
         except httpx.TimeoutException:
             logger.error("LLM API timeout")
-            return "⚠️ انتهت مهلة الاتصال بالذكاء الاصطناعي. يرجى المحاولة مرة أخرى."
+            return _TIMEOUT_REPLY
 
         except Exception as e:
-            logger.exception(f"Unexpected LLM error: {e}")
-            return "⚠️ حدث خطأ غير متوقع. يرجى المحاولة لاحقاً."
+            logger.exception("Unexpected LLM error: %s", e)
+            return _UNEXPECTED_ERROR_REPLY
+
+    async def _stream_openai_compatible_chat(
+        self, *, system_prompt: str, user_message: str
+    ) -> AsyncIterator[str]:
+        """Yield the completion as it arrives (``stream: true`` SSE deltas).
+
+        Cache hits are yielded whole; a fully streamed reply is cached. No
+        retry or model fallback here: once bytes reach the caller the
+        request cannot be replayed.
+        """
+        llm_key = settings.effective_llm_api_key()
+        if not llm_key:
+            logger.warning("No LLM API key configured")
+            yield _NO_KEY_REPLY
+            return
+
+        model = settings.effective_llm_model()
+        cache_key = llm_cache.key(
+            model=model,
+            system_prompt=system_prompt,
+            user_message=user_message,
+            temperature=_TEMPERATURE,
+        )
+        cached = llm_cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        payload = {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message},
+            ],
+            "temperature": _TEMPERATURE,
+            "max_tokens": 1024,
+            "stream": True,
+        }
+        headers = llm_headers(llm_key)
+
+        parts: list[str] = []
+        try:
+            async with get_llm_client().stream(
+                "POST",
+                "/chat/completions",
+                content=orjson.dumps(payload),
+                headers=headers,
+            ) as resp:
+                if resp.status_code >= 400:
+                    await resp.aread()
+                    logger.error("LLM API error: %s - %s", resp.status_code, resp.text)
+                    yield _http_error_reply(resp.status_code)
+                    return
+
+                async for line in resp.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    choices = orjson.loads(data).get("choices") or ()
+                    delta = (
+                        choices[0].get("delta", {}).get("content") if choices else None
+                    )
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+
+        except httpx.TimeoutException:
+            logger.error("LLM API timeout")
+            if not parts:
+                yield _TIMEOUT_REPLY
+            return
+
+        except Exception as e:
+            logger.exception("Unexpected LLM error: %s", e)
+            if not parts:
+                yield _UNEXPECTED_ERROR_REPLY
+            return
+
+        if parts:
+            llm_cache.set(cache_key, "".join(parts))
+
+
+async def _single_chunk(text: str) -> AsyncIterator[str]:
+    yield text
+
+
+def _http_error_reply(status_code: int) -> str:
+    if status_code == 401:
+        return "⚠️ مفتاح API غير صالح. يرجى التحقق من إعدادات الذكاء الاصطناعي."
+    elif status_code == 429:
+        return "⚠️ تم تجاوز حد الطلبات. يرجى المحاولة لاحقاً."
+    elif status_code == 503:
+        return "⚠️ خدمة الذكاء الاصطناعي غير متاحة حالياً."
+    if status_code == 400:
+        return "⚠️ فشل طلب الذكاء الاصطناعي (قد يكون اسم النموذج غير صحيح). جرّب تغيير LLM_MODEL في Render."
+    return f"⚠️ خطأ من خدمة AI: {status_code}"
@@ -0,0 +1,49 @@
+"""
+Pre-indexed form of a Flow graph.
+Built once per flow version and reused across messages, so the engine never
+re-scans ``flow_data["nodes"]`` or re-reads the JSONB document per step.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from app.models.flow import Flow
+
+
+@dataclass(frozen=True, slots=True)
+class FlowNode:
+    id: str
+    type: str | None
+    content: str
+    next: str | None
+    variable: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledFlow:
+    id: int
+    is_active: bool
+    nodes: dict[str, FlowNode]
+    start_id: str | None
+
+    @classmethod
+    def from_flow(cls, flow: Flow) -> CompiledFlow:
+        raw_nodes: list[dict[str, Any]] = (flow.flow_data or {}).get("nodes", [])
+        nodes: dict[str, FlowNode] = {}
+        for raw in raw_nodes:
+            # Later duplicates win, as with the former dict comprehension.
+            nodes[raw["id"]] = FlowNode(
+                id=raw["id"],
+                type=raw.get("type"),
+                content=raw.get("content", ""),
+                next=raw.get("next"),
+                variable=raw.get("variable"),
+            )
+
+        start_id = None
+        if raw_nodes:
+            start_id = "start" if "start" in nodes else raw_nodes[0]["id"]
+
+        return cls(id=flow.id, is_active=flow.is_active, nodes=nodes, start_id=start_id)
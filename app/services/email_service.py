@@ -10,22 +10,446 @@ Gmail SMTP Configuration:
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
-import smtplib
+import re
+import socket
 import ssl
+import time
 import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
 from email.message import EmailMessage
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
 
+import aiosmtplib
 import httpx
+import jinja2
+import orjson
 
 from app.core.config import settings
+from app.services.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
+# Authenticated SMTP connections kept open between sends. Servers drop idle
+# sessions and cap messages per session, hence the NOOP check and recycling.
+SMTP_POOL_SIZE = 5
+SMTP_MAX_MESSAGES_PER_CONNECTION = 100
+# Background delivery: worker count (the ceiling for the adaptive send limit),
+# queue bound, attempts per email, and the first retry delay (doubled per
+# attempt). Shutdown waits this long to drain.
+EMAIL_WORKERS = 16
+EMAIL_QUEUE_SIZE = 1000
+EMAIL_SEND_ATTEMPTS = 3
+EMAIL_RETRY_BASE_SECONDS = 1.0
+EMAIL_DRAIN_TIMEOUT_SECONDS = 5.0
+EMAIL_INITIAL_CONCURRENCY = 4
+# Pause SendGrid sends when fewer than this share of the rate limit remains.
+SENDGRID_RATE_LIMIT_FLOOR = 0.1
+SENDGRID_MAX_PAUSE_SECONDS = 60.0
+# Consecutive backend failures before it is skipped, and the longest skip.
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_MAX_OPEN_SECONDS = 60
+# How long a resolved SMTP IPv4 address is reused before looking it up again.
+SMTP_DNS_TTL_SECONDS = 300
+
+
+SENDGRID_URL = "https://api.sendgrid.com/v3/mail/send"
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_BETWEEN_TAGS_RE = re.compile(r">\s+<")
+
+
+def _minify_html(raw: str) -> str:
+    """Collapse the source indentation; mail clients ignore it anyway."""
+    return _BETWEEN_TAGS_RE.sub("><", _WHITESPACE_RE.sub(" ", raw)).strip()
+
+
+_VERIFY_HTML = """\
+<!DOCTYPE html>
+<html dir="rtl" lang="ar">
+<head><meta charset="UTF-8"></head>
+<body style="font-family: Cairo, Arial, sans-serif; background: #f3f4f6; padding: 20px;">
+    <div style="max-width: 600px; margin: 0 auto; background: white; border-radius: 12px; padding: 30px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
+        <h1 style="color: #0891b2; margin-bottom: 20px;">مرحباً {{ user_name }} 👋</h1>
+        <p style="color: #1f2937; font-size: 16px; line-height: 1.6;">
+            شكراً لتسجيلك في منصة RoboVAI! لتفعيل حسابك، يرجى الضغط على الزر أدناه:
+        </p>
+        <div style="text-align: center; margin: 30px 0;">
+            <a href="{{ verification_url }}" 
+               style="display: inline-block; padding: 14px 28px; background: linear-gradient(135deg, #0891b2, #6366f1); 
+                      color: white; text-decoration: none; border-radius: 8px; font-weight: bold; font-size: 16px;">
+                تفعيل الحساب الآن
+            </a>
+        </div>
+        <p style="color: #6b7280; font-size: 14px; margin-top: 20px;">
+            أو انسخ هذا الرابط في المتصفح:<br>
+            <a href="{{ verification_url }}" style="color: #0891b2; word-break: break-all;">{{ verification_url }}</a>
+        </p>
+        <hr style="border: none; border-top: 1px solid #e5e7eb; margin: 30px 0;">
+        <p style="color: #9ca3af; font-size: 12px; text-align: center;">
+            إذا لم تقم بإنشاء هذا الحساب، يمكنك تجاهل هذه الرسالة.<br>
+            © 2025 RoboVAI Solutions - منصة الشات بوت الذكي
+        </p>
+    </div>
+</body>
+</html>
+"""
+
+_RESET_HTML = """\
+<!DOCTYPE html>
+<html dir="rtl" lang="ar">
+<head><meta charset="UTF-8"></head>
+<body style="font-family: Cairo, Arial, sans-serif; background: #f3f4f6; padding: 20px;">
+    <div style="max-width: 600px; margin: 0 auto; background: white; border-radius: 12px; padding: 30px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
+        <h1 style="color: #dc2626; margin-bottom: 20px;">🔐 إعادة تعيين كلمة المرور</h1>
+        <p style="color: #1f2937; font-size: 16px; line-height: 1.6;">
+            مرحباً {{ user_name }},<br><br>
+            لقد تلقينا طلباً لإعادة تعيين كلمة مرورك. اضغط على الزر أدناه لإنشاء كلمة مرور جديدة:
+        </p>
+        <div style="text-align: center; margin: 30px 0;">
+            <a href="{{ reset_url }}" 
+               style="display: inline-block; padding: 14px 28px; background: linear-gradient(135deg, #dc2626, #ea580c); 
+                      color: white; text-decoration: none; border-radius: 8px; font-weight: bold; font-size: 16px;">
+                إعادة تعيين كلمة المرور
+            </a>
+        </div>
+        <p style="color: #6b7280; font-size: 14px; margin-top: 20px;">
+            أو انسخ هذا الرابط في المتصفح:<br>
+            <a href="{{ reset_url }}" style="color: #dc2626; word-break: break-all;">{{ reset_url }}</a>
+        </p>
+        <p style="color: #dc2626; font-size: 14px; background: #fef2f2; padding: 12px; border-radius: 6px; margin-top: 20px;">
+            ⚠️ هذا الرابط صالح لمدة ساعة واحدة فقط.
+        </p>
+        <hr style="border: none; border-top: 1px solid #e5e7eb; margin: 30px 0;">
+        <p style="color: #9ca3af; font-size: 12px; text-align: center;">
+            إذا لم تطلب إعادة تعيين كلمة المرور، يرجى تجاهل هذه الرسالة.<br>
+            © 2025 RoboVAI Solutions - منصة الشات بوت الذكي
+        </p>
+    </div>
+</body>
+</html>
+"""
+
+_TEMPLATE_SOURCES = {
+    "verify.html": _minify_html(_VERIFY_HTML),
+    "reset.html": _minify_html(_RESET_HTML),
+}
+# Written at image build time by scripts/compile_email_templates.py.
+COMPILED_TEMPLATES_DIR = os.path.join(
+    os.path.dirname(__file__), "_email_templates_compiled"
+)
+# Digest of the sources (and Jinja version) the modules were compiled from.
+_COMPILED_STAMP_FILE = "SOURCES_SHA256"
+
+
+def _template_sources_digest() -> str:
+    raw = orjson.dumps(_TEMPLATE_SOURCES, option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(raw + jinja2.__version__.encode()).hexdigest()
+
+
+def _template_loader() -> jinja2.BaseLoader:
+    """Precompiled modules when built from the current sources, else the sources.
+
+    A stale build (templates edited since the script last ran) is ignored,
+    so dev checkouts always render what is in this file.
+    """
+    source_loader = jinja2.DictLoader(_TEMPLATE_SOURCES)
+    try:
+        with open(os.path.join(COMPILED_TEMPLATES_DIR, _COMPILED_STAMP_FILE)) as f:
+            stamp = f.read().strip()
+    except OSError:
+        return source_loader
+    if stamp != _template_sources_digest():
+        logger.warning("Precompiled email templates are stale; using the sources")
+        return source_loader
+    return jinja2.ChoiceLoader(
+        [jinja2.ModuleLoader(COMPILED_TEMPLATES_DIR), source_loader]
+    )
+
+
+def compile_email_templates(target: str = COMPILED_TEMPLATES_DIR) -> None:
+    """Compile the email bodies to Python modules under ``target``."""
+    env = jinja2.Environment(
+        loader=jinja2.DictLoader(_TEMPLATE_SOURCES), autoescape=True
+    )
+    env.compile_templates(target, zip=None, ignore_errors=False)
+    with open(os.path.join(target, _COMPILED_STAMP_FILE), "w") as f:
+        f.write(_template_sources_digest())
+
+
+# Email bodies, compiled once at import. Autoescaping keeps user-supplied
+# names (and URLs) from injecting markup into the message; the compiled
+# modules must be built with the same setting (see compile_email_templates).
+_templates = jinja2.Environment(loader=_template_loader(), autoescape=True)
+_VERIFY_TEMPLATE = _templates.get_template("verify.html")
+_RESET_TEMPLATE = _templates.get_template("reset.html")
+
+
+def _render_verification(verification_url: str, user_name: str) -> tuple[str, str]:
+    subject = "تفعيل حسابك - RoboVAI"
+    html_content = _VERIFY_TEMPLATE.render(
+        user_name=user_name, verification_url=verification_url
+    )
+    return subject, html_content
+
+
+def _render_password_reset(reset_url: str, user_name: str) -> tuple[str, str]:
+    subject = "إعادة تعيين كلمة المرور - RoboVAI"
+    html_content = _RESET_TEMPLATE.render(user_name=user_name, reset_url=reset_url)
+    return subject, html_content
+
+
+@lru_cache(maxsize=4096)
+def _normalize_email(address: str) -> str:
+    """``local@domain`` with an internationalized domain in ASCII (IDNA) form."""
+    address = address.strip()
+    local, sep, domain = address.rpartition("@")
+    if not sep or domain.isascii():
+        return address
+    try:
+        return f"{local}@{domain.encode('idna').decode('ascii')}"
+    except UnicodeError:
+        return address
+
+
+_PLAIN_FALLBACK = "Please view this email in an HTML-capable email client."
+# 7-bit safe for servers without 8BITMIME (the plain part carries the Arabic
+# subject); the minified HTML is one long line.
+_BODY_CTE = "quoted-printable"
+
+
+def _build_message_bytes(
+    from_header: str,
+    to_email: str,
+    subject: str,
+    html_content: str,
+    plain_fallback: bool = False,
+) -> bytes:
+    """Serialized MIME message, ready for ``sendmail``.
+
+    Not cached: bodies carry live verification/reset tokens.
+
+    With ``plain_fallback`` the HTML goes out as multipart/alternative behind
+    a short text/plain part.
+    """
+    message = EmailMessage()
+    message["From"] = from_header
+    message["To"] = to_email
+    message["Subject"] = subject
+    if plain_fallback:
+        message.set_content(f"Subject: {subject}\n\n{_PLAIN_FALLBACK}", cte=_BODY_CTE)
+        message.add_alternative(html_content, subtype="html", cte=_BODY_CTE)
+    else:
+        message.set_content(html_content, subtype="html", cte=_BODY_CTE)
+    return message.as_bytes()
+
+
+async def _close_quietly(server: aiosmtplib.SMTP) -> None:
+    try:
+        await server.quit()
+    except Exception:
+        server.close()
+
+
+class _SMTPPool:
+    """Pool of logged-in SMTP connections.
+
+    ``connect`` opens and authenticates a new connection. Everything runs on
+    the event loop, so a plain list serves as the idle stack (most recently
+    used first, so idle connections age out at the server instead).
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[aiosmtplib.SMTP]],
+        *,
+        max_size: int = SMTP_POOL_SIZE,
+        max_messages: int = SMTP_MAX_MESSAGES_PER_CONNECTION,
+    ) -> None:
+        self._connect = connect
+        self._max_size = max_size
+        self._max_messages = max_messages
+        self._idle: list[tuple[aiosmtplib.SMTP, int]] = []
+
+    async def send(self, sender: str, recipients: list[str], message: bytes) -> None:
+        server, sent = await self._checkout()
+        try:
+            await server.sendmail(sender, recipients, message)
+        except aiosmtplib.SMTPServerDisconnected:
+            # Dropped between the NOOP and the send: one retry on a fresh one.
+            server.close()
+            server, sent = await self._connect(), 0
+            try:
+                await server.sendmail(sender, recipients, message)
+            except Exception:
+                await _close_quietly(server)
+                raise
+        except Exception:
+            await _close_quietly(server)
+            raise
+        await self._checkin(server, sent + 1)
+
+    async def _checkout(self) -> tuple[aiosmtplib.SMTP, int]:
+        while self._idle:
+            server, sent = self._idle.pop()
+            try:
+                if server.is_connected and (await server.noop()).code == 250:
+                    return server, sent
+            except (aiosmtplib.SMTPException, OSError):
+                pass
+            server.close()
+        return await self._connect(), 0
+
+    async def _checkin(self, server: aiosmtplib.SMTP, sent: int) -> None:
+        if sent >= self._max_messages or len(self._idle) >= self._max_size:
+            await _close_quietly(server)
+            return
+        self._idle.append((server, sent))
+
+    async def close(self) -> None:
+        """QUIT every idle connection (app shutdown)."""
+        idle, self._idle = self._idle, []
+        for server, _sent in idle:
+            await _close_quietly(server)
+
+
+class _AIMDLimiter:
+    """Concurrency limit tuned by additive increase / multiplicative decrease.
+
+    Every ``window`` sends the limit grows by ``increase`` if the average
+    latency met ``target_latency`` and is multiplied by ``decrease``
+    otherwise; a throttling signal from the provider (429, 5xx, SMTP 4xx)
+    decreases it at once and may pause new sends.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: float,
+        minimum: float = 1.0,
+        maximum: float,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        target_latency: float = 2.0,
+        window: int = 20,
+    ) -> None:
+        self._limit = initial
+        self._minimum = minimum
+        self._maximum = maximum
+        self._increase = increase
+        self._decrease = decrease
+        self._target_latency = target_latency
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._changed = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._in_flight < int(self._limit))
+            self._in_flight += 1
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+    async def release(self, latency: float) -> None:
+        async with self._changed:
+            self._in_flight -= 1
+            self._latencies.append(latency)
+            if len(self._latencies) == self._latencies.maxlen:
+                average = sum(self._latencies) / len(self._latencies)
+                if average <= self._target_latency:
+                    self._limit = min(self._maximum, self._limit + self._increase)
+                else:
+                    self._limit = max(self._minimum, self._limit * self._decrease)
+                self._latencies.clear()
+            self._changed.notify_all()
+
+    def throttle(self, pause_seconds: float = 0.0) -> None:
+        """Provider pushed back: cut the limit now, optionally pause sends."""
+        self._limit = max(self._minimum, self._limit * self._decrease)
+        self._latencies.clear()
+        if pause_seconds > 0:
+            self._paused_until = max(
+                self._paused_until, time.monotonic() + pause_seconds
+            )
+
+
+class _CircuitBreaker:
+    """Skip a failing backend for a while instead of waiting on it per email.
+
+    After ``CIRCUIT_FAILURE_THRESHOLD`` consecutive failures the circuit opens
+    for ``2 ** failures`` seconds (capped). Once that passes it is half-open:
+    exactly one caller gets through as a trial while the rest are still
+    refused. Success closes it; another failure reopens it for longer. A
+    trial that never reports back just lets the next one through after
+    another cooldown.
+    """
+
+    __slots__ = ("name", "_failures", "_open_until")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._failures = 0
+        self._open_until = 0.0
+
+    def _cooldown(self) -> float:
+        return min(CIRCUIT_MAX_OPEN_SECONDS, 2**self._failures)
+
+    def allow(self) -> bool:
+        if self._failures < CIRCUIT_FAILURE_THRESHOLD:
+            return True
+        now = time.monotonic()
+        if now < self._open_until:
+            return False
+        # Half-open: this caller is the trial; hold everyone else back.
+        self._open_until = now + self._cooldown()
+        return True
+
+    def success(self) -> None:
+        self._failures = 0
+        self._open_until = 0.0
+
+    def failure(self) -> None:
+        self._failures += 1
+        if self._failures >= CIRCUIT_FAILURE_THRESHOLD:
+            cooldown = self._cooldown()
+            self._open_until = time.monotonic() + cooldown
+            logger.warning(
+                "%s circuit open for %ds after %d failures",
+                self.name,
+                cooldown,
+                self._failures,
+            )
+
+
+def _is_message_rejection(exc: Exception) -> bool:
+    """Errors about this one email (bad address, bad payload), not the backend."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return 400 <= status < 500 and status not in (401, 403, 429)
+    return isinstance(
+        exc, (aiosmtplib.SMTPRecipientsRefused, aiosmtplib.SMTPSenderRefused)
+    )
+
+
+# Whole words only: a bare "rate" would also match "separate", "generated", ...
+_THROTTLE_TEXT_RE = re.compile(r"\brate[- ]?limit|\btoo many\b", re.IGNORECASE)
+
+
+def _is_smtp_throttle(exc: aiosmtplib.SMTPException) -> bool:
+    """421/450/451/452 replies and rate-limit/"too many" texts mean slow down."""
+    code = getattr(exc, "code", None)
+    if code in (421, 450, 451, 452):
+        return True
+    return _THROTTLE_TEXT_RE.search(str(exc)) is not None
+
 
 class EmailService:
     """
@@ -37,14 +461,71 @@ class EmailService:
     3. Generic SMTP (any other SMTP server)
     """
 
+    __slots__ = (
+        "smtp_enabled",
+        "sendgrid_enabled",
+        "from_email",
+        "from_name",
+        "is_gmail",
+        "_smtp_host",
+        "_smtp_port",
+        "_smtp_user",
+        "_smtp_password",
+        "_smtp_tls",
+        "_sendgrid_headers",
+        "_sendgrid_from",
+        "_smtp_pool",
+        "_ssl_context",
+        "_smtp_ipv4",
+        "_queue",
+        "_workers",
+        "_sendgrid_circuit",
+        "_smtp_circuit",
+        "_send_limiter",
+    )
+
     def __init__(self):
+        # Settings are fixed for the process; keep the ones the send path
+        # reads as plain attributes.
+        self._smtp_host = settings.smtp_host
+        self._smtp_port = settings.smtp_port
+        self._smtp_user = settings.smtp_user
+        self._smtp_password = settings.smtp_password
+        self._smtp_tls = settings.smtp_tls
+
         self.smtp_enabled = bool(settings.smtp_host and settings.smtp_user and settings.smtp_password)
         self.sendgrid_enabled = bool(settings.sendgrid_api_key)
         self.from_email = settings.email_from or settings.smtp_user
         self.from_name = settings.email_from_name or "RoboVAI"
+        # Built once and shared read-only by every SendGrid request.
+        self._sendgrid_headers: Mapping[str, str] = MappingProxyType(
+            {
+                "Authorization": f"Bearer {settings.sendgrid_api_key}",
+                "Content-Type": "application/json",
+            }
+            if self.sendgrid_enabled
+            else {}
+        )
+        # A plain dict (orjson cannot encode mappingproxy); never mutated.
+        self._sendgrid_from = {"email": self.from_email, "name": self.from_name}
         
         # Gmail specific settings
         self.is_gmail = settings.smtp_host.lower() in ['smtp.gmail.com', 'smtp.googlemail.com'] if settings.smtp_host else False
+        self._smtp_pool = _SMTPPool(
+            self._connect_gmail if self.is_gmail else self._connect_smtp
+        )
+        # Loading the CA bundle is the expensive part; one context serves all
+        # connections. The resolved IPv4 is (address, expires_at) or None.
+        self._ssl_context = ssl.create_default_context()
+        self._smtp_ipv4: tuple[str, float] | None = None
+        # Background delivery (enqueue_email); started on first use.
+        self._queue: asyncio.Queue[tuple[str, str, str]] | None = None
+        self._workers: list[asyncio.Task] = []
+        self._sendgrid_circuit = _CircuitBreaker("SendGrid")
+        self._smtp_circuit = _CircuitBreaker("SMTP")
+        self._send_limiter = _AIMDLimiter(
+            initial=EMAIL_INITIAL_CONCURRENCY, maximum=EMAIL_WORKERS
+        )
         
         # Log configuration status
         if self.sendgrid_enabled:
@@ -53,7 +534,7 @@ class EmailService:
             if self.is_gmail:
                 logger.info("📧 Email service: Gmail SMTP enabled")
             else:
-                logger.info(f"📧 Email service: SMTP enabled ({settings.smtp_host})")
+                logger.info("📧 Email service: SMTP enabled (%s)", self._smtp_host)
         else:
             logger.warning("⚠️ Email service: No email backend configured!")
 
@@ -64,38 +545,7 @@ class EmailService:
         user_name: str,
     ) -> bool:
         """Send email verification link."""
-        subject = "تفعيل حسابك - RoboVAI"
-        html_content = f"""
-        <!DOCTYPE html>
-        <html dir="rtl" lang="ar">
-        <head><meta charset="UTF-8"></head>
-        <body style="font-family: Cairo, Arial, sans-serif; background: #f3f4f6; padding: 20px;">
-            <div style="max-width: 600px; margin: 0 auto; background: white; border-radius: 12px; padding: 30px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
-                <h1 style="color: #0891b2; margin-bottom: 20px;">مرحباً {user_name} 👋</h1>
-                <p style="color: #1f2937; font-size: 16px; line-height: 1.6;">
-                    شكراً لتسجيلك في منصة RoboVAI! لتفعيل حسابك، يرجى الضغط على الزر أدناه:
-                </p>
-                <div style="text-align: center; margin: 30px 0;">
-                    <a href="{verification_url}" 
-                       style="display: inline-block; padding: 14px 28px; background: linear-gradient(135deg, #0891b2, #6366f1); 
-                              color: white; text-decoration: none; border-radius: 8px; font-weight: bold; font-size: 16px;">
-                        تفعيل الحساب الآن
-                    </a>
-                </div>
-                <p style="color: #6b7280; font-size: 14px; margin-top: 20px;">
-                    أو انسخ هذا الرابط في المتصفح:<br>
-                    <a href="{verification_url}" style="color: #0891b2; word-break: break-all;">{verification_url}</a>
-                </p>
-                <hr style="border: none; border-top: 1px solid #e5e7eb; margin: 30px 0;">
-                <p style="color: #9ca3af; font-size: 12px; text-align: center;">
-                    إذا لم تقم بإنشاء هذا الحساب، يمكنك تجاهل هذه الرسالة.<br>
-                    © 2025 RoboVAI Solutions - منصة الشات بوت الذكي
-                </p>
-            </div>
-        </body>
-        </html>
-        """
-
+        subject, html_content = _render_verification(verification_url, user_name)
         return await self._send_email(to_email, subject, html_content)
 
     async def send_password_reset_email(
@@ -105,43 +555,81 @@ class EmailService:
         user_name: str,
     ) -> bool:
         """Send password reset link."""
-        subject = "إعادة تعيين كلمة المرور - RoboVAI"
-        html_content = f"""
-        <!DOCTYPE html>
-        <html dir="rtl" lang="ar">
-        <head><meta charset="UTF-8"></head>
-        <body style="font-family: Cairo, Arial, sans-serif; background: #f3f4f6; padding: 20px;">
-            <div style="max-width: 600px; margin: 0 auto; background: white; border-radius: 12px; padding: 30px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
-                <h1 style="color: #dc2626; margin-bottom: 20px;">🔐 إعادة تعيين كلمة المرور</h1>
-                <p style="color: #1f2937; font-size: 16px; line-height: 1.6;">
-                    مرحباً {user_name},<br><br>
-                    لقد تلقينا طلباً لإعادة تعيين كلمة مرورك. اضغط على الزر أدناه لإنشاء كلمة مرور جديدة:
-                </p>
-                <div style="text-align: center; margin: 30px 0;">
-                    <a href="{reset_url}" 
-                       style="display: inline-block; padding: 14px 28px; background: linear-gradient(135deg, #dc2626, #ea580c); 
-                              color: white; text-decoration: none; border-radius: 8px; font-weight: bold; font-size: 16px;">
-                        إعادة تعيين كلمة المرور
-                    </a>
-                </div>
-                <p style="color: #6b7280; font-size: 14px; margin-top: 20px;">
-                    أو انسخ هذا الرابط في المتصفح:<br>
-                    <a href="{reset_url}" style="color: #dc2626; word-break: break-all;">{reset_url}</a>
-                </p>
-                <p style="color: #dc2626; font-size: 14px; background: #fef2f2; padding: 12px; border-radius: 6px; margin-top: 20px;">
-                    ⚠️ هذا الرابط صالح لمدة ساعة واحدة فقط.
-                </p>
-                <hr style="border: none; border-top: 1px solid #e5e7eb; margin: 30px 0;">
-                <p style="color: #9ca3af; font-size: 12px; text-align: center;">
-                    إذا لم تطلب إعادة تعيين كلمة المرور، يرجى تجاهل هذه الرسالة.<br>
-                    © 2025 RoboVAI Solutions - منصة الشات بوت الذكي
-                </p>
-            </div>
-        </body>
-        </html>
+        subject, html_content = _render_password_reset(reset_url, user_name)
+        return await self._send_email(to_email, subject, html_content)
+
+    def queue_verification_email(
+        self, to_email: str, verification_url: str, user_name: str
+    ) -> bool:
+        """Like send_verification_email, but delivered in the background."""
+        subject, html_content = _render_verification(verification_url, user_name)
+        self._log_dev_link(to_email, verification_url)
+        return self.enqueue_email(to_email, subject, html_content)
+
+    def queue_password_reset_email(
+        self, to_email: str, reset_url: str, user_name: str
+    ) -> bool:
+        """Like send_password_reset_email, but delivered in the background."""
+        subject, html_content = _render_password_reset(reset_url, user_name)
+        self._log_dev_link(to_email, reset_url)
+        return self.enqueue_email(to_email, subject, html_content)
+
+    def _log_dev_link(self, to_email: str, url: str) -> None:
+        """Without a backend the queued email only logs; show its link too."""
+        if not (self.sendgrid_enabled or self.smtp_enabled):
+            logger.info("[DEV MODE] Link for %s: %s", to_email, url)
+
+    def enqueue_email(self, to_email: str, subject: str, html_content: str) -> bool:
+        """Hand an email to the background workers and return immediately.
+
+        True means queued, not delivered; False if the queue is full.
         """
+        if self._queue is None or not self._workers:
+            self._queue = asyncio.Queue(maxsize=EMAIL_QUEUE_SIZE)
+            self._workers = [
+                asyncio.create_task(self._mail_worker()) for _ in range(EMAIL_WORKERS)
+            ]
+        try:
+            self._queue.put_nowait((to_email, subject, html_content))
+        except asyncio.QueueFull:
+            logger.error("Email queue full; dropping email to %s", to_email)
+            return False
+        return True
 
-        return await self._send_email(to_email, subject, html_content)
+    async def _mail_worker(self) -> None:
+        assert self._queue is not None
+        while True:
+            to_email, subject, html_content = await self._queue.get()
+            try:
+                await self._send_with_retry(to_email, subject, html_content)
+            except Exception:
+                logger.exception("Email worker failed on email to %s", to_email)
+            finally:
+                self._queue.task_done()
+
+    async def _send_with_retry(
+        self, to_email: str, subject: str, html_content: str
+    ) -> bool:
+        """_send_email with exponential backoff (1s, 2s, ...) between attempts."""
+        if not (self.sendgrid_enabled or self.smtp_enabled):
+            # Dev mode: _send_email only logs, retrying changes nothing.
+            return await self._send_email(to_email, subject, html_content)
+
+        for attempt in range(1, EMAIL_SEND_ATTEMPTS + 1):
+            await self._send_limiter.acquire()
+            started = time.monotonic()
+            try:
+                sent = await self._send_email(to_email, subject, html_content)
+            finally:
+                await self._send_limiter.release(time.monotonic() - started)
+            if sent:
+                return True
+            if attempt < EMAIL_SEND_ATTEMPTS:
+                await asyncio.sleep(EMAIL_RETRY_BASE_SECONDS * 2 ** (attempt - 1))
+        logger.error(
+            "Giving up on email to %s after %d attempts", to_email, EMAIL_SEND_ATTEMPTS
+        )
+        return False
 
     async def _send_email(
         self,
@@ -151,8 +639,8 @@ class EmailService:
     ) -> bool:
         """Send email using available backend."""
 
-        # Try SendGrid first (preferred for production)
-        if self.sendgrid_enabled:
+        # Try SendGrid first (preferred for production), unless it keeps failing
+        if self.sendgrid_enabled and self._sendgrid_circuit.allow():
             result = await self._send_via_sendgrid(to_email, subject, html_content)
             if result:
                 return True
@@ -161,6 +649,9 @@ class EmailService:
 
         # Try SMTP (Gmail or generic)
         if self.smtp_enabled:
+            if not self._smtp_circuit.allow():
+                logger.warning("SMTP circuit open; not sending to %s", to_email)
+                return False
             if self.is_gmail:
                 return await self._send_via_gmail(to_email, subject, html_content)
             else:
@@ -168,10 +659,12 @@ class EmailService:
 
         # No email backend configured - log for development
         logger.warning(
-            f"[DEV MODE] Email would be sent to {to_email}\n"
-            f"Subject: {subject}\n"
-            f"Configure SMTP_HOST, SMTP_USER, SMTP_PASSWORD or SENDGRID_API_KEY to enable emails.\n"
-            f"For Gmail: SMTP_HOST=smtp.gmail.com, SMTP_PORT=587, SMTP_TLS=true"
+            "[DEV MODE] Email would be sent to %s\n"
+            "Subject: %s\n"
+            "Configure SMTP_HOST, SMTP_USER, SMTP_PASSWORD or SENDGRID_API_KEY to enable emails.\n"
+            "For Gmail: SMTP_HOST=smtp.gmail.com, SMTP_PORT=587, SMTP_TLS=true",
+            to_email,
+            subject,
         )
         return False
 
@@ -182,33 +675,60 @@ class EmailService:
         html_content: str,
     ) -> bool:
         """Send email via SendGrid API."""
-        api_key = settings.sendgrid_api_key
-        url = "https://api.sendgrid.com/v3/mail/send"
-
         payload = {
             "personalizations": [{"to": [{"email": to_email}]}],
-            "from": {"email": self.from_email, "name": self.from_name},
+            "from": self._sendgrid_from,
             "subject": subject,
             "content": [{"type": "text/html", "value": html_content}],
         }
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.post(
-                    url,
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json=payload,
-                )
-                resp.raise_for_status()
-                logger.info(f"✅ Email sent to {to_email} via SendGrid")
-                return True
+            resp = await get_http_client().post(
+                SENDGRID_URL,
+                timeout=10.0,
+                headers=self._sendgrid_headers,
+                content=orjson.dumps(payload),
+            )
+            self._observe_sendgrid_limits(resp)
+            resp.raise_for_status()
+            self._sendgrid_circuit.success()
+            logger.info("✅ Email sent to %s via SendGrid", to_email)
+            return True
         except Exception as e:
-            logger.error(f"❌ SendGrid error: {e}")
+            if _is_message_rejection(e):
+                # SendGrid is up; it just refused this request.
+                self._sendgrid_circuit.success()
+            else:
+                self._sendgrid_circuit.failure()
+            logger.error("❌ SendGrid error: %s", e)
             return False
 
+    def _observe_sendgrid_limits(self, resp: httpx.Response) -> None:
+        """Back off on 429/5xx and pause when the rate limit runs low."""
+        if resp.status_code == 429 or resp.status_code >= 500:
+            retry_after = resp.headers.get("Retry-After", "")
+            pause = float(retry_after) if retry_after.isdigit() else 0.0
+            self._send_limiter.throttle(min(pause, SENDGRID_MAX_PAUSE_SECONDS))
+            return
+
+        remaining = resp.headers.get("X-RateLimit-Remaining", "")
+        limit = resp.headers.get("X-RateLimit-Limit", "")
+        if not (remaining.isdigit() and limit.isdigit() and int(limit)):
+            return
+        if int(remaining) < int(limit) * SENDGRID_RATE_LIMIT_FLOOR:
+            reset = resp.headers.get("X-RateLimit-Reset", "")
+            # Reset is a Unix timestamp for when the window refills.
+            pause = float(reset) - time.time() if reset.isdigit() else 1.0
+            self._send_limiter.throttle(
+                min(max(pause, 0.0), SENDGRID_MAX_PAUSE_SECONDS)
+            )
+
+    def _record_smtp_error(self, exc: Exception) -> None:
+        if _is_message_rejection(exc):
+            self._smtp_circuit.success()
+        else:
+            self._smtp_circuit.failure()
+
     async def _send_via_smtp(
         self,
         to_email: str,
@@ -216,56 +736,32 @@ class EmailService:
         html_content: str,
     ) -> bool:
         """Send email via generic SMTP server."""
+        to_email = _normalize_email(to_email)
         try:
-            # Create MIME message
-            message = MIMEMultipart("alternative")
-            message["From"] = f"{self.from_name} <{self.from_email}>"
-            message["To"] = to_email
-            message["Subject"] = subject
-            
-            # Attach HTML content
-            html_part = MIMEText(html_content, "html", "utf-8")
-            message.attach(html_part)
-
-            def send_sync():
-                """Synchronous SMTP send function."""
-                smtp_host = settings.smtp_host
-                smtp_port = settings.smtp_port
-                
-                # Determine connection type based on port
-                if smtp_port == 465:
-                    # SSL connection (implicit TLS)
-                    context = ssl.create_default_context()
-                    with smtplib.SMTP_SSL(smtp_host, smtp_port, context=context) as server:
-                        if settings.smtp_user and settings.smtp_password:
-                            server.login(settings.smtp_user, settings.smtp_password)
-                        server.send_message(message)
-                else:
-                    # Standard connection with optional STARTTLS (port 587)
-                    with smtplib.SMTP(smtp_host, smtp_port, timeout=30) as server:
-                        server.ehlo()
-                        if settings.smtp_tls:
-                            context = ssl.create_default_context()
-                            server.starttls(context=context)
-                            server.ehlo()
-                        if settings.smtp_user and settings.smtp_password:
-                            server.login(settings.smtp_user, settings.smtp_password)
-                        server.send_message(message)
-
-            # Run blocking SMTP call in a separate thread
-            await asyncio.to_thread(send_sync)
-            logger.info(f"✅ Email sent to {to_email} via SMTP ({settings.smtp_host})")
+            message = _build_message_bytes(
+                f"{self.from_name} <{self.from_email}>", to_email, subject, html_content
+            )
+            await self._smtp_pool.send(self.from_email, [to_email], message)
+            self._smtp_circuit.success()
+            logger.info(
+                "✅ Email sent to %s via SMTP (%s)", to_email, self._smtp_host
+            )
             return True
 
-        except smtplib.SMTPAuthenticationError as e:
-            logger.error(f"❌ SMTP Authentication failed: {e}")
+        except aiosmtplib.SMTPAuthenticationError as e:
+            self._record_smtp_error(e)
+            logger.error("❌ SMTP Authentication failed: %s", e)
             logger.error("💡 For Gmail: Make sure you're using an App Password, not your regular password")
             return False
-        except smtplib.SMTPException as e:
-            logger.error(f"❌ SMTP error: {e}")
+        except aiosmtplib.SMTPException as e:
+            self._record_smtp_error(e)
+            if _is_smtp_throttle(e):
+                self._send_limiter.throttle()
+            logger.error("❌ SMTP error: %s", e)
             return False
         except Exception as e:
-            logger.error(f"❌ SMTP unexpected error: {e}")
+            self._record_smtp_error(e)
+            logger.error("❌ SMTP unexpected error: %s", e)
             return False
 
     async def _send_via_gmail(
@@ -282,74 +778,24 @@ class EmailService:
         - App Password (not regular Gmail password)
         - Port 587 with STARTTLS or Port 465 with SSL
         """
+        to_email = _normalize_email(to_email)
         try:
-            # Create MIME message
-            message = MIMEMultipart("alternative")
-            message["From"] = f"{self.from_name} <{self.from_email}>"
-            message["To"] = to_email
-            message["Subject"] = subject
-            
-            # Add plain text fallback
-            plain_text = f"Subject: {subject}\n\nPlease view this email in an HTML-capable email client."
-            plain_part = MIMEText(plain_text, "plain", "utf-8")
-            html_part = MIMEText(html_content, "html", "utf-8")
-            
-            message.attach(plain_part)
-            message.attach(html_part)
-
-            def send_sync():
-                """Synchronous Gmail send function."""
-                smtp_host = settings.smtp_host
-                smtp_port = settings.smtp_port
-                smtp_user = settings.smtp_user
-                smtp_password = settings.smtp_password
-                
-                # Create secure SSL context
-                context = ssl.create_default_context()
-                
-                # Resolve to IPv4 to avoid IPv6 routing issues on Render
-                target_host = smtp_host
-                try:
-                    # Filter for IPv4 (AF_INET)
-                    addr_info = socket.getaddrinfo(smtp_host, smtp_port, socket.AF_INET, socket.SOCK_STREAM)
-                    if addr_info:
-                        target_host = addr_info[0][4][0]
-                        if target_host != smtp_host:
-                            logger.debug(f"Resolved {smtp_host} to {target_host} (IPv4) to avoid routing issues")
-                except Exception as e:
-                    logger.warning(f"DNS resolution warning: {e}")
-
-                if smtp_port == 465:
-                    # Gmail SSL (implicit TLS)
-                    logger.debug(f"Connecting to Gmail via SSL on port {smtp_port}")
-                    # Note: For SSL port 465, we stick to hostname to ensure SSL context works automatically
-                    # If IPv6 issues persist on 465, we might need a more complex fix.
-                    with smtplib.SMTP_SSL(smtp_host, smtp_port, context=context, timeout=30) as server:
-                        server.login(smtp_user, smtp_password)
-                        server.send_message(message)
-                else:
-                    # Gmail STARTTLS (explicit TLS) - Port 587
-                    logger.debug(f"Connecting to Gmail via STARTTLS on port {smtp_port}")
-                    
-                    # Use target_host (IPv4) to bypass potential IPv6 routing issues
-                    with smtplib.SMTP(target_host, smtp_port, timeout=30) as server:
-                        if target_host != smtp_host:
-                            # Hack: Restore original hostname for SSL verification
-                            server._host = smtp_host
-                        
-                        server.ehlo("localhost")
-                        server.starttls(context=context)
-                        server.ehlo("localhost")
-                        server.login(smtp_user, smtp_password)
-                        server.send_message(message)
-
-            # Run blocking SMTP call in a separate thread
-            await asyncio.to_thread(send_sync)
-            logger.info(f"✅ Email sent to {to_email} via Gmail SMTP")
+            # With a plain text fallback part
+            message = _build_message_bytes(
+                f"{self.from_name} <{self.from_email}>",
+                to_email,
+                subject,
+                html_content,
+                plain_fallback=True,
+            )
+            await self._smtp_pool.send(self.from_email, [to_email], message)
+            self._smtp_circuit.success()
+            logger.info("✅ Email sent to %s via Gmail SMTP", to_email)
             return True
 
-        except smtplib.SMTPAuthenticationError as e:
-            logger.error(f"❌ Gmail Authentication failed: {e}")
+        except aiosmtplib.SMTPAuthenticationError as e:
+            self._record_smtp_error(e)
+            logger.error("❌ Gmail Authentication failed: %s", e)
             logger.error(
                 "💡 Gmail requires an App Password:\n"
                 "   1. Enable 2-Step Verification: https://myaccount.google.com/security\n"
@@ -357,19 +803,162 @@ class EmailService:
                 "   3. Use the 16-character app password as SMTP_PASSWORD"
             )
             return False
-        except smtplib.SMTPRecipientsRefused as e:
-            logger.error(f"❌ Gmail rejected recipient {to_email}: {e}")
+        except aiosmtplib.SMTPRecipientsRefused as e:
+            self._record_smtp_error(e)
+            logger.error("❌ Gmail rejected recipient %s: %s", to_email, e)
             return False
-        except smtplib.SMTPSenderRefused as e:
-            logger.error(f"❌ Gmail rejected sender {self.from_email}: {e}")
+        except aiosmtplib.SMTPSenderRefused as e:
+            self._record_smtp_error(e)
+            logger.error("❌ Gmail rejected sender %s: %s", self.from_email, e)
             return False
-        except smtplib.SMTPException as e:
-            logger.error(f"❌ Gmail SMTP error: {e}")
+        except aiosmtplib.SMTPException as e:
+            self._record_smtp_error(e)
+            if _is_smtp_throttle(e):
+                self._send_limiter.throttle()
+            logger.error("❌ Gmail SMTP error: %s", e)
             return False
         except Exception as e:
-            logger.error(f"❌ Gmail unexpected error: {type(e).__name__}: {e}")
+            self._record_smtp_error(e)
+            logger.error("❌ Gmail unexpected error: %s: %s", type(e).__name__, e)
             return False
 
+    async def _connect_smtp(self) -> aiosmtplib.SMTP:
+        """Open and log in to the generic SMTP server."""
+        smtp_host = self._smtp_host
+        smtp_port = self._smtp_port
+        context = self._ssl_context
+
+        # Determine connection type based on port: 465 is SSL (implicit TLS),
+        # anything else is a plain connection with optional STARTTLS (587).
+        implicit_tls = smtp_port == 465
+        server = aiosmtplib.SMTP(
+            hostname=smtp_host,
+            port=smtp_port,
+            use_tls=implicit_tls,
+            start_tls=False,
+            tls_context=context,
+            timeout=30,
+        )
+        await server.connect()
+        try:
+            if not implicit_tls:
+                await server.ehlo()
+                if self._smtp_tls:
+                    await server.starttls(tls_context=context)
+                    await server.ehlo()
+            if self._smtp_user and self._smtp_password:
+                await server.login(self._smtp_user, self._smtp_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    async def _connect_gmail(self) -> aiosmtplib.SMTP:
+        """Open and log in to Gmail SMTP."""
+        smtp_host = self._smtp_host
+        smtp_port = self._smtp_port
+        smtp_user = self._smtp_user
+        smtp_password = self._smtp_password
+
+        context = self._ssl_context
+
+        if smtp_port == 465:
+            # Gmail SSL (implicit TLS)
+            logger.debug("Connecting to Gmail via SSL on port %s", smtp_port)
+            # Note: For SSL port 465, we stick to hostname to ensure SSL context works automatically
+            # If IPv6 issues persist on 465, we might need a more complex fix.
+            server = aiosmtplib.SMTP(
+                hostname=smtp_host,
+                port=smtp_port,
+                use_tls=True,
+                tls_context=context,
+                timeout=30,
+            )
+            await server.connect()
+            try:
+                await server.login(smtp_user, smtp_password)
+            except Exception:
+                server.close()
+                raise
+            return server
+
+        target_host = await self._resolve_smtp_ipv4()
+
+        # Gmail STARTTLS (explicit TLS) - Port 587
+        logger.debug("Connecting to Gmail via STARTTLS on port %s", smtp_port)
+
+        # Use target_host (IPv4) to bypass potential IPv6 routing issues; the
+        # certificate is still verified against the original hostname.
+        server = aiosmtplib.SMTP(
+            hostname=target_host,
+            port=smtp_port,
+            start_tls=False,
+            local_hostname="localhost",
+            timeout=30,
+        )
+        await server.connect()
+        try:
+            await server.ehlo()
+            await server.starttls(server_hostname=smtp_host, tls_context=context)
+            await server.ehlo()
+            await server.login(smtp_user, smtp_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    async def _resolve_smtp_ipv4(self) -> str:
+        """IPv4 address of the SMTP host, cached for SMTP_DNS_TTL_SECONDS.
+
+        Falls back to the hostname if resolution fails.
+        """
+        smtp_host = self._smtp_host
+        now = time.monotonic()
+        if self._smtp_ipv4 is not None and self._smtp_ipv4[1] > now:
+            return self._smtp_ipv4[0]
+
+        # Resolve to IPv4 to avoid IPv6 routing issues on Render
+        try:
+            # Filter for IPv4 (AF_INET)
+            addr_info = await asyncio.get_running_loop().getaddrinfo(
+                smtp_host,
+                self._smtp_port,
+                family=socket.AF_INET,
+                type=socket.SOCK_STREAM,
+            )
+        except Exception as e:
+            logger.warning("DNS resolution warning: %s", e)
+            return smtp_host
+        if not addr_info:
+            return smtp_host
+
+        target_host = addr_info[0][4][0]
+        if target_host != smtp_host:
+            logger.debug(
+                "Resolved %s to %s (IPv4) to avoid routing issues",
+                smtp_host,
+                target_host,
+            )
+        self._smtp_ipv4 = (target_host, now + SMTP_DNS_TTL_SECONDS)
+        return target_host
+
+    async def close(self) -> None:
+        """Drain queued emails, stop the workers and release connections."""
+        if self._workers:
+            assert self._queue is not None
+            try:
+                await asyncio.wait_for(
+                    self._queue.join(), timeout=EMAIL_DRAIN_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Dropping %d queued emails at shutdown", self._queue.qsize()
+                )
+            for worker in self._workers:
+                worker.cancel()
+            self._workers = []
+        await self._smtp_pool.close()
+
 
 # Global email service instance
 email_service = EmailService()
@@ -6,7 +6,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.flow import Flow
 from app.models.lead import Lead
-from app.crud.flow import get_flow
+from app.crud.flow import compile_flow, get_compiled_flow
+from app.crud.lead import patch_flow_context
+from app.services.compiled_flow import CompiledFlow
 
 
 async def process_flow(
@@ -19,15 +21,13 @@ async def process_flow(
     if not lead.current_flow_id or not lead.current_step_id:
         return None
 
-    flow = await get_flow(session, lead.current_flow_id)
+    flow = await get_compiled_flow(session, lead.current_flow_id)
     if not flow or not flow.is_active:
         # Flow deleted or inactive, clear state
         await clear_flow_state(session, lead)
         return None
 
-    nodes = flow.flow_data.get("nodes", [])
-    node_map = {n["id"]: n for n in nodes}
-    current_node = node_map.get(lead.current_step_id)
+    current_node = flow.nodes.get(lead.current_step_id)
 
     if not current_node:
         await clear_flow_state(session, lead)
@@ -35,15 +35,14 @@ async def process_flow(
 
     # We are at a "Question" node waiting for input
     # 1. Save the answer
-    variable_name = current_node.get("variable")
+    variable_name = current_node.variable
     if variable_name:
-        context = dict(lead.flow_context)  # Copy
-        context[variable_name] = user_message
-        lead.flow_context = context
-        session.add(lead)
+        await patch_flow_context(
+            session=session, lead=lead, path=[variable_name], value=user_message
+        )
 
     # 2. Move to next node
-    next_node_id = current_node.get("next")
+    next_node_id = current_node.next
     return await execute_flow_steps(session, lead, flow, next_node_id)
 
 
@@ -56,17 +55,16 @@ async def start_flow(session: AsyncSession, lead: Lead, flow: Flow) -> str | Non
     lead.flow_context = {}
     session.add(lead)
 
-    # Find start node (first node or id='start')
-    nodes = flow.flow_data.get("nodes", [])
-    if not nodes:
+    # Start node is id='start' or else the first node
+    compiled = compile_flow(flow)
+    if compiled.start_id is None:
         return None
 
-    start_node = next((n for n in nodes if n.get("id") == "start"), nodes[0])
-    return await execute_flow_steps(session, lead, flow, start_node["id"])
+    return await execute_flow_steps(session, lead, compiled, compiled.start_id)
 
 
 async def execute_flow_steps(
-    session: AsyncSession, lead: Lead, flow: Flow, start_node_id: str | None
+    session: AsyncSession, lead: Lead, flow: CompiledFlow, start_node_id: str | None
 ) -> str | None:
     """
     Executes nodes starting from start_node_id until a Question node or End.
@@ -76,19 +74,16 @@ async def execute_flow_steps(
         await clear_flow_state(session, lead)
         return None
 
-    nodes = flow.flow_data.get("nodes", [])
-    node_map = {n["id"]: n for n in nodes}
-
     current_id = start_node_id
     responses = []
 
     while current_id:
-        node = node_map.get(current_id)
+        node = flow.nodes.get(current_id)
         if not node:
             break
 
         # Format text with context variables
-        text_template = node.get("content", "")
+        text_template = node.content
         try:
             text = text_template.format(**lead.flow_context)
         except KeyError:
@@ -96,7 +91,7 @@ async def execute_flow_steps(
 
         responses.append(text)
 
-        if node.get("type") == "question":
+        if node.type == "question":
             # Stop here, wait for user input
             lead.current_step_id = current_id
             session.add(lead)
@@ -104,7 +99,7 @@ async def execute_flow_steps(
             return "\n\n".join(responses)
 
         # Move to next
-        current_id = node.get("next")
+        current_id = node.next
 
     # End of flow
     await clear_flow_state(session, lead)
@@ -0,0 +1,39 @@
+"""
+Shared HTTP client for outbound platform calls (Meta Graph API, Telegram,
+SendGrid, tenant webhooks).
+One pool per worker process keeps TLS sessions to those hosts warm instead
+of paying a handshake per message. The LLM API has its own client
+(``llm_client``) with LLM-specific timeouts and retries.
+"""
+
+from __future__ import annotations
+
+import httpx
+
+# Callers pass their own per-request timeout; this is only the fallback.
+DEFAULT_TIMEOUT = httpx.Timeout(20.0, connect=5.0)
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide outbound client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=1000,
+                max_keepalive_connections=100,
+            ),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
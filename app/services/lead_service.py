@@ -1,26 +1,26 @@
 from __future__ import annotations
 
-import json
 import re
 
-import httpx
+import orjson
 
 from app.crud.lead import create_lead, get_lead_by_phone
-from app.crud.tenant import get_tenant_by_id
+from app.crud.tenant import get_cached_tenant_by_id
 from app.core.config import settings
 from app.db.session import async_session_maker
+from app.services.http_client import get_http_client
+from app.services.llm_client import llm_headers, post_llm
 
 _EMAIL_RE = re.compile(r"\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b", re.IGNORECASE)
 _PHONE_RE = re.compile(
     r"\b(?:\+?\d{1,3}[\s.-]?)?(?:\(?\d{2,4}\)?[\s.-]?)?\d{3,4}[\s.-]?\d{4}\b"
 )
 
-_NAME_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"\bmy\s+name\s+is\s+([a-z][a-z\s\-']{1,60})\b", re.IGNORECASE),
-    re.compile(r"\bi\s+am\s+([a-z][a-z\s\-']{1,60})\b", re.IGNORECASE),
-    re.compile(r"\bi'm\s+([a-z][a-z\s\-']{1,60})\b", re.IGNORECASE),
-    re.compile(r"\bthis\s+is\s+([a-z][a-z\s\-']{1,60})\b", re.IGNORECASE),
-]
+# One alternation, so the message is scanned once rather than per phrasing.
+_NAME_RE = re.compile(
+    r"\b(?:my\s+name\s+is|i\s+am|i'm|this\s+is)\s+([a-z][a-z\s\-']{1,60})\b",
+    re.IGNORECASE,
+)
 
 
 def extract_lead_info(message: str) -> dict[str, str] | None:
@@ -37,14 +37,9 @@ def extract_lead_info(message: str) -> dict[str, str] | None:
     phone_number = phone_match.group(0).strip()
 
     customer_name: str | None = None
-    for pattern in _NAME_PATTERNS:
-        m = pattern.search(message)
-        if not m:
-            continue
-        candidate = " ".join(m.group(1).strip().split())
-        if candidate:
-            customer_name = candidate.title()
-            break
+    m = _NAME_RE.search(message)
+    if m:
+        customer_name = " ".join(m.group(1).split()).title()
 
     return {"phone_number": phone_number, "customer_name": customer_name or ""}
 
@@ -75,17 +70,19 @@ async def extract_lead_info_llm(message: str) -> dict[str, str] | None:
         ],
         "temperature": 0.0,
     }
-    headers = {"Authorization": f"Bearer {llm_key}"}
+    headers = llm_headers(llm_key)
 
     try:
-        async with httpx.AsyncClient(
-            base_url=settings.llm_base_url, timeout=10.0
-        ) as client:
-            resp = await client.post("/chat/completions", json=payload, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await post_llm(
+            "/chat/completions",
+            content=orjson.dumps(payload),
+            headers=headers,
+            timeout=10.0,
+        )
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
         content = data["choices"][0]["message"]["content"]
-        parsed = json.loads(content)
+        parsed = orjson.loads(content)
         phone = str(parsed.get("phone_number", "") or "").strip()
         name = str(parsed.get("customer_name", "") or "").strip()
         if not phone:
@@ -133,10 +130,11 @@ async def trigger_external_webhook(
         return
 
     try:
-        async with httpx.AsyncClient(
-            timeout=settings.webhook_timeout_seconds
-        ) as client:
-            await client.post(tenant_webhook_url, json=lead_data)
+        await get_http_client().post(
+            tenant_webhook_url,
+            json=lead_data,
+            timeout=settings.webhook_timeout_seconds,
+        )
     except Exception:
         # Swallow errors to keep background task from crashing app.
         return
@@ -184,7 +182,7 @@ async def detect_and_save_lead(
 
     # Fire webhook if configured.
     async with async_session_maker() as session:
-        tenant = await get_tenant_by_id(session=session, tenant_id=tenant_id)
+        tenant = await get_cached_tenant_by_id(session=session, tenant_id=tenant_id)
         webhook_url = tenant.webhook_url if tenant else None
 
     await trigger_external_webhook(
@@ -0,0 +1,82 @@
+"""
+In-process cache of AI replies.
+Bot traffic repeats itself (greetings, FAQs); an identical prompt within the
+TTL is answered from memory instead of another LLM round trip.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import json
+from collections.abc import Awaitable, Callable
+
+from cachetools import TTLCache
+
+from app.core.config import settings
+
+
+class LLMCache:
+    """Replies keyed by a digest of (model, system prompt, user message, temperature).
+
+    All operations are synchronous dict work, so no lock is needed on the
+    event loop. A ``ttl`` of 0 disables caching (single-flight still applies).
+    """
+
+    __slots__ = ("_entries", "_inflight", "hits", "misses")
+
+    def __init__(self, *, maxsize: int = 10_000, ttl: float = 3600) -> None:
+        self._entries: TTLCache[bytes, str] | None = (
+            TTLCache(maxsize=maxsize, ttl=ttl) if ttl > 0 else None
+        )
+        self._inflight: dict[bytes, asyncio.Future[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(
+        *, model: str, system_prompt: str, user_message: str, temperature: float
+    ) -> bytes:
+        raw = json.dumps(
+            [model, system_prompt, user_message, temperature], ensure_ascii=False
+        )
+        return hashlib.sha256(raw.encode("utf-8")).digest()
+
+    def get(self, key: bytes) -> str | None:
+        if self._entries is None:
+            return None
+        text = self._entries.get(key)
+        if text is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return text
+
+    def set(self, key: bytes, text: str) -> None:
+        if self._entries is not None:
+            self._entries[key] = text
+
+    async def single_flight(
+        self, key: bytes, fetch: Callable[[], Awaitable[str]]
+    ) -> str:
+        """Run ``fetch`` once per key at a time; concurrent callers await it.
+
+        The fetch runs in a task owned by the cache, so a caller that gives up
+        (client disconnect) cancels only its own wait, never the shared call.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._finish, key))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: bytes, task: asyncio.Future[str]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved: don't warn when every caller left
+
+
+llm_cache = LLMCache(ttl=settings.llm_cache_ttl_seconds)
@@ -0,0 +1,114 @@
+"""
+Shared HTTP client for the OpenAI-compatible LLM API.
+One connection pool per worker process, so chat turns reuse keep-alive
+connections instead of paying a TCP + TLS handshake every time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Fail fast on connect/pool waits; completions themselves may take a while.
+LLM_TIMEOUT = httpx.Timeout(30.0, connect=3.0, write=5.0, pool=1.0)
+
+# Transient upstream failures worth another attempt (rate limit, overload).
+RETRY_STATUSES = frozenset({429, 503})
+MAX_ATTEMPTS = 3
+_BACKOFF_INITIAL_SECONDS = 0.5
+_BACKOFF_MAX_SECONDS = 4.0
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_llm_client() -> httpx.AsyncClient:
+    """Return the process-wide LLM client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        # HTTP/2 multiplexes concurrent turns over one connection per host
+        # (httpx falls back to HTTP/1.1 if the server does not offer h2).
+        _client = httpx.AsyncClient(
+            base_url=settings.llm_base_url,
+            http2=True,
+            timeout=LLM_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=1000,
+                max_keepalive_connections=200,
+                keepalive_expiry=60,
+            ),
+        )
+    return _client
+
+
+@lru_cache(maxsize=4)
+def llm_headers(llm_key: str) -> Mapping[str, str]:
+    """Read-only JSON request headers for ``llm_key``, built once per key.
+
+    Content-Type stays explicit: bodies are pre-encoded with orjson and sent
+    as ``content=``, so httpx cannot infer it.
+    """
+    return MappingProxyType(
+        {"Authorization": f"Bearer {llm_key}", "Content-Type": "application/json"}
+    )
+
+
+def _retry_delay(attempt: int, resp: httpx.Response | None) -> float:
+    """Seconds to wait before retry ``attempt`` (1-based), honouring Retry-After."""
+    if resp is not None:
+        retry_after = resp.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), _BACKOFF_MAX_SECONDS)
+    backoff = min(_BACKOFF_INITIAL_SECONDS * 2 ** (attempt - 1), _BACKOFF_MAX_SECONDS)
+    return random.uniform(backoff / 2, backoff)  # jitter
+
+
+async def post_llm(
+    path: str, *, max_attempts: int = MAX_ATTEMPTS, **kwargs
+) -> httpx.Response:
+    """POST to the LLM API, retrying 429/503 and connect/pool timeouts.
+
+    Read timeouts are not retried: the upstream already spent the full
+    budget on that request. The last response (or timeout) is returned
+    (or raised) as-is.
+    """
+    client = get_llm_client()
+    attempt = 1
+    while True:
+        try:
+            resp = await client.post(path, **kwargs)
+        except (httpx.ConnectTimeout, httpx.PoolTimeout):
+            if attempt >= max_attempts:
+                raise
+            resp = None
+        else:
+            if resp.status_code not in RETRY_STATUSES or attempt >= max_attempts:
+                return resp
+
+        delay = _retry_delay(attempt, resp)
+        logger.warning(
+            "LLM %s failed (%s); retry %d in %.1fs",
+            path,
+            resp.status_code if resp is not None else "timeout",
+            attempt,
+            delay,
+        )
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def close_llm_client() -> None:
+    """Close the shared client (app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
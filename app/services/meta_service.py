@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-import httpx
+from app.services.http_client import get_http_client
 
 
 async def send_whatsapp_text(
@@ -19,11 +19,10 @@ async def send_whatsapp_text(
         "text": {"body": text},
     }
 
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        resp = await client.post(
-            url, params={"access_token": access_token}, json=payload
-        )
-        resp.raise_for_status()
+    resp = await get_http_client().post(
+        url, params={"access_token": access_token}, json=payload, timeout=20.0
+    )
+    resp.raise_for_status()
 
 
 async def send_whatsapp_interactive(
@@ -102,11 +101,10 @@ async def send_whatsapp_interactive(
             },
         }
 
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        resp = await client.post(
-            url, params={"access_token": access_token}, json=payload
-        )
-        resp.raise_for_status()
+    resp = await get_http_client().post(
+        url, params={"access_token": access_token}, json=payload, timeout=20.0
+    )
+    resp.raise_for_status()
 
 
 async def send_whatsapp_reply(
@@ -187,11 +185,10 @@ async def send_page_message_text(
             for q in items[:10]
         ]
 
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        resp = await client.post(
-            url, params={"access_token": page_access_token}, json=payload
-        )
-        resp.raise_for_status()
+    resp = await get_http_client().post(
+        url, params={"access_token": page_access_token}, json=payload, timeout=20.0
+    )
+    resp.raise_for_status()
 
 
 # ============ INSTAGRAM MESSAGING ============
@@ -231,11 +228,10 @@ async def send_instagram_message(
             for q in items[:13]  # Instagram supports up to 13 quick replies
         ]
 
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        resp = await client.post(
-            url, params={"access_token": access_token}, json=payload
-        )
-        resp.raise_for_status()
+    resp = await get_http_client().post(
+        url, params={"access_token": access_token}, json=payload, timeout=20.0
+    )
+    resp.raise_for_status()
 
 
 async def send_instagram_reply(
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-import httpx
+from app.services.http_client import get_http_client
 
 
 async def send_telegram_message(
@@ -29,6 +29,5 @@ async def send_telegram_message(
                 "selective": False,
             }
 
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        resp = await client.post(url, json=payload)
-        resp.raise_for_status()
+    resp = await get_http_client().post(url, json=payload, timeout=15.0)
+    resp.raise_for_status()
@@ -0,0 +1,81 @@
+"""
+Scripted-response trigger matching.
+All plain keywords of a tenant are compiled into one Aho-Corasick automaton, so
+a message is scanned once regardless of how many triggers the tenant has.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Iterable
+
+import ahocorasick
+
+logger = logging.getLogger(__name__)
+
+# Triggers prefixed with this are treated as case-insensitive regexes.
+REGEX_PREFIX = "re:"
+
+
+class TriggerMatcher:
+    """Compiled triggers of one tenant, in rule priority order.
+
+    ``rules`` are ``(trigger_keyword, response_text)`` pairs; the first rule
+    (lowest position) that matches wins, as with the former linear scan.
+    """
+
+    __slots__ = ("_automaton", "_regexes", "_responses")
+
+    def __init__(self, rules: Iterable[tuple[str, str]]) -> None:
+        self._responses: list[str] = []
+        self._regexes: list[tuple[int, re.Pattern[str]]] = []
+        automaton = ahocorasick.Automaton()
+
+        for trigger, response_text in rules:
+            trigger = (trigger or "").strip()
+            if not trigger:
+                continue
+            position = len(self._responses)
+            self._responses.append(response_text)
+            keyword = trigger.lower()
+
+            if keyword.startswith(REGEX_PREFIX):
+                pattern = trigger[len(REGEX_PREFIX) :].strip()
+                if not pattern:
+                    continue
+                try:
+                    self._regexes.append((position, re.compile(pattern, re.IGNORECASE)))
+                except re.error:
+                    logger.warning("Skipping invalid trigger regex %r", pattern)
+                continue
+
+            # Keep the earliest rule for duplicate keywords.
+            if keyword not in automaton:
+                automaton.add_word(keyword, position)
+
+        if len(automaton):
+            automaton.make_automaton()
+            self._automaton: ahocorasick.Automaton | None = automaton
+        else:
+            self._automaton = None
+
+    def match(self, message: str) -> str | None:
+        """Return the response of the highest-priority matching rule."""
+        best: int | None = None
+        if self._automaton is not None:
+            for _end, position in self._automaton.iter(message.lower()):
+                if best is None or position < best:
+                    best = position
+                    if best == 0:
+                        break
+
+        # Regex rules only need checking if they outrank the keyword hit.
+        for position, regex in self._regexes:
+            if best is not None and position > best:
+                break
+            if regex.search(message):
+                best = position
+                break
+
+        return self._responses[best] if best is not None else None
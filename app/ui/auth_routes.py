@@ -5,6 +5,8 @@ Handles web-based authentication flows (registration, login, password reset).
 
 from __future__ import annotations
 
+import logging
+
 from fastapi import APIRouter, Depends, Form, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
@@ -30,6 +32,8 @@ from app.services.auth_service import (
 from app.crud.user import update_last_login
 from app.services.email_service import email_service
 
+logger = logging.getLogger(__name__)
+
 # Templates
 jinja_templates = Jinja2Templates(directory="app/templates")
 
@@ -91,20 +95,16 @@ async def register_submit(
             token = await generate_verification_token(session, existing_user)
             verification_url = f"{request.base_url}ui/auth/verify-email?token={token}"
 
-            try:
-                sent = await email_service.send_verification_email(
-                    to_email=existing_user.email,
-                    verification_url=verification_url,
-                    user_name=existing_user.full_name,
-                )
-                if sent:
-                    print(f"✅ Verification email resent to {email}")
-                else:
-                    print(f"⚠️  Email service returned False for {email}")
-                    print(f"[DEV] Verification link: {verification_url}")
-            except Exception as e:
-                print(f"⚠️  Failed to resend verification email: {e}")
-                print(f"[DEV] Verification link: {verification_url}")
+            queued = email_service.queue_verification_email(
+                to_email=existing_user.email,
+                verification_url=verification_url,
+                user_name=existing_user.full_name,
+            )
+            if queued:
+                logger.info("Verification email queued for %s", email)
+            else:
+                logger.warning("Could not queue verification email for %s", email)
+                logger.debug("Verification link for %s: %s", email, verification_url)
 
             return jinja_templates.TemplateResponse(
                 "auth/register.html",
@@ -283,16 +283,15 @@ async def forgot_password_submit(
 
         # Send email with reset link
         reset_url = f"{request.base_url}ui/auth/reset-password?token={token}"
-        try:
-            await email_service.send_password_reset_email(
-                to_email=user.email,
-                reset_url=reset_url,
-                user_name=user.full_name,
-            )
-            print(f"✅ Password reset email sent to {email}")
-        except Exception as e:
-            print(f"⚠️  Failed to send email: {e}")
-            print(f"[DEV] Password reset token for {email}: {token}")
+        if email_service.queue_password_reset_email(
+            to_email=user.email,
+            reset_url=reset_url,
+            user_name=user.full_name,
+        ):
+            logger.info("Password reset email queued for %s", email)
+        else:
+            logger.warning("Could not queue password reset email for %s", email)
+            logger.debug("Password reset link for %s: %s", email, reset_url)
 
     # Always show success (don't reveal if email exists)
     return jinja_templates.TemplateResponse(
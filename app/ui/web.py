@@ -6,7 +6,6 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional, Any
 
-import httpx
 from fastapi import (
     APIRouter,
     Depends,
@@ -23,7 +22,7 @@ from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.security.utils import get_authorization_scheme_param
 from sqlalchemy.ext.asyncio import AsyncSession
-from jose import jwt, JWTError
+import jwt
 
 from app.api.deps import get_db_session
 from app.core.config import admin_auth_enabled, settings
@@ -43,6 +42,7 @@ def safe_form_get(form_data: dict[str, Any], key: str, default: str = "") -> str
 from app.crud.tenant import (
     create_tenant,
     delete_tenant,
+    get_cached_tenant_by_api_key,
     get_tenant_by_id,
     get_tenant_by_api_key,
     list_tenants,
@@ -87,8 +87,6 @@ from app.crud.knowledge_base import (
 from app.crud.broadcast import (
     create_broadcast,
     list_broadcasts,
-    get_broadcast,
-    update_broadcast_stats,
 )
 from app.crud.flow import (
     create_flow,
@@ -97,7 +95,6 @@ from app.crud.flow import (
     update_flow,
     delete_flow,
 )
-from app.models.broadcast import BroadcastStatus
 from app.models.chat_log import SenderType
 from app.services.telegram_service import send_telegram_message
 from app.services.meta_service import send_whatsapp_reply, send_page_message_text
@@ -113,6 +110,7 @@ from app.crud.message_template import (
     seed_default_templates,
 )
 from app.services.broadcast_service import execute_broadcast
+from app.services.llm_client import get_llm_client
 
 # Templates directory (app/templates)
 TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
@@ -195,7 +193,7 @@ async def check_auth(
             status_code=status.HTTP_307_TEMPORARY_REDIRECT,
             headers={"Location": "/ui/login"},
         )
-    except JWTError:
+    except jwt.PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_307_TEMPORARY_REDIRECT,
             headers={"Location": "/ui/login"},
@@ -215,14 +213,11 @@ async def _get_ai_models() -> list[str]:
         return []
 
     try:
-        async with httpx.AsyncClient(
-            base_url=settings.llm_base_url, timeout=10.0
-        ) as client:
-            resp = await client.get(
-                "/models", headers={"Authorization": f"Bearer {llm_key}"}
-            )
-            resp.raise_for_status()
-            data = resp.json() or {}
+        resp = await get_llm_client().get(
+            "/models", headers={"Authorization": f"Bearer {llm_key}"}, timeout=10.0
+        )
+        resp.raise_for_status()
+        data = resp.json() or {}
         models = [
             str(m.get("id")) for m in (data.get("data") or []) if m and m.get("id")
         ]
@@ -798,6 +793,7 @@ async def leads_page(
 async def leads_rows(
     request: Request,
     tenant_api_key: str = "",
+    search: str = "",
     session: AsyncSession = Depends(get_db_session),
 ) -> HTMLResponse:
     if not tenant_api_key:
@@ -805,13 +801,15 @@ async def leads_rows(
             "_lead_rows.html",
             {"request": request, "leads": [], "error": "اختر مشروعاً أولاً"},
         )
-    tenant = await get_tenant_by_api_key(session=session, api_key=tenant_api_key)
+    tenant = await get_cached_tenant_by_api_key(session=session, api_key=tenant_api_key)
     if not tenant:
         return jinja_templates.TemplateResponse(
             "_lead_rows.html",
             {"request": request, "leads": [], "error": "مفتاح API غير صالح"},
         )
-    leads = await list_leads(session=session, tenant_id=tenant.id)
+    leads = await list_leads(
+        session=session, tenant_id=tenant.id, search=search.strip() or None
+    )
     return jinja_templates.TemplateResponse(
         "_lead_rows.html", {"request": request, "leads": leads, "tenant": tenant}
     )
@@ -840,7 +838,7 @@ async def chatlogs_rows(
             "_chatlog_rows.html",
             {"request": request, "logs": [], "error": "اختر مشروعاً أولاً"},
         )
-    tenant = await get_tenant_by_api_key(session=session, api_key=tenant_api_key)
+    tenant = await get_cached_tenant_by_api_key(session=session, api_key=tenant_api_key)
     if not tenant:
         return jinja_templates.TemplateResponse(
             "_chatlog_rows.html",
@@ -1016,7 +1014,7 @@ async def send_test_message(
             '<div class="text-red-400 text-sm">الرجاء اختيار مشروع وكتابة رسالة</div>'
         )
 
-    tenant = await get_tenant_by_api_key(session=session, api_key=tenant_api_key)
+    tenant = await get_cached_tenant_by_api_key(session=session, api_key=tenant_api_key)
     if not tenant:
         return HTMLResponse(
             '<div class="text-red-400 text-sm">مفتاح API غير صالح</div>'
@@ -1064,7 +1062,7 @@ async def generate_widget_code(
     if not tenant_api_key:
         return HTMLResponse('<div class="text-red-400">اختر مشروعاً أولاً</div>')
 
-    tenant = await get_tenant_by_api_key(session=session, api_key=tenant_api_key)
+    tenant = await get_cached_tenant_by_api_key(session=session, api_key=tenant_api_key)
     if not tenant:
         return HTMLResponse('<div class="text-red-400">مفتاح API غير صالح</div>')
 
@@ -1090,7 +1088,7 @@ async def widget_embed(
     session: AsyncSession = Depends(get_db_session),
 ) -> HTMLResponse:
     """Embeddable chat widget for external websites"""
-    tenant = await get_tenant_by_api_key(session=session, api_key=api_key)
+    tenant = await get_cached_tenant_by_api_key(session=session, api_key=api_key)
     if not tenant:
         return HTMLResponse('<div style="color:red;">Invalid API Key</div>')
 
@@ -1118,7 +1116,7 @@ async def widget_chat(
     message = safe_form_get(form, "message", "").strip()
     session_id = safe_form_get(form, "session_id", "").strip()
 
-    tenant = await get_tenant_by_api_key(session=session, api_key=api_key)
+    tenant = await get_cached_tenant_by_api_key(session=session, api_key=api_key)
     if not tenant:
         return HTMLResponse('<div class="widget-error">Invalid configuration</div>')
 
@@ -1263,7 +1261,7 @@ async def inbox_conversations(
     tenant_api_key: str,
     session: AsyncSession = Depends(get_db_session),
 ):
-    tenant = await get_tenant_by_api_key(session=session, api_key=tenant_api_key)
+    tenant = await get_cached_tenant_by_api_key(session=session, api_key=tenant_api_key)
     if not tenant:
         return HTMLResponse("Tenant not found", status_code=404)
 
@@ -1282,11 +1280,13 @@ async def inbox_messages(
     session: AsyncSession = Depends(get_db_session),
 ):
     # Verify tenant access
-    tenant = await get_tenant_by_api_key(session=session, api_key=tenant_api_key)
+    tenant = await get_cached_tenant_by_api_key(session=session, api_key=tenant_api_key)
     if not tenant:
         return HTMLResponse("Tenant not found", status_code=404)
 
-    messages = await get_chat_history_for_lead(session=session, lead_id=lead_id)
+    messages = await get_chat_history_for_lead(
+        session=session, tenant_id=tenant.id, lead_id=lead_id
+    )
     return jinja_templates.TemplateResponse(
         "_inbox_messages.html",
         {"request": request, "messages": messages},
@@ -1302,7 +1302,7 @@ async def inbox_send(
     background_tasks: BackgroundTasks = BackgroundTasks(),
     session: AsyncSession = Depends(get_db_session),
 ):
-    tenant = await get_tenant_by_api_key(session=session, api_key=tenant_api_key)
+    tenant = await get_cached_tenant_by_api_key(session=session, api_key=tenant_api_key)
     if not tenant:
         return HTMLResponse("Tenant not found", status_code=404)
 
@@ -1313,6 +1313,7 @@ async def inbox_send(
     # 1. Save to DB
     chat_log = await create_chat_log(
         session=session,
+        tenant_id=tenant.id,
         lead_id=lead_id,
         message=message,
         sender_type=SenderType.bot,
@@ -1490,83 +1491,6 @@ async def broadcasts_create(
     )
 
 
-async def _execute_broadcast_task(broadcast_id: int, tenant_id: int):
-    """Background task to send broadcast messages"""
-    from app.db.session import async_session_maker
-
-    async with async_session_maker() as session:
-        broadcast = await get_broadcast(session, broadcast_id)
-        if not broadcast:
-            return
-
-        # Update status to sending
-        await update_broadcast_stats(
-            session, broadcast_id, status=BroadcastStatus.sending
-        )
-
-        # Fetch leads and integrations
-        leads = await list_leads(
-            session=session, tenant_id=tenant_id, limit=1000
-        )  # Limit for safety
-        integrations = await list_integrations_for_tenant(
-            session=session, tenant_id=tenant_id
-        )
-
-        telegram_integ = next(
-            (i for i in integrations if i.channel_type == "telegram"), None
-        )
-        whatsapp_integ = next(
-            (i for i in integrations if i.channel_type == "whatsapp"), None
-        )
-
-        sent_count = 0
-        failed_count = 0
-
-        for lead in leads:
-            phone = lead.phone_number or ""
-            if not phone:
-                continue
-
-            try:
-                # Telegram Logic
-                if (
-                    (broadcast.target_channel in ["all", "telegram"])
-                    and telegram_integ
-                    and phone.isdigit()
-                    and len(phone) < 16
-                ):
-                    await send_telegram_message(
-                        bot_token=telegram_integ.access_token,
-                        chat_id=int(phone),
-                        text=broadcast.message,
-                    )
-                    sent_count += 1
-
-                # WhatsApp Logic
-                elif (
-                    broadcast.target_channel in ["all", "whatsapp"]
-                ) and whatsapp_integ:
-                    await send_whatsapp_reply(
-                        access_token=whatsapp_integ.access_token,
-                        phone_number_id=whatsapp_integ.external_id,
-                        to=phone,
-                        text=broadcast.message,
-                    )
-                    sent_count += 1
-
-            except Exception:
-                failed_count += 1
-
-        # Update final stats
-        await update_broadcast_stats(
-            session,
-            broadcast_id,
-            sent=sent_count,
-            failed=failed_count,
-            status=BroadcastStatus.completed,
-        )
-
-
 @protected_router.post("/broadcasts/send", response_class=HTMLResponse)
 async def broadcasts_send(
     request: Request,
@@ -1578,7 +1502,6 @@ async def broadcasts_send(
     tenant_id = int(safe_form_get(form, "tenant_id", "0"))
 
     if broadcast_id and tenant_id:
-        # Use the new broadcast service
         background_tasks.add_task(execute_broadcast, session, broadcast_id)
 
     # Return list immediately (status will update on refresh)
@@ -0,0 +1,36 @@
+"""add sender_type to chat_logs (lead_id, timestamp) index
+
+Revision ID: 0007
+Revises: 0006_users_auth
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0007"
+down_revision = "0006_users_auth"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Lets per-lead / date-range message counts split by sender run as
+    # index-only scans.
+    op.drop_index("ix_chat_logs_lead_ts", table_name="chat_logs")
+    op.create_index(
+        "ix_chat_logs_lead_ts",
+        "chat_logs",
+        ["lead_id", "timestamp", "sender_type"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chat_logs_lead_ts", table_name="chat_logs")
+    op.create_index(
+        "ix_chat_logs_lead_ts", "chat_logs", ["lead_id", "timestamp"], unique=False
+    )
@@ -0,0 +1,48 @@
+"""denormalize tenant_id onto chat_logs
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("chat_logs", sa.Column("tenant_id", sa.BigInteger(), nullable=True))
+    op.execute("""
+        UPDATE chat_logs AS c
+        SET tenant_id = l.tenant_id
+        FROM leads AS l
+        WHERE l.id = c.lead_id
+        """)
+    op.alter_column("chat_logs", "tenant_id", nullable=False)
+    op.create_foreign_key(
+        "chat_logs_tenant_id_fkey",
+        "chat_logs",
+        "tenants",
+        ["tenant_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    op.create_index(
+        "ix_chat_logs_tenant_ts",
+        "chat_logs",
+        ["tenant_id", "timestamp", "sender_type"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chat_logs_tenant_ts", table_name="chat_logs")
+    op.drop_constraint("chat_logs_tenant_id_fkey", "chat_logs", type_="foreignkey")
+    op.drop_column("chat_logs", "tenant_id")
@@ -0,0 +1,43 @@
+"""add jsonb_path_ops GIN indexes on JSONB columns
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+_INDEXES = (
+    ("ix_leads_flow_context_gin", "leads", "flow_context"),
+    ("ix_tenants_branding_config_gin", "tenants", "branding_config"),
+    ("ix_flows_flow_data_gin", "flows", "flow_data"),
+)
+
+
+def upgrade() -> None:
+    # jsonb_path_ops only supports containment (@>) but is much smaller and
+    # faster than the default jsonb_ops for it.
+    for name, table, column in _INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "jsonb_path_ops"},
+        )
+
+
+def downgrade() -> None:
+    for name, table, _column in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,58 @@
+"""add full-text search column and GIN indexes to knowledge_base
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # knowledge_base is created by the app's create_all on startup; when it
+    # doesn't exist yet it will be created with the column and indexes.
+    if not sa.inspect(op.get_bind()).has_table("knowledge_base"):
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    op.add_column(
+        "knowledge_base",
+        sa.Column(
+            "search_tsv",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(content, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_kb_tsv", "knowledge_base", ["search_tsv"], postgresql_using="gin"
+    )
+    op.create_index(
+        "ix_kb_tenant_tsv",
+        "knowledge_base",
+        ["tenant_id", "search_tsv"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("knowledge_base"):
+        return
+
+    op.drop_index("ix_kb_tenant_tsv", table_name="knowledge_base")
+    op.drop_index("ix_kb_tsv", table_name="knowledge_base")
+    op.drop_column("knowledge_base", "search_tsv")
@@ -0,0 +1,39 @@
+"""make chat_logs (lead_id, timestamp) index descending and covering
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_chat_logs_lead_ts", table_name="chat_logs")
+    op.create_index(
+        "ix_chat_logs_lead_ts",
+        "chat_logs",
+        ["lead_id", sa.text("timestamp DESC")],
+        unique=False,
+        postgresql_include=["sender_type"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chat_logs_lead_ts", table_name="chat_logs")
+    op.create_index(
+        "ix_chat_logs_lead_ts",
+        "chat_logs",
+        ["lead_id", "timestamp", "sender_type"],
+        unique=False,
+    )
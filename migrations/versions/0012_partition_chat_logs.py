@@ -0,0 +1,136 @@
+"""partition chat_logs by month on timestamp
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+# How many months past the current one get a partition up front; the app
+# keeps creating future partitions at runtime (app/db/partitions.py).
+MONTHS_AHEAD = 2
+
+_INDEXES = (
+    "ix_chat_logs_lead_id",
+    "ix_chat_logs_lead_ts",
+    "ix_chat_logs_tenant_ts",
+)
+
+
+def _add_months(day: dt.date, months: int) -> dt.date:
+    year, month = divmod(day.month - 1 + months, 12)
+    return dt.date(day.year + year, month + 1, 1)
+
+
+def _create_indexes() -> None:
+    op.create_index("ix_chat_logs_lead_id", "chat_logs", ["lead_id"], unique=False)
+    op.create_index(
+        "ix_chat_logs_lead_ts",
+        "chat_logs",
+        ["lead_id", sa.text("timestamp DESC")],
+        unique=False,
+        postgresql_include=["sender_type"],
+    )
+    op.create_index(
+        "ix_chat_logs_tenant_ts",
+        "chat_logs",
+        ["tenant_id", "timestamp", "sender_type"],
+        unique=False,
+    )
+
+
+def _move_to_legacy() -> None:
+    # Free the index/constraint names and keep the id sequence alive.
+    for name in _INDEXES:
+        op.drop_index(name, table_name="chat_logs")
+    op.execute("ALTER TABLE chat_logs RENAME TO chat_logs_legacy")
+    op.execute(
+        "ALTER TABLE chat_logs_legacy "
+        "RENAME CONSTRAINT chat_logs_pkey TO chat_logs_legacy_pkey"
+    )
+    op.execute("ALTER SEQUENCE chat_logs_id_seq OWNED BY NONE")
+
+
+def upgrade() -> None:
+    _move_to_legacy()
+
+    op.execute("""
+        CREATE TABLE chat_logs (
+            id BIGINT NOT NULL DEFAULT nextval('chat_logs_id_seq'),
+            tenant_id BIGINT NOT NULL
+                REFERENCES tenants (id) ON DELETE CASCADE,
+            lead_id BIGINT NOT NULL
+                REFERENCES leads (id) ON DELETE CASCADE,
+            message TEXT NOT NULL,
+            sender_type sender_type NOT NULL,
+            timestamp TIMESTAMPTZ NOT NULL DEFAULT now(),
+            CONSTRAINT chat_logs_pkey PRIMARY KEY (id, timestamp)
+        ) PARTITION BY RANGE (timestamp)
+        """)
+    op.execute("ALTER SEQUENCE chat_logs_id_seq OWNED BY chat_logs.id")
+    op.execute("CREATE TABLE chat_logs_default PARTITION OF chat_logs DEFAULT")
+
+    # Monthly partitions from the oldest existing message through a couple of
+    # months ahead, so the copy below lands in real partitions.
+    bind = op.get_bind()
+    oldest = bind.execute(
+        sa.text("SELECT min(timestamp AT TIME ZONE 'UTC') FROM chat_logs_legacy")
+    ).scalar()
+    this_month = dt.datetime.now(dt.timezone.utc).date().replace(day=1)
+    month = (oldest.date() if oldest else this_month).replace(day=1)
+    last = _add_months(this_month, MONTHS_AHEAD)
+    while month <= last:
+        end = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE chat_logs_{month:%Y_%m} PARTITION OF chat_logs "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+            f"TO ('{end.isoformat()} 00:00:00+00')"
+        )
+        month = end
+
+    op.execute("""
+        INSERT INTO chat_logs (id, tenant_id, lead_id, message, sender_type, timestamp)
+        SELECT id, tenant_id, lead_id, message, sender_type, timestamp
+        FROM chat_logs_legacy
+        """)
+    op.execute("DROP TABLE chat_logs_legacy")
+    _create_indexes()
+
+
+def downgrade() -> None:
+    _move_to_legacy()
+
+    op.execute("""
+        CREATE TABLE chat_logs (
+            id BIGINT NOT NULL DEFAULT nextval('chat_logs_id_seq'),
+            tenant_id BIGINT NOT NULL
+                REFERENCES tenants (id) ON DELETE CASCADE,
+            lead_id BIGINT NOT NULL
+                REFERENCES leads (id) ON DELETE CASCADE,
+            message TEXT NOT NULL,
+            sender_type sender_type NOT NULL,
+            timestamp TIMESTAMPTZ NOT NULL DEFAULT now(),
+            CONSTRAINT chat_logs_pkey PRIMARY KEY (id)
+        )
+        """)
+    op.execute("ALTER SEQUENCE chat_logs_id_seq OWNED BY chat_logs.id")
+    op.execute("""
+        INSERT INTO chat_logs (id, tenant_id, lead_id, message, sender_type, timestamp)
+        SELECT id, tenant_id, lead_id, message, sender_type, timestamp
+        FROM chat_logs_legacy
+        """)
+    # Dropping the partitioned parent drops all of its partitions.
+    op.execute("DROP TABLE chat_logs_legacy")
+    _create_indexes()
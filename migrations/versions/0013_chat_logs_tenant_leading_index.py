@@ -0,0 +1,40 @@
+"""lead the chat_logs conversation index with tenant_id
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0013"
+down_revision = "0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_chat_logs_lead_ts", table_name="chat_logs")
+    op.create_index(
+        "ix_chat_logs_tenant_lead_ts",
+        "chat_logs",
+        ["tenant_id", "lead_id", sa.text("timestamp DESC")],
+        unique=False,
+        postgresql_include=["sender_type"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chat_logs_tenant_lead_ts", table_name="chat_logs")
+    op.create_index(
+        "ix_chat_logs_lead_ts",
+        "chat_logs",
+        ["lead_id", sa.text("timestamp DESC")],
+        unique=False,
+        postgresql_include=["sender_type"],
+    )
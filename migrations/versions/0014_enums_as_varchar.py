@@ -0,0 +1,90 @@
+"""store enum columns as varchar + CHECK instead of native pg enums
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0014"
+down_revision = "0013"
+branch_labels = None
+depends_on = None
+
+
+# (table, column, pg type / constraint name, allowed values, server default)
+_ENUM_COLUMNS = (
+    ("chat_logs", "sender_type", "sender_type", ("user", "bot"), None),
+    (
+        "broadcasts",
+        "status",
+        "broadcast_status",
+        ("draft", "sending", "completed", "failed"),
+        None,
+    ),
+    (
+        "message_templates",
+        "category",
+        "template_category",
+        (
+            "welcome",
+            "farewell",
+            "complaint",
+            "inquiry",
+            "promotion",
+            "support",
+            "payment",
+            "shipping",
+            "general",
+        ),
+        "general",
+    ),
+)
+
+
+def _check_sql(column: str, values: tuple[str, ...]) -> str:
+    return f"{column} IN ({', '.join(repr(v) for v in values)})"
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table, column, type_name, values, default in _ENUM_COLUMNS:
+        if not inspector.has_table(table):
+            continue
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE varchar(16) USING {column}::text"
+        )
+        if default is not None:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'"
+            )
+        op.execute(f"DROP TYPE IF EXISTS {type_name}")
+        op.create_check_constraint(type_name, table, _check_sql(column, values))
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table, column, type_name, values, default in _ENUM_COLUMNS:
+        if not inspector.has_table(table):
+            continue
+        op.drop_constraint(type_name, table, type_="check")
+        sa.Enum(*values, name=type_name).create(op.get_bind(), checkfirst=True)
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {type_name} USING {column}::{type_name}"
+        )
+        if default is not None:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"SET DEFAULT '{default}'::{type_name}"
+            )
@@ -0,0 +1,31 @@
+"""leave room for HOT updates of the broadcast counters
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0015"
+down_revision = "0014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # broadcasts may only exist via create_all on older deployments.
+    if not sa.inspect(op.get_bind()).has_table("broadcasts"):
+        return
+    op.execute("ALTER TABLE broadcasts SET (fillfactor = 70)")
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("broadcasts"):
+        return
+    op.execute("ALTER TABLE broadcasts RESET (fillfactor)")
@@ -0,0 +1,71 @@
+"""tenant_stats materialized view for the dashboard counters
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0016"
+down_revision = "0015"
+branch_labels = None
+depends_on = None
+
+
+TENANT_STATS_VIEW_SQL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS tenant_stats AS
+WITH bounds AS (
+    SELECT
+        date_trunc('day', now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC' AS today,
+        now() - interval '7 days' AS week_ago
+)
+SELECT
+    t.id AS tenant_id,
+    coalesce(l.leads_total, 0) AS leads_total,
+    coalesce(l.leads_today, 0) AS leads_today,
+    coalesce(l.leads_7d, 0) AS leads_7d,
+    coalesce(m.messages_total, 0) AS messages_total,
+    coalesce(m.user_messages, 0) AS user_messages,
+    coalesce(m.bot_messages, 0) AS bot_messages,
+    coalesce(m.messages_today, 0) AS messages_today,
+    coalesce(m.messages_7d, 0) AS messages_7d,
+    now() AS refreshed_at
+FROM tenants t
+LEFT JOIN (
+    SELECT
+        tenant_id,
+        count(*) AS leads_total,
+        count(*) FILTER (WHERE created_at >= bounds.today) AS leads_today,
+        count(*) FILTER (WHERE created_at >= bounds.week_ago) AS leads_7d
+    FROM leads, bounds
+    GROUP BY tenant_id
+) l ON l.tenant_id = t.id
+LEFT JOIN (
+    SELECT
+        tenant_id,
+        count(*) AS messages_total,
+        count(*) FILTER (WHERE sender_type = 'user') AS user_messages,
+        count(*) FILTER (WHERE sender_type = 'bot') AS bot_messages,
+        count(*) FILTER (WHERE timestamp >= bounds.today) AS messages_today,
+        count(*) FILTER (WHERE timestamp >= bounds.week_ago) AS messages_7d
+    FROM chat_logs, bounds
+    GROUP BY tenant_id
+) m ON m.tenant_id = t.id
+"""
+
+
+def upgrade() -> None:
+    op.execute(TENANT_STATS_VIEW_SQL)
+    # REFRESH MATERIALIZED VIEW CONCURRENTLY requires a unique index.
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_tenant_stats_tenant "
+        "ON tenant_stats (tenant_id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS tenant_stats")
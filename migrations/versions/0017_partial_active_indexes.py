@@ -0,0 +1,81 @@
+"""index only active rows for webhook tokens, quick replies and scripted responses
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0017"
+down_revision = "0016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index(
+        "ix_channel_integrations_verify_token", table_name="channel_integrations"
+    )
+    op.create_index(
+        "ix_channel_integrations_verify_token_active",
+        "channel_integrations",
+        ["verify_token"],
+        unique=False,
+        postgresql_where=sa.text("is_active"),
+    )
+
+    op.drop_index("ix_quick_replies_tenant_active", table_name="quick_replies")
+    op.create_index(
+        "ix_quick_replies_tenant_order_active",
+        "quick_replies",
+        ["tenant_id", "sort_order", "id"],
+        unique=False,
+        postgresql_where=sa.text("is_active"),
+    )
+
+    op.drop_index(
+        "ix_scripted_responses_tenant_active", table_name="scripted_responses"
+    )
+    op.create_index(
+        "ix_scripted_responses_tenant_id_active",
+        "scripted_responses",
+        ["tenant_id", "id"],
+        unique=False,
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_scripted_responses_tenant_id_active", table_name="scripted_responses"
+    )
+    op.create_index(
+        "ix_scripted_responses_tenant_active",
+        "scripted_responses",
+        ["tenant_id", "is_active"],
+        unique=False,
+    )
+
+    op.drop_index("ix_quick_replies_tenant_order_active", table_name="quick_replies")
+    op.create_index(
+        "ix_quick_replies_tenant_active",
+        "quick_replies",
+        ["tenant_id", "is_active"],
+        unique=False,
+    )
+
+    op.drop_index(
+        "ix_channel_integrations_verify_token_active",
+        table_name="channel_integrations",
+    )
+    op.create_index(
+        "ix_channel_integrations_verify_token",
+        "channel_integrations",
+        ["verify_token"],
+        unique=False,
+    )
@@ -0,0 +1,40 @@
+"""trigram GIN indexes for lead name / phone search
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0018"
+down_revision = "0017"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    op.create_index(
+        "ix_leads_tenant_name_trgm",
+        "leads",
+        ["tenant_id", "customer_name"],
+        postgresql_using="gin",
+        postgresql_ops={"customer_name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_leads_tenant_phone_trgm",
+        "leads",
+        ["tenant_id", "phone_number"],
+        postgresql_using="gin",
+        postgresql_ops={"phone_number": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_leads_tenant_phone_trgm", table_name="leads")
+    op.drop_index("ix_leads_tenant_name_trgm", table_name="leads")
@@ -0,0 +1,39 @@
+"""compress the wide leads columns with lz4
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0019"
+down_revision = "0018"
+branch_labels = None
+depends_on = None
+
+
+def _set_compression(method: str) -> None:
+    # SET COMPRESSION needs Postgres 14+ (and lz4 support compiled in); keep
+    # the default codec on servers without it. Only newly written values are
+    # affected, existing rows keep their current compression.
+    op.execute(
+        "DO $$ BEGIN "
+        "EXECUTE 'ALTER TABLE leads "
+        f"ALTER COLUMN summary SET COMPRESSION {method}, "
+        f"ALTER COLUMN flow_context SET COMPRESSION {method}'; "
+        "EXCEPTION WHEN feature_not_supported OR syntax_error THEN "
+        "RAISE NOTICE 'column compression unavailable, keeping default'; "
+        "END $$"
+    )
+
+
+def upgrade() -> None:
+    _set_compression("lz4")
+
+
+def downgrade() -> None:
+    _set_compression("pglz")
@@ -0,0 +1,23 @@
+"""Precompile the email templates so workers skip Jinja parsing at startup.
+
+Run from the repo root (the Dockerfile does this at build time):
+
+    python scripts/compile_email_templates.py
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.email_service import (  # noqa: E402
+    COMPILED_TEMPLATES_DIR,
+    compile_email_templates,
+)
+
+
+if __name__ == "__main__":
+    compile_email_templates(COMPILED_TEMPLATES_DIR)
+    print(f"Compiled email templates to {COMPILED_TEMPLATES_DIR}")